@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Precompiled Asset Bundle
+디코딩된 템플릿(BGR, 그레이스케일)과 메타데이터를 하나의 바이너리 파일로 묶고
+mmap으로 복사 없이 읽는 모듈 (여러 프로세스가 같은 페이지를 공유)
+
+파일 형식:
+    [헤더 32 bytes] magic(8) | version(u32) | reserved(u32) | index offset(u64) | index length(u64)
+    [이미지 데이터] ASSET_BUNDLE_ALIGNMENT 단위로 정렬된 uint8 배열들
+    [인덱스] UTF-8 JSON {"templates": {경로: 메타데이터}}
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import cv2
+import numpy as np
+
+from .asset_manifest import AssetManifest
+from .color_prefilter import ColorPrefilter
+from .constants import ASSET_BUNDLE_ALIGNMENT, IMAGE_CONFIDENCE_THRESHOLD
+
+BUNDLE_MAGIC = b'MABUNDLE'
+BUNDLE_VERSION = 1
+_HEADER = struct.Struct('<8sIIQQ')
+
+
+def _path_key(path: str) -> str:
+    return os.path.normpath(path).replace('\\', '/')
+
+
+def build_bundle(
+    template_paths: Iterable[str],
+    output_path: str,
+    manifest: Optional[AssetManifest] = None,
+    alignment: int = ASSET_BUNDLE_ALIGNMENT
+) -> List[str]:
+    """
+    템플릿들을 디코딩해 번들 파일 생성
+
+    Args:
+        template_paths: 템플릿 이미지 경로들
+        output_path: 번들 파일 경로
+        manifest: 기본 임계값/영역을 가져올 에셋 매니페스트 (선택)
+        alignment: 이미지 데이터 정렬 단위 (bytes)
+
+    Returns:
+        번들에 포함된 경로 리스트
+    """
+    prefilter = ColorPrefilter()
+    index: Dict[str, Dict[str, Any]] = {}
+    directory = os.path.dirname(output_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * _HEADER.size)
+
+        def write_array(array: np.ndarray) -> int:
+            padding = (-f.tell()) % alignment
+            f.write(b'\0' * padding)
+            offset = f.tell()
+            f.write(np.ascontiguousarray(array).tobytes())
+            return offset
+
+        for path in template_paths:
+            bgr = cv2.imread(path)
+            if bgr is None:
+                continue
+            gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+            height, width = bgr.shape[:2]
+            stat = os.stat(path)
+
+            dominant = prefilter.dominant_hue(bgr)
+            spec = manifest.for_template(path) if manifest is not None else None
+
+            index[_path_key(path)] = {
+                'size': [width, height],
+                'bgr': write_array(bgr),
+                'gray': write_array(gray),
+                'dominant_hue': list(dominant[0]) if dominant else None,
+                'dominant_ratio': round(dominant[1], 4) if dominant else 0.0,
+                'confidence': spec.confidence if spec else IMAGE_CONFIDENCE_THRESHOLD,
+                'region': list(spec.region) if spec and spec.region else None,
+                'source_mtime': stat.st_mtime,
+                'source_size': stat.st_size
+            }
+
+        index_bytes = json.dumps({'templates': index}, ensure_ascii=False).encode('utf-8')
+        index_offset = f.tell()
+        f.write(index_bytes)
+
+        f.seek(0)
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, index_offset, len(index_bytes)))
+
+    os.replace(tmp_path, output_path)
+    return sorted(index)
+
+
+class AssetBundle:
+    """mmap으로 연 템플릿 번들 (읽기 전용, 배열은 파일 페이지를 직접 가리킴)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 번들 파일 경로
+
+        Raises:
+            ValueError: 번들 형식이 아니거나 버전이 다를 때
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, _, index_offset, index_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"Not a version {BUNDLE_VERSION} asset bundle: {path}")
+
+        index = json.loads(self._mmap[index_offset:index_offset + index_length].decode('utf-8'))
+        self.entries: Dict[str, Dict[str, Any]] = index['templates']
+        # 원본 PNG 변경 여부는 열 때 한 번만 확인 (탐지마다 stat 호출 안 함)
+        self.stale: Set[str] = {key for key, entry in self.entries.items() if self._source_changed(key, entry)}
+
+    @staticmethod
+    def _source_changed(key: str, entry: Dict[str, Any]) -> bool:
+        """원본 PNG가 번들 생성 후 바뀌었는지 (원본이 없으면 번들 사용)"""
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False
+        return stat.st_size != entry['source_size'] or abs(stat.st_mtime - entry['source_mtime']) > 1e-3
+
+    def __contains__(self, template_path: str) -> bool:
+        return _path_key(template_path) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def paths(self) -> List[str]:
+        """번들에 포함된 템플릿 경로"""
+        return sorted(self.entries)
+
+    def metadata(self, template_path: str) -> Optional[Dict[str, Any]]:
+        """템플릿 메타데이터 (size, dominant_hue, confidence, region 등)"""
+        return self.entries.get(_path_key(template_path))
+
+    def is_stale(self, template_path: str) -> bool:
+        """
+        번들에 없거나 번들을 연 시점에 원본 PNG가 바뀌어 있었는지
+        (실행 중에 PNG를 바꾸면 ImageDetector.configure_bundle()로 다시 열어야 반영)
+        """
+        key = _path_key(template_path)
+        return key not in self.entries or key in self.stale
+
+    def get(self, template_path: str, gray: bool = False) -> Optional[np.ndarray]:
+        """
+        템플릿 배열 (복사 없는 읽기 전용 뷰)
+
+        Args:
+            template_path: 템플릿 경로
+            gray: True면 그레이스케일, False면 BGR
+
+        Returns:
+            numpy 배열, 번들에 없으면 None
+        """
+        entry = self.metadata(template_path)
+        if entry is None:
+            return None
+        width, height = entry['size']
+        channels = 1 if gray else 3
+        array = np.frombuffer(
+            self._mmap, dtype=np.uint8, count=width * height * channels,
+            offset=entry['gray' if gray else 'bgr']
+        )
+        return array.reshape((height, width) if gray else (height, width, 3))
+
+    def close(self) -> None:
+        """번들 닫기 (이후 get()으로 받은 배열은 사용 불가)"""
+        try:
+            self._mmap.close()
+        except (BufferError, ValueError):
+            # 아직 참조 중인 배열이 있으면 프로세스 종료 시 해제
+            pass
+        self._file.close()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Asset Manifest
+UI 요소별 탐지 방식(템플릿 / HSV 색 덩어리)을 선언하는 매니페스트 모듈
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import (
+    IMAGE_CONFIDENCE_THRESHOLD,
+    COLOR_BLOB_SCALE_TOLERANCE,
+    COLOR_BLOB_MIN_FILL
+)
+from .exceptions import ConfigurationError
+
+
+@dataclass
+class AssetSpec:
+    """
+    UI 요소 탐지 선언 (매니페스트의 "elements" 항목)
+
+    Example (assets/manifest.json):
+        "game_start_yellow": {
+            "detector": "color_blob",
+            "template": "assets/images/UI/game_start_yellow.png",
+            "hsv_lower": [20, 120, 150],
+            "hsv_upper": [35, 255, 255],
+            "size": [180, 60]
+        }
+    """
+    name: str
+    detector: str = 'template'  # template, sparse, color_blob
+    template: Optional[str] = None  # 템플릿 경로 (color_blob은 find_image_in_area 연결용, 선택)
+    confidence: float = IMAGE_CONFIDENCE_THRESHOLD
+    hsv_lower: Optional[Tuple[int, int, int]] = None  # OpenCV HSV (H 0~179), H가 upper보다 크면 0/180 경계 넘음
+    hsv_upper: Optional[Tuple[int, int, int]] = None
+    size: Optional[Tuple[int, int]] = None  # 기준 크기 (width, height), None이면 템플릿 크기
+    scale_tolerance: float = COLOR_BLOB_SCALE_TOLERANCE  # 크기 허용 오차 비율
+    min_fill: float = COLOR_BLOB_MIN_FILL  # 박스 중 색 픽셀 최소 비율
+    region: Optional[Tuple[int, int, int, int]] = None  # 기본 검색 영역 (Detection Area 기준 x1, y1, x2, y2)
+
+    DETECTORS = ('template', 'sparse', 'color_blob')
+
+    def __post_init__(self):
+        """초기화 후 검증"""
+        for attr in ('hsv_lower', 'hsv_upper', 'size', 'region'):
+            value = getattr(self, attr)
+            if value is not None:
+                setattr(self, attr, tuple(int(v) for v in value))
+        self.validate()
+
+    def validate(self) -> None:
+        """요소 선언 검증"""
+        key = f"elements.{self.name}"
+
+        if self.detector not in self.DETECTORS:
+            raise ConfigurationError(f"{key}.detector", f"Must be one of {', '.join(self.DETECTORS)}")
+
+        if self.detector in ('template', 'sparse') and not self.template:
+            raise ConfigurationError(f"{key}.template", "Required for template detectors")
+
+        if self.detector == 'color_blob':
+            if self.hsv_lower is None or self.hsv_upper is None:
+                raise ConfigurationError(f"{key}.hsv_lower", "hsv_lower and hsv_upper are required for color_blob")
+            if len(self.hsv_lower) != 3 or len(self.hsv_upper) != 3:
+                raise ConfigurationError(f"{key}.hsv_lower", "Must be [h, s, v]")
+            if self.size is None and not self.template:
+                raise ConfigurationError(f"{key}.size", "Required when no template is given")
+
+        if self.size is not None and (len(self.size) != 2 or min(self.size) <= 0):
+            raise ConfigurationError(f"{key}.size", "Must be [width, height] with positive values")
+
+        if self.region is not None:
+            if len(self.region) != 4 or self.region[2] <= self.region[0] or self.region[3] <= self.region[1]:
+                raise ConfigurationError(f"{key}.region", "Must be [x1, y1, x2, y2] with x1 < x2 and y1 < y2")
+
+        if not 0.0 <= self.scale_tolerance < 1.0:
+            raise ConfigurationError(f"{key}.scale_tolerance", "Must be between 0.0 and 1.0")
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'AssetSpec':
+        """딕셔너리에서 생성"""
+        return cls(
+            name=name,
+            detector=data.get("detector", cls.detector),
+            template=data.get("template"),
+            confidence=data.get("confidence", cls.confidence),
+            hsv_lower=data.get("hsv_lower"),
+            hsv_upper=data.get("hsv_upper"),
+            size=data.get("size"),
+            scale_tolerance=data.get("scale_tolerance", cls.scale_tolerance),
+            min_fill=data.get("min_fill", cls.min_fill),
+            region=data.get("region")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (기본값과 같은 항목 생략)"""
+        data: Dict[str, Any] = {"detector": self.detector}
+        if self.template:
+            data["template"] = self.template
+        if self.confidence != IMAGE_CONFIDENCE_THRESHOLD:
+            data["confidence"] = self.confidence
+        for attr in ('hsv_lower', 'hsv_upper', 'size', 'region'):
+            value = getattr(self, attr)
+            if value is not None:
+                data[attr] = list(value)
+        if self.detector == 'color_blob':
+            data["scale_tolerance"] = self.scale_tolerance
+            data["min_fill"] = self.min_fill
+        return data
+
+
+class AssetManifest:
+    """요소 이름 / 템플릿 경로 -> AssetSpec 매니페스트"""
+
+    def __init__(self, specs: Optional[List[AssetSpec]] = None):
+        self.specs: Dict[str, AssetSpec] = {}
+        self._by_template: Dict[str, AssetSpec] = {}
+        for spec in specs or []:
+            self.add(spec)
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        return os.path.normpath(path).replace('\\', '/')
+
+    def add(self, spec: AssetSpec) -> None:
+        """요소 추가 (같은 이름은 교체)"""
+        self.specs[spec.name] = spec
+        if spec.template:
+            self._by_template[self._path_key(spec.template)] = spec
+
+    def get(self, name: str) -> Optional[AssetSpec]:
+        """이름으로 요소 찾기"""
+        return self.specs.get(name)
+
+    def for_template(self, template_path: str) -> Optional[AssetSpec]:
+        """템플릿 경로로 요소 찾기 (find_image_in_area 연결용)"""
+        return self._by_template.get(self._path_key(template_path))
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    @classmethod
+    def load(cls, path: str) -> 'AssetManifest':
+        """매니페스트 파일 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls([AssetSpec.from_dict(name, d) for name, d in data.get("elements", {}).items()])
+
+    def save(self, path: str) -> None:
+        """매니페스트 파일 저장"""
+        data = {"elements": {name: spec.to_dict() for name, spec in self.specs.items()}}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio Story Runtime
+스토리를 코루틴으로 실행하는 asyncio 런타임 모듈
+
+스토리는 프레임, 탐지, 입력 완료를 await하고, OpenCV/OCR처럼 CPU를 쓰는 작업은 스레드 풀에서
+실행됩니다 (cv2와 Tesseract 호출은 GIL을 풀기 때문에 이벤트 루프가 막히지 않음).
+모니터 창, 상태 출력, 규칙 엔진, 여러 스토리가 하나의 이벤트 루프를 공유하며 바쁜 대기가 없습니다.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .conditions import Condition, Frame, PollPolicy, WaitResult
+from .image_detector import ImageDetector
+from .constants import RETRY_WAIT_TIMEOUT
+
+Region = Tuple[int, int, int, int]
+
+
+class AsyncRuntime:
+    """
+    스토리 코루틴 런타임
+
+    - offload(): CPU 작업을 작업 스레드 풀에서 실행
+    - gui(): OpenCV 창 작업을 전용 스레드 하나에서 실행 (imshow/waitKey는 같은 스레드여야 함)
+    - input(): 마우스/키보드 입력을 직렬화 (입력 후 대기는 락 밖에서 asyncio.sleep)
+    - wait_until(): StoryBase.wait_until과 같은 조건 대기 (폴링 사이에 이벤트 루프 양보)
+    """
+
+    def __init__(self, workers: Optional[int] = None, detection_process: Optional[Any] = None):
+        """
+        Args:
+            workers: CPU 작업 스레드 수 (None이면 ThreadPoolExecutor 기본값)
+            detection_process: DetectionProcess (주어지면 탐지는 워커 프로세스에서 실행)
+        """
+        self.detection_process = detection_process
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="runtime-worker")
+        self.gui_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="runtime-gui")
+        self._input_lock: Optional[asyncio.Lock] = None
+
+        # 지표 (이벤트 루프 스레드에서만 갱신)
+        self.offload_count = 0
+        self.offload_seconds = 0.0
+        self.input_count = 0
+        self.poll_count = 0
+
+    @property
+    def input_lock(self) -> asyncio.Lock:
+        """입력 직렬화 락 (실행 중인 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._input_lock is None:
+            self._input_lock = asyncio.Lock()
+        return self._input_lock
+
+    async def offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        함수를 작업 스레드에서 실행하고 결과를 await
+
+        Args:
+            func: 실행할 함수 (matchTemplate, OCR 등)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.offload_count += 1
+            self.offload_seconds += time.perf_counter() - started
+
+    async def gui(self, func: Callable[..., Any], *args: Any) -> Any:
+        """OpenCV 창 작업을 GUI 전용 스레드에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self.gui_executor, func, *args)
+
+    async def frame(self, area: Optional[Region] = None) -> np.ndarray:
+        """화면 프레임 (공유 캡처 생산자가 있으면 같은 프레임 사용)"""
+        return await self.offload(ImageDetector.capture_screen, area)
+
+    async def detect(self, condition: Condition, area: Optional[Region] = None) -> Any:
+        """
+        조건을 새 프레임에서 한 번 평가
+
+        Returns:
+            조건 값 (만족하지 않으면 None/False)
+        """
+        value, _ = await self._detect(condition, area)
+        return value
+
+    async def _detect(self, condition: Condition, area: Optional[Region] = None) -> Tuple[Any, Optional[str]]:
+        """detect()와 같지만 (값, 만족한 조건 이름) 반환 (워커 프로세스에서 평가한 AnyOf의 하위 조건 이름 포함)"""
+        if self.detection_process is not None:
+            return await self.offload(self.detection_process.evaluate_fired, condition, area)
+
+        def evaluate():
+            return condition.evaluate(Frame(area)), condition.fired()
+
+        return await self.offload(evaluate)
+
+    async def input(self, func: Callable[..., Any], *args: Any, delay: float = 0) -> Any:
+        """
+        입력 실행 (다른 스토리의 입력과 겹치지 않음)
+
+        Args:
+            func: 입력 함수 (automation.click, 단계 act 등)
+            *args: 함수 인자
+            delay: 입력 후 대기 시간 (초, 락을 놓은 뒤 대기)
+
+        Returns:
+            함수 반환값
+        """
+        async with self.input_lock:
+            result = await self.offload(func, *args)
+            self.input_count += 1
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return result
+
+    async def wait_until(
+        self,
+        predicate: Condition,
+        timeout: float = RETRY_WAIT_TIMEOUT,
+        poll_policy: Optional[PollPolicy] = None,
+        area: Optional[Region] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> WaitResult:
+        """
+        조건이 만족될 때까지 대기 (StoryBase.wait_until의 코루틴 버전)
+
+        Args:
+            predicate: 대기 조건
+            timeout: 최대 대기 시간 (초)
+            poll_policy: 폴링 간격 정책
+            area: 캡처 영역
+            cancel_event: 설정되면 대기 취소 (StoryBase.cancel_event),
+                          태스크를 cancel()해도 바로 취소됨
+
+        Returns:
+            WaitResult
+        """
+        poll_policy = poll_policy or PollPolicy()
+        predicate.reset()
+
+        started = time.perf_counter()
+        deadline = started + timeout
+        polls = 0
+
+        for delay in poll_policy.delays():
+            polls += 1
+            self.poll_count += 1
+            value, fired = await self._detect(predicate, area)
+            now = time.perf_counter()
+            if value:
+                return WaitResult('fired', fired, value, now - started, polls)
+
+            remaining = deadline - now
+            if remaining <= 0:
+                return WaitResult('timeout', None, None, now - started, polls)
+            if cancel_event is not None and cancel_event.is_set():
+                return WaitResult('cancelled', None, None, now - started, polls)
+            await asyncio.sleep(min(delay, remaining))
+
+    async def every(self, interval: float, func: Callable[[], Any], stop: asyncio.Event, offload: bool = False) -> None:
+        """
+        stop이 설정될 때까지 interval마다 실행 (상태 출력, 규칙 엔진 등)
+
+        Args:
+            interval: 실행 간격 (초)
+            func: 실행할 함수
+            stop: 종료 이벤트
+            offload: True면 작업 스레드에서 실행 (OCR을 쓰는 규칙 엔진 등)
+        """
+        while not stop.is_set():
+            if offload:
+                await self.offload(func)
+            else:
+                func()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_stories(self, stories: Iterable[Any]) -> List[bool]:
+        """
+        스토리 여러 개를 동시에 실행 (입력은 직렬화)
+
+        Returns:
+            스토리별 성공 여부 (순서 유지)
+        """
+        return list(await asyncio.gather(*(story.arun(self) for story in stories)))
+
+    def get_stats(self) -> Dict[str, float]:
+        """런타임 지표 (작업 스레드 호출 수/시간, 입력 수, 폴링 수)"""
+        return {
+            'offloads': self.offload_count,
+            'offload_seconds': round(self.offload_seconds, 3),
+            'inputs': self.input_count,
+            'polls': self.poll_count
+        }
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료"""
+        self.executor.shutdown(wait=False)
+        self.gui_executor.shutdown(wait=False)
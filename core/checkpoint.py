@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Story Checkpoint
+스토리 진행 상황(다음 단계, 탐지한 위치, 선택한 캐릭터 등)을 작은 JSON 파일로 저장해
+크래시/재시작 후 이어서 실행하는 모듈
+"""
+
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from .constants import CHECKPOINT_MAX_AGE
+
+
+class StoryCheckpoint:
+    """
+    스토리 하나의 체크포인트 파일
+
+    파일 형식:
+        {"story": 이름, "step": 다음에 실행할 단계, "completed": [완료한 단계...],
+         "context": {저장한 값...}, "saved_at": 유닉스 시각}
+    """
+
+    def __init__(self, path: str, max_age: float = CHECKPOINT_MAX_AGE):
+        """
+        Args:
+            path: 체크포인트 파일 경로
+            max_age: 이보다 오래된 체크포인트는 무시 (초, 다른 날 실행 등)
+        """
+        self.path = path
+        self.max_age = max_age
+
+    @staticmethod
+    def path_for(directory: str, story_name: str, instance_name: Optional[str] = None) -> str:
+        """
+        스토리(와 인스턴스)별 파일 경로
+
+        Returns:
+            "<directory>/<instance>-<story>.json" (파일 이름에 쓸 수 없는 문자는 '_')
+        """
+        key = f"{instance_name}-{story_name}" if instance_name else story_name
+        return os.path.join(directory, re.sub(r'[^\w.-]+', '_', key).strip('_') + '.json')
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        체크포인트 읽기
+
+        Returns:
+            체크포인트 딕셔너리, 없거나 손상되었거나 max_age보다 오래되면 None
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or not data.get('step'):
+            return None
+        if time.time() - data.get('saved_at', 0) > self.max_age:
+            return None
+        return data
+
+    def save(self, story_name: str, step: str, completed: List[str], context: Dict[str, Any]) -> None:
+        """
+        체크포인트 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            story_name: 스토리 이름
+            step: 다음에 실행할 단계
+            completed: 지금까지 완료한 단계들
+            context: 이어서 실행할 때 필요한 값 (JSON으로 저장 가능한 값)
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        data = {
+            'story': story_name,
+            'step': step,
+            'completed': completed,
+            'context': context,
+            'saved_at': time.time()
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """체크포인트 삭제 (스토리 완료 시)"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
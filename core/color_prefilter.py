@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Color-Presence Prefilter
+템플릿 대표 색이 충분히 없는 영역(또는 프레임 전체)을 매칭 전에 제외하는 모듈
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    COLOR_PREFILTER_HUE_TOLERANCE,
+    COLOR_PREFILTER_MIN_SATURATION,
+    COLOR_PREFILTER_MIN_VALUE,
+    COLOR_PREFILTER_MIN_TEMPLATE_RATIO,
+    COLOR_PREFILTER_MIN_FRACTION,
+    COLOR_PREFILTER_MAX_WINDOWS,
+    COLOR_PREFILTER_HUE_CACHE_SIZE
+)
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+HueRange = Tuple[int, int]  # OpenCV hue (0 ~ 179), lower > upper면 0/180 경계를 넘는 범위
+
+
+def _hue_mask(hsv: np.ndarray, hue_range: HueRange, min_saturation: int, min_value: int) -> np.ndarray:
+    """HSV 이미지에서 색상 범위 마스크 (0/255)"""
+    lower, upper = hue_range
+    if lower <= upper:
+        return cv2.inRange(hsv, (lower, min_saturation, min_value), (upper, 255, 255))
+    # 빨강처럼 0/180 경계를 넘는 범위
+    return cv2.bitwise_or(
+        cv2.inRange(hsv, (lower, min_saturation, min_value), (179, 255, 255)),
+        cv2.inRange(hsv, (0, min_saturation, min_value), (upper, 255, 255))
+    )
+
+
+class ColorPrefilter:
+    """
+    HSV 색 마스크 적분 이미지 기반 매칭 전 필터
+
+    템플릿의 대표 색상(hue)을 구하고, 프레임마다 그 색 마스크의 적분 이미지를 한 번 만들어
+    템플릿 크기 창 안의 색 픽셀 수를 모든 위치에서 O(1)로 계산합니다.
+    색 픽셀이 부족한 위치는 제외하고, 남은 위치를 묶은 창만 매칭에 넘깁니다.
+    """
+
+    def __init__(
+        self,
+        hue_tolerance: int = COLOR_PREFILTER_HUE_TOLERANCE,
+        min_saturation: int = COLOR_PREFILTER_MIN_SATURATION,
+        min_value: int = COLOR_PREFILTER_MIN_VALUE,
+        min_template_ratio: float = COLOR_PREFILTER_MIN_TEMPLATE_RATIO,
+        min_fraction: float = COLOR_PREFILTER_MIN_FRACTION,
+        max_windows: int = COLOR_PREFILTER_MAX_WINDOWS
+    ):
+        """
+        Args:
+            hue_tolerance: 대표 색상 주변 허용 범위 (OpenCV hue 단위)
+            min_saturation: 색 픽셀로 볼 최소 채도
+            min_value: 색 픽셀로 볼 최소 명도
+            min_template_ratio: 템플릿에서 대표 색이 이 비율 미만이면 필터 사용 안 함 (회색 템플릿 등)
+            min_fraction: 창 안의 색 픽셀 수가 템플릿 색 픽셀 수의 이 비율 미만이면 제외
+            max_windows: 남은 창이 이보다 많으면 하나의 합집합 창으로 매칭
+        """
+        self.hue_tolerance = hue_tolerance
+        self.min_saturation = min_saturation
+        self.min_value = min_value
+        self.min_template_ratio = min_template_ratio
+        self.min_fraction = min_fraction
+        self.max_windows = max_windows
+
+        # 프레임별 캐시: (프레임, HSV, {색상 범위: 적분 이미지})
+        self._frame_state: Tuple[Optional[np.ndarray], Optional[np.ndarray], Dict[HueRange, np.ndarray]] = (None, None, {})
+        self._lock = threading.Lock()
+        # 템플릿별 대표 색상 캐시: id(템플릿) -> (템플릿, 결과), 템플릿을 붙잡아 id 재사용 방지
+        self._hue_cache: 'OrderedDict[int, Tuple[np.ndarray, Optional[Tuple[HueRange, float]]]]' = OrderedDict()
+        self.frames_rejected = 0
+        self.searched_pixels = 0
+        self.full_pixels = 0
+
+    def dominant_hue(self, template: np.ndarray) -> Optional[Tuple[HueRange, float]]:
+        """
+        템플릿 대표 색상 범위
+
+        Returns:
+            ((lower, upper), 템플릿 중 해당 색 픽셀 비율), 대표 색이 약하면 None
+        """
+        if template.ndim != 3:
+            return None
+
+        hsv = cv2.cvtColor(template, cv2.COLOR_BGR2HSV)
+        colored = cv2.inRange(hsv, (0, self.min_saturation, self.min_value), (179, 255, 255))
+        if cv2.countNonZero(colored) == 0:
+            return None
+
+        hist = cv2.calcHist([hsv], [0], colored, [180], [0, 180]).ravel()
+        # 경계를 넘는 창 합으로 대표 색상 결정 (노이즈 한 칸 피크 방지)
+        window = 2 * self.hue_tolerance + 1
+        wrapped = np.concatenate([hist[-self.hue_tolerance:], hist, hist[:self.hue_tolerance]])
+        smoothed = np.convolve(wrapped, np.ones(window), mode='valid')
+        peak = int(smoothed.argmax())
+
+        hue_range = ((peak - self.hue_tolerance) % 180, (peak + self.hue_tolerance) % 180)
+        ratio = cv2.countNonZero(_hue_mask(hsv, hue_range, self.min_saturation, self.min_value)) / float(
+            template.shape[0] * template.shape[1])
+        if ratio < self.min_template_ratio:
+            return None
+        return hue_range, ratio
+
+    def cached_dominant_hue(self, template: np.ndarray) -> Optional[Tuple[HueRange, float]]:
+        """
+        템플릿 대표 색상 범위 (템플릿 배열별 캐시)
+
+        ImageDetector.load_template은 경로마다 같은 배열을 돌려주므로 탐지마다
+        HSV 변환과 히스토그램을 다시 계산하지 않습니다.
+        """
+        key = id(template)
+        with self._lock:
+            cached = self._hue_cache.get(key)
+            if cached is not None and cached[0] is template:
+                self._hue_cache.move_to_end(key)
+                return cached[1]
+
+        dominant = self.dominant_hue(template)
+        self.seed_dominant_hue(template, dominant)
+        return dominant
+
+    def seed_dominant_hue(self, template: np.ndarray, dominant: Optional[Tuple[HueRange, float]]) -> None:
+        """
+        템플릿 대표 색상을 캐시에 등록 (에셋 번들에 미리 계산해 둔 값이면 HSV 계산 생략)
+
+        Args:
+            template: 템플릿 배열 (ImageDetector.load_template이 돌려주는 배열)
+            dominant: dominant_hue()와 같은 형식의 결과
+        """
+        with self._lock:
+            self._hue_cache[id(template)] = (template, dominant)
+            self._hue_cache.move_to_end(id(template))
+            while len(self._hue_cache) > COLOR_PREFILTER_HUE_CACHE_SIZE:
+                self._hue_cache.popitem(last=False)
+
+    def _integral(self, frame: np.ndarray, hue_range: HueRange) -> np.ndarray:
+        """프레임의 색 마스크 적분 이미지 (프레임/색상 범위당 한 번 계산)"""
+        with self._lock:
+            cached_frame, hsv, integrals = self._frame_state
+            if cached_frame is not frame:
+                hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+                integrals = {}
+                self._frame_state = (frame, hsv, integrals)
+
+            integral = integrals.get(hue_range)
+            if integral is None:
+                mask = _hue_mask(hsv, hue_range, self.min_saturation, self.min_value)
+                integral = cv2.integral(mask // 255)
+                integrals[hue_range] = integral
+            return integral
+
+    def windows(self, frame: np.ndarray, template: np.ndarray) -> Optional[List[Box]]:
+        """
+        매칭할 창 목록
+
+        Args:
+            frame: 화면 이미지 (BGR)
+            template: 템플릿 이미지 (BGR)
+
+        Returns:
+            [(x1, y1, x2, y2), ...] 템플릿이 들어갈 수 있는 창 (빈 리스트면 프레임 전체 제외),
+            필터를 쓸 수 없으면(대표 색 없음) None
+        """
+        if frame.ndim != 3:
+            return None
+        dominant = self.cached_dominant_hue(template)
+        if dominant is None:
+            return None
+
+        hue_range, ratio = dominant
+        height, width = frame.shape[:2]
+        h, w = template.shape[:2]
+        if height < h or width < w:
+            return []
+
+        # 모든 창 위치의 색 픽셀 수 (적분 이미지 네 모서리)
+        s = self._integral(frame, hue_range)
+        counts = s[h:, w:] - s[:-h, w:] - s[h:, :-w] + s[:-h, :-w]
+        min_count = ratio * h * w * self.min_fraction
+        valid = (counts >= min_count).astype(np.uint8)
+
+        self.full_pixels += height * width
+        if not valid.any():
+            self.frames_rejected += 1
+            return []
+
+        # 남은 위치를 연결 요소로 묶어 창으로 변환
+        count, _, stats, _ = cv2.connectedComponentsWithStats(valid, connectivity=8)
+        boxes = [
+            (int(x), int(y), int(x + cw - 1 + w), int(y + ch - 1 + h))
+            for x, y, cw, ch, _ in stats[1:count]
+        ]
+        if len(boxes) > self.max_windows:
+            boxes = [(min(b[0] for b in boxes), min(b[1] for b in boxes),
+                      max(b[2] for b in boxes), max(b[3] for b in boxes))]
+
+        self.searched_pixels += sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in boxes)
+        return boxes
+
+    def get_stats(self) -> Dict[str, float]:
+        """필터 통계 (제외한 프레임 수, 매칭한 픽셀 비율)"""
+        return {
+            'frames_rejected': self.frames_rejected,
+            'pixel_ratio': self.searched_pixels / self.full_pixels if self.full_pixels else 1.0
+        }
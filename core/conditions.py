@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Wait Conditions
+StoryBase.wait_until()에서 쓰는 조합 가능한 대기 조건 모듈
+
+조건은 폴링마다 한 번 캡처한 프레임을 공유하며 평가되고, 만족하면 참인 값(보통 좌표)을 반환합니다.
+`|`(하나라도), `&`(모두), `~`(반대)로 조합할 수 있습니다.
+
+Example:
+    result = self.wait_until(
+        TemplatePresent("assets/images/UI/game_start_yellow.png") | OCRTextPresent("게임 시작"),
+        timeout=5
+    )
+    if result:
+        print(result.condition, result.value, result.latency)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    IMAGE_CONFIDENCE_THRESHOLD,
+    OCR_LANGUAGE,
+    WAIT_POLL_INTERVAL,
+    WAIT_POLL_MAX_INTERVAL,
+    WAIT_POLL_BACKOFF,
+    WAIT_STABLE_DURATION,
+    WAIT_STABLE_TOLERANCE
+)
+from .image_detector import ImageDetector
+from .ocr_processor import OCRProcessor
+
+Region = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+@dataclass
+class PollPolicy:
+    """
+    폴링 간격 정책 (처음에는 짧게, 이후 backoff 배율로 max_interval까지 늘림)
+
+    빠르게 바뀌는 UI는 backoff=1.0으로 고정 간격, 긴 로딩은 backoff를 키워 CPU 사용을 줄입니다.
+    """
+    interval: float = WAIT_POLL_INTERVAL
+    max_interval: float = WAIT_POLL_MAX_INTERVAL
+    backoff: float = WAIT_POLL_BACKOFF
+
+    def delays(self) -> Iterator[float]:
+        """폴링 사이 대기 시간 (무한)"""
+        delay = self.interval
+        while True:
+            yield delay
+            delay = min(self.max_interval, delay * self.backoff)
+
+
+class Frame:
+    """한 번의 폴링에서 모든 조건이 공유하는 화면 (처음 접근할 때 캡처)"""
+
+    def __init__(self, area: Optional[Region] = None):
+        """
+        Args:
+            area: 캡처 영역 (x1, y1, x2, y2), None이면 전체 화면
+        """
+        self.area = area
+        self.origin = (area[0], area[1]) if area else (0, 0)
+        self._image: Optional[np.ndarray] = None
+
+    @property
+    def image(self) -> np.ndarray:
+        """캡처 영역 이미지 (BGR)"""
+        if self._image is None:
+            self._image = ImageDetector.capture_screen(self.area)
+        return self._image
+
+    def crop(self, region: Optional[Region]) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        영역 자르기
+
+        Args:
+            region: 캡처 영역 기준 (x1, y1, x2, y2), None이면 전체
+
+        Returns:
+            (잘린 이미지 뷰, 절대 좌표 원점)
+        """
+        if region is None:
+            return self.image, self.origin
+        x1, y1, x2, y2 = region
+        return self.image[y1:y2, x1:x2], (self.origin[0] + x1, self.origin[1] + y1)
+
+
+class Condition:
+    """대기 조건 베이스 클래스"""
+
+    name = "condition"
+    remote = True  # 탐지 워커 프로세스로 보내 평가할 수 있는지 (pickle 가능, 상태 없음)
+
+    def evaluate(self, frame: Frame) -> Any:
+        """
+        조건 평가
+
+        Returns:
+            만족하면 참인 값 (좌표, 텍스트, True 등), 아니면 None/False
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """대기 시작 전 상태 초기화 (상태가 있는 조건만 오버라이드)"""
+        pass
+
+    def fired(self) -> str:
+        """마지막으로 만족한 조건 이름 (AnyOf는 만족한 하위 조건)"""
+        return self.name
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return AnyOf(self, other)
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return AllOf(self, other)
+
+    def __invert__(self) -> 'Condition':
+        return Not(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class AnyOf(Condition):
+    """하위 조건 중 하나라도 만족 (먼저 선언한 조건 우선)"""
+
+    def __init__(self, *conditions: Condition):
+        self.conditions: List[Condition] = []
+        for condition in conditions:
+            # (a | b) | c 를 평평하게
+            self.conditions.extend(condition.conditions if isinstance(condition, AnyOf) else [condition])
+        self.name = " | ".join(c.name for c in self.conditions)
+        self.remote = all(c.remote for c in self.conditions)
+        self._fired: Optional[Condition] = None
+
+    def evaluate(self, frame: Frame) -> Any:
+        for condition in self.conditions:
+            value = condition.evaluate(frame)
+            if value:
+                self._fired = condition
+                return value
+        return None
+
+    def reset(self) -> None:
+        self._fired = None
+        for condition in self.conditions:
+            condition.reset()
+
+    def fired(self) -> str:
+        return self._fired.fired() if self._fired is not None else self.name
+
+
+class AllOf(Condition):
+    """모든 하위 조건 만족 (값은 마지막 조건의 값)"""
+
+    def __init__(self, *conditions: Condition):
+        self.conditions: List[Condition] = []
+        for condition in conditions:
+            self.conditions.extend(condition.conditions if isinstance(condition, AllOf) else [condition])
+        self.name = " & ".join(c.name for c in self.conditions)
+        self.remote = all(c.remote for c in self.conditions)
+
+    def evaluate(self, frame: Frame) -> Any:
+        value = None
+        for condition in self.conditions:
+            value = condition.evaluate(frame)
+            if not value:
+                return None
+        return value
+
+    def reset(self) -> None:
+        for condition in self.conditions:
+            condition.reset()
+
+
+class Not(Condition):
+    """하위 조건의 반대 (예: 버튼이 사라질 때까지)"""
+
+    def __init__(self, condition: Condition):
+        self.condition = condition
+        self.name = f"not {condition.name}"
+        self.remote = condition.remote
+
+    def evaluate(self, frame: Frame) -> Any:
+        return not self.condition.evaluate(frame)
+
+    def reset(self) -> None:
+        self.condition.reset()
+
+
+class Check(Condition):
+    """임의 함수 조건 (화면이 필요 없는 상태 확인 등)"""
+
+    remote = False  # 함수는 이 프로세스의 상태를 확인
+
+    def __init__(self, check: Callable[[], Any], name: str = "check"):
+        """
+        Args:
+            check: 인자 없는 함수 (참인 값을 반환하면 만족)
+            name: 결과에 표시할 이름
+        """
+        self.check = check
+        self.name = name
+
+    def evaluate(self, frame: Frame) -> Any:
+        return self.check()
+
+
+class TemplatePresent(Condition):
+    """템플릿이 화면에 있음 (find_image_in_area와 같은 탐지 방식, 값은 절대 중심 좌표)"""
+
+    def __init__(
+        self,
+        template_path: str,
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        region: Optional[Region] = None,
+        mode: str = 'ncc'
+    ):
+        """
+        Args:
+            template_path: 템플릿 이미지 경로
+            confidence: 최소 신뢰도
+            region: 캡처 영역 기준 검색 영역 (None이면 전체)
+            mode: 'ncc' 또는 'sparse'
+        """
+        self.template_path = template_path
+        self.confidence = confidence
+        self.region = region
+        self.mode = mode
+        self.name = template_path.replace('\\', '/').rsplit('/', 1)[-1]
+        self._detector = ImageDetector()
+
+    def evaluate(self, frame: Frame) -> Optional[Tuple[int, int]]:
+        image, (ox, oy) = frame.crop(self.region)
+        result = self._detector.find_image_in_screen(self.template_path, image, self.confidence, self.mode)
+        if not result:
+            return None
+        return (result[0] + ox, result[1] + oy)
+
+
+class TemplateAbsent(Not):
+    """템플릿이 화면에 없음 (로딩 표시, 팝업이 사라질 때까지)"""
+
+    def __init__(
+        self,
+        template_path: str,
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        region: Optional[Region] = None,
+        mode: str = 'ncc'
+    ):
+        super().__init__(TemplatePresent(template_path, confidence, region, mode))
+
+
+class PixelSignaturePresent(TemplatePresent):
+    """희소 픽셀 시그니처로 템플릿 확인 (고정 배율 UI, 폴링 비용이 가장 낮음)"""
+
+    def __init__(self, template_path: str, confidence: float = IMAGE_CONFIDENCE_THRESHOLD, region: Optional[Region] = None):
+        super().__init__(template_path, confidence, region, mode='sparse')
+
+
+class RegionStable(Condition):
+    """
+    영역이 일정 시간 동안 바뀌지 않음 (애니메이션/로딩 종료 확인)
+
+    폴링마다 축소 그레이스케일을 직전 것과 비교하고, 평균 차이가 tolerance 이하인 상태가
+    duration 이상 이어지면 만족합니다.
+    """
+
+    remote = False  # 직전 프레임을 기억하므로 이 프로세스에서 평가
+
+    def __init__(
+        self,
+        region: Optional[Region] = None,
+        duration: float = WAIT_STABLE_DURATION,
+        tolerance: float = WAIT_STABLE_TOLERANCE
+    ):
+        """
+        Args:
+            region: 캡처 영역 기준 확인 영역 (None이면 전체)
+            duration: 변화 없이 유지되어야 하는 시간 (초)
+            tolerance: 허용 평균 밝기 차이 (0 ~ 255)
+        """
+        self.region = region
+        self.duration = duration
+        self.tolerance = tolerance
+        self.name = f"stable {region}" if region else "stable"
+        self.reset()
+
+    def reset(self) -> None:
+        self._previous: Optional[np.ndarray] = None
+        self._stable_since: Optional[float] = None
+
+    def evaluate(self, frame: Frame) -> bool:
+        image, _ = frame.crop(self.region)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        small = cv2.resize(gray, (64, 36), interpolation=cv2.INTER_AREA).astype(np.int16)
+        now = time.perf_counter()
+
+        previous, self._previous = self._previous, small
+        if previous is None or float(np.abs(small - previous).mean()) > self.tolerance:
+            self._stable_since = now
+            return False
+        return now - self._stable_since >= self.duration
+
+
+class OCRTextPresent(Condition):
+    """영역에 텍스트가 보임 (대소문자/공백 무시 부분 일치, 값은 절대 중심 좌표)"""
+
+    def __init__(self, text: str, region: Optional[Region] = None, language: str = OCR_LANGUAGE):
+        """
+        Args:
+            text: 찾을 텍스트
+            region: 캡처 영역 기준 검색 영역 (None이면 전체, 좁을수록 빠름)
+            language: OCR 언어 (예: 'kor+eng')
+        """
+        self.text = text
+        self.region = region
+        self.language = language
+        self.name = f"text '{text}'"
+        self._needle = self._normalize(text)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ''.join(text.split()).lower()
+
+    def evaluate(self, frame: Frame) -> Optional[Tuple[int, int]]:
+        image, (ox, oy) = frame.crop(self.region)
+        for text, (x1, y1, x2, y2), _ in OCRProcessor.read_text_regions(image, language=self.language):
+            if self._needle in self._normalize(text):
+                return (ox + (x1 + x2) // 2, oy + (y1 + y2) // 2)
+        return None
+
+
+@dataclass
+class WaitResult:
+    """
+    wait_until() 결과
+
+    bool로 평가하면 조건 만족 여부입니다.
+    """
+    status: str  # fired, timeout, cancelled
+    condition: Optional[str] = None  # 만족한 조건 이름
+    value: Any = None  # 조건 값 (좌표 등)
+    latency: float = 0.0  # 대기 시작부터 만족(또는 종료)까지 걸린 시간 (초)
+    polls: int = 0  # 평가 횟수
+
+    def __bool__(self) -> bool:
+        return self.status == 'fired'
@@ -7,11 +7,23 @@ Configuration Management
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .constants import (
     DEFAULT_ACTION_DELAY,
     DEFAULT_STORY_PAUSE,
+    OCR_CACHE_MAX_ENTRIES,
+    OCR_CACHE_FILE,
+    OCR_POOL_TIMEOUT,
+    GLYPH_BANK_FILE,
+    SCENE_SIGNATURES_FILE,
+    SUBTEMPLATE_FILE,
+    ASSET_MANIFEST_FILE,
+    SCALE_PROFILE_FILE,
+    ASSET_BUNDLE_FILE,
+    CHECKPOINT_DIR,
+    CHECKPOINT_MAX_AGE,
+    DETECTION_PROCESS_CAPTURE_INTERVAL,
     CONFIG_FILE
 )
 from .exceptions import ConfigurationError
@@ -34,12 +46,130 @@ class StoryConfig:
     retry_count: int = 3
 
 
+@dataclass
+class ActionConfig:
+    """텍스트 트리거 액션 설정 (config.json의 "actions" 항목)"""
+    name: str
+    trigger_text: str
+    action_type: str  # click, key, click_and_key
+    enabled: bool = True
+    trigger_region: Optional[Tuple[int, int, int, int]] = None  # (x1, y1, x2, y2)
+    action_params: Dict[str, Any] = field(default_factory=dict)
+
+    ACTION_TYPES = ('click', 'key', 'click_and_key')
+
+    def __post_init__(self):
+        """초기화 후 검증"""
+        if self.trigger_region is not None:
+            self.trigger_region = tuple(int(v) for v in self.trigger_region)
+        self.validate()
+
+    def validate(self) -> None:
+        """액션 설정 검증"""
+        key = f"actions.{self.name}"
+
+        if not self.trigger_text:
+            raise ConfigurationError(f"{key}.trigger_text", "Must not be empty")
+
+        if self.action_type not in self.ACTION_TYPES:
+            raise ConfigurationError(
+                f"{key}.action_type", f"Must be one of {', '.join(self.ACTION_TYPES)}"
+            )
+
+        if self.trigger_region is not None:
+            if len(self.trigger_region) != 4:
+                raise ConfigurationError(f"{key}.trigger_region", "Must be [x1, y1, x2, y2]")
+            x1, y1, x2, y2 = self.trigger_region
+            if x2 <= x1 or y2 <= y1:
+                raise ConfigurationError(f"{key}.trigger_region", "Must satisfy x1 < x2 and y1 < y2")
+
+        if self.action_type in ('key', 'click_and_key') and not self.action_params.get("key"):
+            raise ConfigurationError(f"{key}.action_params.key", "Required for key actions")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ActionConfig':
+        """딕셔너리에서 액션 설정 로드"""
+        return cls(
+            name=data.get("name", data.get("trigger_text", "")),
+            trigger_text=data.get("trigger_text", ""),
+            action_type=data.get("action_type", ""),
+            enabled=data.get("enabled", True),
+            trigger_region=data.get("trigger_region"),
+            action_params=dict(data.get("action_params") or {})
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """액션 설정을 딕셔너리로 변환"""
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "trigger_text": self.trigger_text,
+            "trigger_region": list(self.trigger_region) if self.trigger_region else None,
+            "action_type": self.action_type,
+            "action_params": self.action_params
+        }
+
+
+@dataclass
+class InstanceConfig:
+    """게임 인스턴스(창) 설정 (config.json의 "instances" 항목)"""
+    name: str
+    region: Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+    stories: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        """초기화 후 검증"""
+        self.region = tuple(int(v) for v in self.region)
+        if len(self.region) != 4:
+            raise ConfigurationError(f"instances.{self.name}.region", "Must be [x1, y1, x2, y2]")
+        x1, y1, x2, y2 = self.region
+        if x2 <= x1 or y2 <= y1:
+            raise ConfigurationError(f"instances.{self.name}.region", "Must satisfy x1 < x2 and y1 < y2")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InstanceConfig':
+        """딕셔너리에서 인스턴스 설정 로드"""
+        if "region" not in data:
+            raise ConfigurationError(f"instances.{data.get('name', '?')}.region", "Required")
+        return cls(
+            name=data.get("name", "instance"),
+            region=data["region"],
+            stories=list(data.get("stories", []))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """인스턴스 설정을 딕셔너리로 변환"""
+        return {"name": self.name, "region": list(self.region), "stories": self.stories}
+
+
 @dataclass
 class AppConfig:
     """애플리케이션 전체 설정"""
     # Tesseract OCR
     tesseract_path: str = "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
     ocr_language: str = "eng"
+    ocr_cache_size: int = OCR_CACHE_MAX_ENTRIES
+    ocr_cache_file: Optional[str] = OCR_CACHE_FILE
+    ocr_pool: bool = True
+    ocr_workers: int = 0  # 0이면 CPU 코어 수
+    ocr_timeout: float = OCR_POOL_TIMEOUT
+    glyph_bank_file: Optional[str] = GLYPH_BANK_FILE
+    scene_signatures_file: Optional[str] = SCENE_SIGNATURES_FILE
+    subtemplate_file: Optional[str] = SUBTEMPLATE_FILE
+    color_prefilter: bool = True
+    asset_manifest_file: Optional[str] = ASSET_MANIFEST_FILE
+    scale_profile_file: Optional[str] = SCALE_PROFILE_FILE
+    auto_calibrate_scale: bool = False
+    asset_bundle_file: Optional[str] = ASSET_BUNDLE_FILE
+    tiled_match: bool = True
+    tile_size: int = 0  # 0이면 시작 시 벤치마크로 자동 조정
+    tile_workers: int = 0  # 0이면 자동 조정
+    checkpoint_dir: Optional[str] = CHECKPOINT_DIR  # None이면 체크포인트 사용 안 함
+    checkpoint_max_age: float = CHECKPOINT_MAX_AGE
+    async_runtime: bool = False  # 스토리/모니터/상태 출력을 하나의 asyncio 이벤트 루프에서 실행
+    async_workers: int = 0  # 0이면 ThreadPoolExecutor 기본값
+    detection_process: bool = False  # 캡처 + 탐지를 별도 워커 프로세스에서 실행
+    detection_capture_interval: float = DETECTION_PROCESS_CAPTURE_INTERVAL
 
     # Automation settings
     failsafe: bool = True
@@ -62,6 +192,14 @@ class AppConfig:
     # Realtime monitor
     realtime_monitor: bool = True
 
+    # Multi-instance (비어 있으면 단일 인스턴스 모드)
+    instances: List[InstanceConfig] = field(default_factory=list)
+
+    # Text-triggered actions
+    actions: List[ActionConfig] = field(default_factory=list)
+    run_actions: bool = False
+    check_interval: float = 2.0
+
     def __post_init__(self):
         """초기화 후 검증"""
         self.validate()
@@ -77,6 +215,33 @@ class AppConfig:
         if self.monitor.duration < 0:
             raise ConfigurationError("monitor.duration", "Must be non-negative")
 
+        if self.ocr_cache_size < 0:
+            raise ConfigurationError("ocr_cache_size", "Must be non-negative")
+
+        if self.check_interval <= 0:
+            raise ConfigurationError("check_interval", "Must be positive")
+
+        if self.ocr_workers < 0:
+            raise ConfigurationError("ocr_workers", "Must be non-negative")
+
+        if self.tile_size < 0:
+            raise ConfigurationError("tile_size", "Must be non-negative")
+
+        if self.tile_workers < 0:
+            raise ConfigurationError("tile_workers", "Must be non-negative")
+
+        if self.checkpoint_max_age <= 0:
+            raise ConfigurationError("checkpoint_max_age", "Must be positive")
+
+        if self.async_workers < 0:
+            raise ConfigurationError("async_workers", "Must be non-negative")
+
+        if self.detection_capture_interval <= 0:
+            raise ConfigurationError("detection_capture_interval", "Must be positive")
+
+        if self.ocr_timeout <= 0:
+            raise ConfigurationError("ocr_timeout", "Must be positive")
+
         if not 0.1 <= self.monitor.scale <= 2.0:
             raise ConfigurationError("monitor.scale", "Must be between 0.1 and 2.0")
 
@@ -108,10 +273,46 @@ class AppConfig:
                 if isinstance(story_data, dict):
                     stories[name] = StoryConfig(**story_data)
 
+        # 액션 설정
+        actions = [
+            ActionConfig.from_dict(action_data)
+            for action_data in data.get("actions") or []
+            if isinstance(action_data, dict)
+        ]
+
+        # 인스턴스 설정
+        instances = [
+            InstanceConfig.from_dict(instance_data)
+            for instance_data in data.get("instances") or []
+            if isinstance(instance_data, dict)
+        ]
+
         # 메인 설정
         return cls(
             tesseract_path=data.get("tesseract_path", cls.tesseract_path),
             ocr_language=data.get("language", cls.ocr_language),
+            ocr_cache_size=data.get("ocr_cache_size", cls.ocr_cache_size),
+            ocr_cache_file=data.get("ocr_cache_file", cls.ocr_cache_file),
+            ocr_pool=data.get("ocr_pool", cls.ocr_pool),
+            ocr_workers=data.get("ocr_workers", cls.ocr_workers),
+            ocr_timeout=data.get("ocr_timeout", cls.ocr_timeout),
+            glyph_bank_file=data.get("glyph_bank_file", cls.glyph_bank_file),
+            scene_signatures_file=data.get("scene_signatures_file", cls.scene_signatures_file),
+            subtemplate_file=data.get("subtemplate_file", cls.subtemplate_file),
+            color_prefilter=data.get("color_prefilter", cls.color_prefilter),
+            asset_manifest_file=data.get("asset_manifest_file", cls.asset_manifest_file),
+            scale_profile_file=data.get("scale_profile_file", cls.scale_profile_file),
+            auto_calibrate_scale=data.get("auto_calibrate_scale", cls.auto_calibrate_scale),
+            asset_bundle_file=data.get("asset_bundle_file", cls.asset_bundle_file),
+            tiled_match=data.get("tiled_match", cls.tiled_match),
+            tile_size=data.get("tile_size", cls.tile_size),
+            tile_workers=data.get("tile_workers", cls.tile_workers),
+            checkpoint_dir=data.get("checkpoint_dir", cls.checkpoint_dir),
+            checkpoint_max_age=data.get("checkpoint_max_age", cls.checkpoint_max_age),
+            async_runtime=data.get("async_runtime", cls.async_runtime),
+            async_workers=data.get("async_workers", cls.async_workers),
+            detection_process=data.get("detection_process", cls.detection_process),
+            detection_capture_interval=data.get("detection_capture_interval", cls.detection_capture_interval),
             failsafe=data.get("failsafe", cls.failsafe),
             pause_between_actions=data.get("pause_between_actions", cls.pause_between_actions),
             pause_between_stories=data.get("pause_between_stories", cls.pause_between_stories),
@@ -120,7 +321,11 @@ class AppConfig:
             monitor=monitor,
             stories=stories,
             auto_restart=data.get("auto_restart", cls.auto_restart),
-            realtime_monitor=data.get("realtime_monitor", cls.realtime_monitor)
+            realtime_monitor=data.get("realtime_monitor", cls.realtime_monitor),
+            instances=instances,
+            actions=actions,
+            run_actions=data.get("run_actions", cls.run_actions),
+            check_interval=data.get("check_interval", cls.check_interval)
         )
 
     @classmethod
@@ -142,6 +347,28 @@ class AppConfig:
         return {
             "tesseract_path": self.tesseract_path,
             "language": self.ocr_language,
+            "ocr_cache_size": self.ocr_cache_size,
+            "ocr_cache_file": self.ocr_cache_file,
+            "ocr_pool": self.ocr_pool,
+            "ocr_workers": self.ocr_workers,
+            "ocr_timeout": self.ocr_timeout,
+            "glyph_bank_file": self.glyph_bank_file,
+            "scene_signatures_file": self.scene_signatures_file,
+            "subtemplate_file": self.subtemplate_file,
+            "color_prefilter": self.color_prefilter,
+            "asset_manifest_file": self.asset_manifest_file,
+            "scale_profile_file": self.scale_profile_file,
+            "auto_calibrate_scale": self.auto_calibrate_scale,
+            "asset_bundle_file": self.asset_bundle_file,
+            "tiled_match": self.tiled_match,
+            "tile_size": self.tile_size,
+            "tile_workers": self.tile_workers,
+            "checkpoint_dir": self.checkpoint_dir,
+            "checkpoint_max_age": self.checkpoint_max_age,
+            "async_runtime": self.async_runtime,
+            "async_workers": self.async_workers,
+            "detection_process": self.detection_process,
+            "detection_capture_interval": self.detection_capture_interval,
             "failsafe": self.failsafe,
             "pause_between_actions": self.pause_between_actions,
             "pause_between_stories": self.pause_between_stories,
@@ -160,7 +387,11 @@ class AppConfig:
                 for name, story in self.stories.items()
             },
             "auto_restart": self.auto_restart,
-            "realtime_monitor": self.realtime_monitor
+            "realtime_monitor": self.realtime_monitor,
+            "instances": [instance.to_dict() for instance in self.instances],
+            "run_actions": self.run_actions,
+            "check_interval": self.check_interval,
+            "actions": [action.to_dict() for action in self.actions]
         }
 
     def save_to_file(self, filepath: str = CONFIG_FILE) -> None:
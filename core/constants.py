@@ -9,15 +9,92 @@ SCREEN_SCALE_DEFAULT = 0.8
 DETECTION_AREA_TOP_RATIO = 0.5
 DETECTION_AREA_BOTTOM_OFFSET = 50
 MONITOR_UPDATE_INTERVAL = 0.001  # seconds
+FRAME_MAX_AGE = 0.05  # 공유 캡처 프레임 재사용 허용 시간 (seconds)
 
 # Image detection constants
 IMAGE_CONFIDENCE_THRESHOLD = 0.8
 TEMPLATE_MATCH_THRESHOLD = 0.7
 DUPLICATE_DETECTION_THRESHOLD_RATIO = 0.5
+SEARCH_PARENT_MARGIN = 8  # 계층 검색 시 부모 박스 주변 여유 (픽셀)
+
+# Sparse pixel-signature detector (fixed-scale UI)
+SIGNATURE_SAMPLES = 24  # 템플릿당 비교 픽셀 수 K
+SIGNATURE_PREFILTER_SAMPLES = 4  # 프레임 전체에서 먼저 비교할 픽셀 수
+SIGNATURE_TOLERANCE = 24  # 픽셀 밝기 허용 오차
+SIGNATURE_MAX_MISMATCH = 0.2  # 나머지 픽셀 중 허용 불일치 비율
+SIGNATURE_MAX_CANDIDATES = 8  # matchTemplate로 확인할 최대 후보 수
+
+# Color-presence prefilter (HSV mask integral image)
+COLOR_PREFILTER_HUE_TOLERANCE = 8  # OpenCV hue 단위 (0 ~ 179)
+COLOR_PREFILTER_MIN_SATURATION = 80
+COLOR_PREFILTER_MIN_VALUE = 80
+COLOR_PREFILTER_MIN_TEMPLATE_RATIO = 0.15  # 템플릿 대표 색 비율이 이보다 낮으면 필터 안 함
+COLOR_PREFILTER_MIN_FRACTION = 0.5  # 창 안 색 픽셀이 템플릿 대비 이 비율 미만이면 제외
+COLOR_PREFILTER_MAX_WINDOWS = 16
+COLOR_PREFILTER_HUE_CACHE_SIZE = 256  # 템플릿별 대표 색상 캐시 항목 수
+
+# HSV color-blob detector (solid-colored buttons)
+COLOR_BLOB_SCALE_TOLERANCE = 0.2  # 기준 크기 대비 허용 오차 비율
+COLOR_BLOB_MIN_FILL = 0.6  # 박스 중 색 픽셀 최소 비율
+COLOR_BLOB_DOWNSAMPLE = 2  # 큰 덩어리는 축소한 화면에서 탐지
+ASSET_MANIFEST_FILE = "assets/manifest.json"
+
+# Multi-scale calibration (per-resolution template scale)
+SCALE_PROFILE_FILE = "cache/scale_profile.json"
+SCALE_RANGE = (0.5, 2.0)  # 보정 시 탐색할 템플릿 배율 범위
+SCALE_COARSE_STEPS = 16
+SCALE_FINE_STEPS = 17
+SCALE_MIN_SCORE = 0.7  # 최적 배율에서 이 점수 이상으로 찾은 템플릿이 하나는 있어야 함
+SCALE_TOP_TEMPLATES = 3  # 배율 점수 = 점수 상위 템플릿 N개의 평균
+SCALE_MIN_MARGIN = 0.05  # 최적 배율 점수가 멀리 떨어진 다른 배율보다 이만큼 높아야 저장
+
+# Precompiled asset bundle (decoded templates, memory-mapped)
+ASSET_BUNDLE_FILE = "assets/templates.bundle"
+ASSET_BUNDLE_ALIGNMENT = 64  # 이미지 데이터 시작 위치 정렬 (bytes)
+
+# Tile-parallel template matching
+TILE_SIZES = (256, 512, 768)  # 자동 조정 후보 타일 크기 (결과 맵 기준, pixels)
+TILE_MIN_AREA = 1280 * 720  # 이보다 작은 검색 영역은 타일 없이 매칭
+TILE_BENCHMARK_SIZE = (1920, 1080)  # Detection Area를 모를 때 벤치마크 검색 영역 (width, height)
+TILE_BENCHMARK_TEMPLATE = (120, 40)  # 시작 시 벤치마크 템플릿 크기 (width, height)
+
+# Discriminative sub-templates (compact matching patches)
+SUBTEMPLATE_FILE = "assets/subtemplates.json"
+SUBTEMPLATE_MIN_MARGIN = 0.15  # 참조 프레임에서 정답과 차순위 점수의 최소 차이
+SUBTEMPLATE_MIN_SIZE = 12  # 패치 최소 변 길이 (pixels)
+
+# Scene classification
+SCENE_THUMBNAIL_SIZE = (48, 27)  # (width, height)
+SCENE_MIN_CONFIDENCE = 0.8
+SCENE_SIGNATURES_FILE = "assets/scenes.npz"
 
 # OCR configuration
 OCR_CONFIG_DIGITS = '--psm 7 digits'
+OCR_CONFIG_DIGITS_BATCH = '--psm 6 digits'  # 여러 줄 (ROI 묶음) 인식
+OCR_BATCH_PADDING = 16  # 묶음 캔버스에서 ROI 사이 여백 (픽셀)
+OCR_CONFIG_TEXT_LINE = '--psm 7'  # 텍스트 후보 박스 한 줄 인식
 OCR_LANGUAGE = 'eng'
+OCR_CACHE_MAX_ENTRIES = 512
+OCR_CACHE_FILE = "cache/ocr_cache.json"
+OCR_POOL_TIMEOUT = 10.0  # seconds
+
+# Glyph digit recognizer (fast path for currency digits)
+GLYPH_SIZE = (16, 24)  # (width, height)
+GLYPH_MIN_CONFIDENCE = 0.85
+GLYPH_MIN_AREA = 4  # pixels
+GLYPH_BANK_FILE = "assets/glyph_bank.npz"
+
+# Text region proposal
+TEXT_MIN_HEIGHT = 8  # pixels
+TEXT_MAX_HEIGHT_RATIO = 0.5  # 이미지 높이 대비
+TEXT_BOX_PADDING = 4  # pixels
+TEXT_MAX_MSER_BOXES = 400  # 줄 병합 전에 남길 MSER 박스 최대 개수 (큰 박스 우선)
+
+# OCR word index
+OCR_INDEX_FUZZY_THRESHOLD = 0.75  # 자모 기준 유사도
+
+# Rule engine (config.json "actions")
+RULE_COOLDOWN = 3.0  # seconds
 
 # UI colors (BGR format for OpenCV)
 COLOR_YELLOW = (0, 255, 255)
@@ -32,6 +109,28 @@ DEFAULT_ACTION_DELAY = 0.5
 DEFAULT_CLICK_DELAY = 0.2
 DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_STORY_PAUSE = 3.0
+PREFETCH_INTERVAL = 0.1  # 다음 단계 탐지를 미리 반복하는 간격 (seconds)
+
+# Condition-based waits (StoryBase.wait_until)
+WAIT_POLL_INTERVAL = 0.05  # 첫 폴링 간격 (seconds)
+WAIT_POLL_MAX_INTERVAL = 0.5  # 최대 폴링 간격 (seconds)
+WAIT_POLL_BACKOFF = 1.5  # 폴링마다 간격 증가 배율
+WAIT_STABLE_DURATION = 0.3  # RegionStable 기본 유지 시간 (seconds)
+WAIT_STABLE_TOLERANCE = 2.0  # RegionStable 허용 평균 밝기 차이
+STEP_DEADLINE = 10.0  # 스토리 단계 시도당 기본 대기 한도 (seconds)
+
+# Story checkpoints (resume after crash/restart)
+CHECKPOINT_DIR = "cache/checkpoints"
+CHECKPOINT_MAX_AGE = 1800  # 이보다 오래된 체크포인트는 무시 (seconds)
+
+# Asyncio runtime (config.json "async_runtime")
+MONITOR_ASYNC_INTERVAL = 0.03  # 모니터 창 갱신 간격 (seconds)
+ASYNC_STATUS_INTERVAL = 0.5  # 상태 줄 출력 간격 (seconds)
+
+# Detection worker process (config.json "detection_process")
+DETECTION_PROCESS_CAPTURE_INTERVAL = 0.05  # 워커의 캡처/게시 간격 (seconds)
+DETECTION_PROCESS_FRAME_SLOTS = 3  # 공유 메모리 프레임 링 슬롯 수
+DETECTION_PROCESS_TIMEOUT = 5.0  # 탐지 요청 응답 대기 한도 (seconds)
 
 # Retry configuration
 MAX_RETRY_COUNT = 3
@@ -50,4 +149,5 @@ ASSETS_DIR = "assets"
 IMAGES_DIR = "assets/images"
 UI_IMAGES_DIR = "assets/images/UI"
 SYSTEM_IMAGES_DIR = "assets/images/system"
+SCENES_DIR = "assets/images/scenes"
 CONFIG_FILE = "config.json"
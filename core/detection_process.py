@@ -0,0 +1,445 @@
+# -*- coding: utf-8 -*-
+"""
+Detection Worker Process
+화면 캡처와 탐지를 별도 프로세스에서 실행하는 모듈
+
+워커 프로세스가 화면을 주기적으로 캡처해 공유 메모리(multiprocessing.shared_memory)에 게시하고,
+스토리 프로세스가 보낸 조건(Condition)을 최신 프레임에서 평가해 결과를 큐로 돌려줍니다.
+모니터 미리보기, 상태 출력, OCR 후처리는 스토리 프로세스에 남고 매칭은 다른 GIL에서 실행됩니다.
+"""
+
+import itertools
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .conditions import Condition, Frame
+from .constants import (
+    DETECTION_PROCESS_CAPTURE_INTERVAL,
+    DETECTION_PROCESS_FRAME_SLOTS,
+    DETECTION_PROCESS_TIMEOUT
+)
+from .exceptions import DetectionProcessError
+from .image_detector import ImageDetector
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+Region = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+class SharedFrameBuffer:
+    """
+    공유 메모리 프레임 링 버퍼 (쓰는 쪽 하나, 읽는 쪽 여럿)
+
+    메모리 구조: [헤더: 최신 순번 + 슬롯별 (순번, 캡처 시각 ns)] [슬롯 0 픽셀] [슬롯 1 픽셀] ...
+    슬롯 순번은 seqlock으로 씁니다. 쓰는 쪽은 슬롯 순번을 -1(쓰는 중)로 바꾼 뒤 픽셀을 쓰고,
+    다 쓴 다음 새 순번과 최신 순번을 게시합니다. 읽는 쪽은 복사 전후에 슬롯 순번을 읽어
+    쓰는 중이거나 두 값이 다르면 (복사 중에 덮어쓰기 시작) 최신 프레임부터 다시 읽습니다.
+    """
+
+    WRITING = -1  # 슬롯 순번: 쓰는 중
+
+    def __init__(self, shape: Tuple[int, int, int], slots: int = DETECTION_PROCESS_FRAME_SLOTS,
+                 name: Optional[str] = None):
+        """
+        Args:
+            shape: 프레임 크기 (height, width, 3)
+            slots: 슬롯 수 (2 이상)
+            name: 기존 공유 메모리 이름 (None이면 새로 생성)
+        """
+        self.shape = tuple(shape)
+        self.slots = slots
+        frame_bytes = int(np.prod(self.shape))
+        header_bytes = (1 + 2 * slots) * 8
+        self._owner = name is None
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=header_bytes + frame_bytes * slots)
+        else:
+            # spawn으로 시작한 워커는 부모의 리소스 추적기를 공유하므로 삭제는 생성한 쪽에서 한 번만
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._header = np.ndarray((1 + 2 * slots,), dtype=np.int64, buffer=self.shm.buf)
+        self._frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf, offset=header_bytes)
+        if self._owner:
+            self._header[:] = 0
+
+    @property
+    def name(self) -> str:
+        """공유 메모리 이름 (워커 프로세스에서 attach할 때 사용)"""
+        return self.shm.name
+
+    @property
+    def sequence(self) -> int:
+        """최신 프레임 순번 (0이면 아직 프레임 없음)"""
+        return int(self._header[0])
+
+    def write(self, frame: np.ndarray) -> int:
+        """
+        프레임 게시
+
+        Args:
+            frame: BGR 프레임 (shape과 다르면 겹치는 부분만 쓰고 나머지는 검은색)
+
+        Returns:
+            게시한 프레임 순번
+        """
+        sequence = int(self._header[0]) + 1
+        slot = sequence % self.slots
+        target = self._frames[slot]
+        self._header[1 + 2 * slot] = self.WRITING
+        h, w = min(frame.shape[0], self.shape[0]), min(frame.shape[1], self.shape[1])
+        if (h, w) != self.shape[:2]:
+            target[:] = 0
+        target[:h, :w] = frame[:h, :w]
+        self._header[1 + 2 * slot + 1] = time.time_ns()
+        self._header[1 + 2 * slot] = sequence
+        self._header[0] = sequence
+        return sequence
+
+    def read(self, area: Optional[Region] = None) -> Tuple[np.ndarray, int, float]:
+        """
+        최신 프레임 복사
+
+        Args:
+            area: 복사할 영역 (x1, y1, x2, y2), None이면 전체 (영역만 복사하므로 더 빠름)
+
+        Returns:
+            (프레임 사본, 순번, 캡처 후 경과 시간 초)
+
+        Raises:
+            DetectionProcessError: 아직 게시된 프레임이 없을 때
+        """
+        while True:
+            sequence = int(self._header[0])
+            if sequence == 0:
+                raise DetectionProcessError("No frame published yet")
+            slot = sequence % self.slots
+            if int(self._header[1 + 2 * slot]) != sequence:
+                # 쓰는 중이거나 이미 다음 바퀴로 덮어씀
+                continue
+            captured_ns = int(self._header[1 + 2 * slot + 1])
+            frame = self._frames[slot]
+            if area is not None:
+                x1, y1, x2, y2 = area
+                frame = frame[y1:y2, x1:x2]
+            image = frame.copy()
+            if int(self._header[1 + 2 * slot]) == sequence:
+                return image, sequence, (time.time_ns() - captured_ns) / 1e9
+
+    def close(self) -> None:
+        """공유 메모리 해제 (생성한 쪽은 삭제까지)"""
+        self._header = None
+        self._frames = None
+        self.shm.close()
+        if self._owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _worker_main(
+    shm_name: str,
+    shape: Tuple[int, int, int],
+    slots: int,
+    requests: Any,
+    results: Any,
+    interval: float,
+    grab: Optional[Callable[[], np.ndarray]],
+    initializer: Optional[Callable[[], Any]]
+) -> None:
+    """
+    워커 프로세스 본체 - interval마다 캡처해 게시하고, 사이사이 탐지 요청 처리
+
+    요청: (요청 id, 조건, 캡처 영역), None이면 종료
+    결과: (요청 id, 값, 만족한 조건 이름, 오류 메시지 또는 None, 캡처 순번, 처리 시간 초)
+    - 조건은 복사본이 평가되므로 AnyOf의 만족한 하위 조건 이름도 함께 보냄
+    """
+    if initializer is not None:
+        initializer()
+    grab = grab or ImageDetector.grab_screen
+    buffer = SharedFrameBuffer(shape, slots, name=shm_name)
+    # 워커 안의 탐지는 방금 게시한 프레임 사용 (조건마다 다시 캡처하지 않음)
+    ImageDetector.frame_source = lambda area=None: buffer.read(area)[0]
+
+    next_capture = 0.0
+    try:
+        while True:
+            now = time.perf_counter()
+            if now >= next_capture:
+                try:
+                    buffer.write(grab())
+                except Exception as e:
+                    logger.warning(f"Detection worker capture failed: {e}")
+                next_capture = now + interval
+
+            try:
+                request = requests.get(timeout=max(0.0, next_capture - time.perf_counter()))
+            except queue.Empty:
+                continue
+            if request is None:
+                break
+
+            request_id, condition, area = request
+            started = time.perf_counter()
+            try:
+                value, error = condition.evaluate(Frame(area)), None
+                fired = condition.fired()
+                pickle.dumps(value)
+            except Exception as e:
+                value, fired, error = None, None, f"{type(e).__name__}: {e}"
+            results.put((request_id, value, fired, error, buffer.sequence, time.perf_counter() - started))
+    finally:
+        buffer.close()
+
+
+class DetectionProcess:
+    """
+    캡처 + 탐지 워커 프로세스 클라이언트 (스토리 프로세스 쪽)
+
+    - get_frame(): 공유 메모리의 최신 프레임 (ImageDetector.frame_source로 연결하면 모니터/스토리가
+      화면을 직접 캡처하지 않음)
+    - evaluate(): 조건을 워커에서 평가 (Condition.remote가 False인 조건은 이 프로세스에서 평가)
+    - evaluate_fired(): evaluate()와 같지만 만족한 조건 이름도 반환 (wait_until의 WaitResult.condition)
+
+    Example:
+        process = DetectionProcess()
+        process.start()
+        ImageDetector.frame_source = process.get_frame
+        pos = process.evaluate(TemplatePresent("assets/images/UI/game_start.png"), area)
+        process.stop()
+    """
+
+    def __init__(
+        self,
+        interval: float = DETECTION_PROCESS_CAPTURE_INTERVAL,
+        slots: int = DETECTION_PROCESS_FRAME_SLOTS,
+        timeout: float = DETECTION_PROCESS_TIMEOUT,
+        grab: Optional[Callable[[], np.ndarray]] = None,
+        initializer: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Args:
+            interval: 워커의 캡처 간격 (초)
+            slots: 공유 메모리 프레임 슬롯 수
+            timeout: 탐지 요청 기본 타임아웃 (초)
+            grab: 워커에서 전체 화면을 캡처하는 함수 (None이면 ImageDetector.grab_screen,
+                  spawn으로 전달되므로 모듈 수준 함수여야 함)
+            initializer: 워커 시작 시 한 번 실행할 함수 (템플릿 배율/번들/사전 필터 설정 등)
+        """
+        self.interval = interval
+        self.slots = slots
+        self.timeout = timeout
+        self.grab = grab
+        self.initializer = initializer
+
+        self.buffer: Optional[SharedFrameBuffer] = None
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = True
+
+        # 지표 (여러 스레드에서 호출되므로 _lock 안에서 갱신)
+        self.request_count = 0
+        self.local_count = 0
+        self.worker_seconds = 0.0
+        self.round_trip_seconds = 0.0
+
+    def start(self, timeout: float = DETECTION_PROCESS_TIMEOUT) -> None:
+        """
+        워커 프로세스 시작 (첫 프레임이 게시될 때까지 대기)
+
+        Args:
+            timeout: 첫 프레임 대기 한도 (초)
+
+        Raises:
+            DetectionProcessError: 워커가 시간 안에 프레임을 게시하지 못했을 때
+        """
+        grab = self.grab or ImageDetector.grab_screen
+        shape = grab().shape
+        self.buffer = SharedFrameBuffer(shape, self.slots)
+
+        # 스토리 프로세스에 스레드가 있으므로 fork 대신 spawn (모든 플랫폼에서 같은 동작)
+        context = multiprocessing.get_context('spawn')
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self.buffer.name, shape, self.slots, self._requests, self._results,
+                  self.interval, self.grab, self.initializer),
+            name="detection-worker",
+            daemon=True
+        )
+        self._process.start()
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="detection-results", daemon=True)
+        self._dispatcher.start()
+
+        deadline = time.perf_counter() + timeout
+        while self.buffer.sequence == 0:
+            if not self._process.is_alive() or time.perf_counter() > deadline:
+                self.stop()
+                raise DetectionProcessError("Detection worker did not publish a frame")
+            time.sleep(0.01)
+
+    def _dispatch_loop(self) -> None:
+        """결과 큐를 읽어 요청별 Future에 전달 (워커가 죽으면 남은 요청 모두 실패 처리)"""
+        while True:
+            try:
+                request_id, value, fired, error, _, seconds = self._results.get(timeout=0.5)
+            except queue.Empty:
+                if self._process is None or not self._process.is_alive():
+                    break
+                continue
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+                self.worker_seconds += seconds
+            if future is None or not future.set_running_or_notify_cancel():
+                continue
+            if error is None:
+                future.set_result((value, fired))
+            else:
+                future.set_exception(DetectionProcessError(error))
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(DetectionProcessError("Detection worker exited"))
+
+    def get_frame(self, area: Optional[Region] = None) -> np.ndarray:
+        """
+        최신 프레임 (ImageDetector.frame_source와 같은 시그니처)
+
+        Args:
+            area: 영역 (x1, y1, x2, y2), None이면 전체
+
+        Returns:
+            BGR 프레임 사본
+        """
+        if self.buffer is None:
+            raise RuntimeError("Detection process is not started")
+        return self.buffer.read(area)[0]
+
+    def submit(self, condition: Condition, area: Optional[Region] = None) -> Future:
+        """
+        조건 평가 요청
+
+        Args:
+            condition: 평가할 조건 (pickle 가능해야 함)
+            area: 캡처 영역
+
+        Returns:
+            (조건 값, 만족한 조건 이름)을 담을 Future
+        """
+        if self._closed:
+            raise RuntimeError("Detection process is closed")
+        future: Future = Future()
+        request_id = next(self._ids)
+        with self._lock:
+            self._pending[request_id] = future
+            self.request_count += 1
+        self._requests.put((request_id, condition, area))
+        return future
+
+    def evaluate(self, condition: Condition, area: Optional[Region] = None, timeout: Optional[float] = None) -> Any:
+        """조건을 최신 프레임에서 한 번 평가 (값만 반환, 인자와 예외는 evaluate_fired() 참고)"""
+        return self.evaluate_fired(condition, area, timeout)[0]
+
+    def evaluate_fired(
+        self,
+        condition: Condition,
+        area: Optional[Region] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        조건을 최신 프레임에서 한 번 평가하고 만족한 조건 이름도 반환
+
+        Condition.remote가 False인 조건(함수 조건, 이전 프레임을 기억하는 조건)은
+        공유 메모리 프레임으로 이 프로세스에서 평가합니다.
+
+        Args:
+            condition: 평가할 조건
+            area: 캡처 영역
+            timeout: 응답 대기 한도 (초, None이면 기본값)
+
+        Returns:
+            (조건 값 (만족하지 않으면 None/False), 만족한 조건 이름 (condition.fired()))
+            - 워커는 조건의 복사본을 평가하므로 이쪽 조건의 fired()는 갱신되지 않음
+
+        Raises:
+            DetectionProcessError: 워커에서 평가가 실패했거나 워커가 종료되었을 때
+            concurrent.futures.TimeoutError: 시간 안에 응답이 없을 때
+        """
+        if not condition.remote:
+            with self._lock:
+                self.local_count += 1
+            value = condition.evaluate(Frame(area))
+            return value, condition.fired()
+
+        started = time.perf_counter()
+        future = self.submit(condition, area)
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except Exception:
+            future.cancel()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.round_trip_seconds += elapsed
+
+    def is_alive(self) -> bool:
+        """워커 프로세스 실행 여부"""
+        return self._process is not None and self._process.is_alive()
+
+    def get_stats(self) -> Dict[str, float]:
+        """요청 수와 평균 왕복/워커 처리 시간 (ms), 게시한 프레임 수"""
+        with self._lock:
+            count, local = self.request_count, self.local_count
+            round_trip, worker = self.round_trip_seconds, self.worker_seconds
+        requests = max(1, count)
+        return {
+            'requests': count,
+            'local': local,
+            'avg_round_trip_ms': round_trip / requests * 1000,
+            'avg_worker_ms': worker / requests * 1000,
+            'frames': self.buffer.sequence if self.buffer is not None else 0
+        }
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """워커 종료 및 공유 메모리 삭제"""
+        if self._process is None:
+            return
+        self._closed = True
+        try:
+            self._requests.put(None)
+        except (OSError, ValueError):
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout)
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout)
+        self._process = None
+        if ImageDetector.frame_source == self.get_frame:
+            ImageDetector.frame_source = None
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Glyph Template Digit Recognizer
+고정 게임 폰트용 글리프 템플릿 숫자 인식기 (Tesseract 없이 빠른 경로)
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import GLYPH_SIZE, GLYPH_MIN_CONFIDENCE, GLYPH_MIN_AREA
+
+
+def to_white_on_black(binary: np.ndarray) -> np.ndarray:
+    """
+    이진화 이미지를 흰 글자/검은 배경으로 통일 (테두리 픽셀 기준으로 배경 판정)
+
+    Args:
+        binary: 이진화 이미지 (0/255)
+
+    Returns:
+        글자가 255인 이진화 이미지
+    """
+    border = np.concatenate([binary[0, :], binary[-1, :], binary[:, 0], binary[:, -1]])
+    if border.mean() >= 128:
+        return cv2.bitwise_not(binary)
+    return binary
+
+
+class DigitRecognizer:
+    """연결 요소 분할 + 벡터화 NCC 글리프 분류 숫자 인식기"""
+
+    def __init__(
+        self,
+        templates: np.ndarray,
+        labels: np.ndarray,
+        min_confidence: float = GLYPH_MIN_CONFIDENCE,
+        glyph_size: Tuple[int, int] = GLYPH_SIZE
+    ):
+        """
+        Args:
+            templates: 정규화된 글리프 벡터 (N x W*H, float32)
+            labels: 각 글리프의 숫자 문자 ('0' ~ '9') 배열
+            min_confidence: 이 값 미만이면 인식 실패로 간주 (Tesseract로 대체)
+            glyph_size: 글리프 정규화 크기 (width, height)
+        """
+        self.templates = np.asarray(templates, dtype=np.float32)
+        self.labels = np.asarray(labels)
+        self.min_confidence = min_confidence
+        self.glyph_size = tuple(glyph_size)
+
+    @classmethod
+    def load(cls, path: str, min_confidence: float = GLYPH_MIN_CONFIDENCE) -> 'DigitRecognizer':
+        """
+        글리프 뱅크 파일(.npz)에서 인식기 생성
+
+        Args:
+            path: tools/build_glyph_bank.py로 만든 글리프 뱅크 경로
+            min_confidence: 최소 신뢰도
+        """
+        with np.load(path) as data:
+            return cls(
+                data['templates'],
+                data['labels'],
+                min_confidence,
+                tuple(int(v) for v in data['glyph_size'])
+            )
+
+    @classmethod
+    def build(
+        cls,
+        samples: List[Tuple[np.ndarray, str]],
+        glyph_size: Tuple[int, int] = GLYPH_SIZE
+    ) -> Tuple['DigitRecognizer', List[int]]:
+        """
+        라벨이 붙은 숫자 이미지들로 글리프 뱅크 학습
+
+        Args:
+            samples: [(이진화 이미지, 숫자 문자열), ...]
+            glyph_size: 글리프 정규화 크기 (width, height)
+
+        Returns:
+            (인식기, 건너뛴 샘플 인덱스 리스트) - 분할된 글리프 수가
+            라벨 길이와 다른 샘플은 건너뜀
+        """
+        vectors = []
+        labels = []
+        skipped = []
+
+        for index, (binary, label) in enumerate(samples):
+            boxes = cls.segment(binary)
+            if len(boxes) != len(label) or not label.isdigit():
+                skipped.append(index)
+                continue
+            vectors.append(cls.normalize_glyphs(binary, boxes, glyph_size))
+            labels.extend(label)
+
+        if vectors:
+            templates = np.vstack(vectors)
+        else:
+            templates = np.zeros((0, glyph_size[0] * glyph_size[1]), dtype=np.float32)
+
+        return cls(templates, np.array(labels), glyph_size=glyph_size), skipped
+
+    def save(self, path: str) -> None:
+        """글리프 뱅크를 .npz 파일로 저장"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        np.savez_compressed(
+            path,
+            templates=self.templates,
+            labels=self.labels,
+            glyph_size=np.array(self.glyph_size)
+        )
+
+    @staticmethod
+    def segment(binary: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """
+        이진화 ROI를 글리프 단위로 분할
+
+        Args:
+            binary: 이진화 이미지
+
+        Returns:
+            [(x, y, w, h), ...] 왼쪽부터 정렬된 글리프 박스
+        """
+        foreground = to_white_on_black(binary)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(foreground, connectivity=8)
+
+        boxes = [
+            tuple(int(v) for v in stats[i, :4])
+            for i in range(1, count)
+            if stats[i, cv2.CC_STAT_AREA] >= GLYPH_MIN_AREA
+        ]
+        if not boxes:
+            return []
+
+        # 가로로 겹치는 요소는 하나의 글리프로 병합 (끊어진 획 처리)
+        boxes.sort()
+        merged = [list(boxes[0])]
+        for x, y, w, h in boxes[1:]:
+            mx, my, mw, mh = merged[-1]
+            overlap = min(mx + mw, x + w) - max(mx, x)
+            if overlap > min(mw, w) // 2:
+                x2, y2 = max(mx + mw, x + w), max(my + mh, y + h)
+                mx, my = min(mx, x), min(my, y)
+                merged[-1] = [mx, my, x2 - mx, y2 - my]
+            else:
+                merged.append([x, y, w, h])
+
+        # 쉼표/점 등 낮은 요소 제거 (가장 큰 글리프 높이의 절반 미만)
+        max_h = max(h for _, _, _, h in merged)
+        return [tuple(b) for b in merged if b[3] >= max_h // 2]
+
+    @staticmethod
+    def normalize_glyphs(
+        binary: np.ndarray,
+        boxes: List[Tuple[int, int, int, int]],
+        glyph_size: Tuple[int, int] = GLYPH_SIZE
+    ) -> np.ndarray:
+        """
+        글리프 박스를 고정 크기로 잘라 평균 0, 노름 1 벡터로 변환
+
+        Returns:
+            (len(boxes), W*H) float32 행렬
+        """
+        foreground = to_white_on_black(binary)
+        vectors = np.zeros((len(boxes), glyph_size[0] * glyph_size[1]), dtype=np.float32)
+
+        for i, (x, y, w, h) in enumerate(boxes):
+            glyph = cv2.resize(foreground[y:y+h, x:x+w], glyph_size, interpolation=cv2.INTER_AREA)
+            vec = glyph.astype(np.float32).ravel()
+            vec -= vec.mean()
+            norm = np.linalg.norm(vec)
+            if norm > 0:
+                vectors[i] = vec / norm
+
+        return vectors
+
+    def recognize_binary(self, binary: np.ndarray) -> Tuple[Optional[int], float]:
+        """
+        이진화 ROI에서 숫자 인식
+
+        Args:
+            binary: 이진화 이미지 (OCRProcessor.preprocess_for_digits 결과)
+
+        Returns:
+            (숫자, 신뢰도) - 글리프가 없으면 (None, 0.0).
+            신뢰도는 글리프별 최고 NCC 점수 중 최솟값
+        """
+        boxes = self.segment(binary)
+        if not boxes or len(self.templates) == 0:
+            return None, 0.0
+
+        vectors = self.normalize_glyphs(binary, boxes, self.glyph_size)
+
+        # 모든 글리프 x 모든 템플릿 NCC를 행렬곱 한 번으로 계산
+        scores = vectors @ self.templates.T
+        best = scores.argmax(axis=1)
+        confidence = float(scores[np.arange(len(boxes)), best].min())
+
+        digits = ''.join(str(label) for label in self.labels[best])
+        return int(digits), confidence
+
+    def recognize(self, binary: np.ndarray) -> Optional[int]:
+        """신뢰도가 충분할 때만 숫자 반환 (아니면 None)"""
+        value, confidence = self.recognize_binary(binary)
+        if value is not None and confidence >= self.min_confidence:
+            return value
+        return None
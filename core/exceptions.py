@@ -79,3 +79,8 @@ class CoordinateOutOfBoundsError(AutomationError):
         else:
             message = f"Coordinates ({x}, {y}) out of bounds"
         super().__init__(message)
+
+
+class DetectionProcessError(AutomationError):
+    """Raised when the detection worker process fails or exits"""
+    pass
@@ -4,7 +4,8 @@ Image Detection Module
 이미지 감지 및 템플릿 매칭 모듈
 """
 
-from typing import Optional, Tuple, List
+import os
+from typing import Callable, Dict, Optional, Tuple, List
 import cv2
 import numpy as np
 import pyautogui
@@ -13,18 +14,80 @@ from PIL import Image
 from .constants import (
     IMAGE_CONFIDENCE_THRESHOLD,
     TEMPLATE_MATCH_THRESHOLD,
-    DUPLICATE_DETECTION_THRESHOLD_RATIO
+    DUPLICATE_DETECTION_THRESHOLD_RATIO,
+    COLOR_BLOB_SCALE_TOLERANCE,
+    COLOR_BLOB_MIN_FILL,
+    COLOR_BLOB_DOWNSAMPLE,
+    IMAGES_DIR,
+    SCENES_DIR
 )
 from .exceptions import TemplateLoadError
+from .subtemplate import SubTemplateIndex
+from .pixel_signature import PixelSignature
+from .color_prefilter import ColorPrefilter
+from .asset_manifest import AssetManifest, AssetSpec
+from .scale_profile import ScaleProfile, calibrate_scale, resize_template
+from .asset_bundle import AssetBundle
+from .tiled_match import TiledMatcher
+from .match_engine import MatchEngine, ScoreMap
 
 
 class ImageDetector:
     """이미지 감지 및 템플릿 매칭 클래스"""
 
+    # 공유 화면 캡처 함수 (area -> BGR 이미지), None이면 호출마다 직접 캡처
+    frame_source: Optional[Callable[[Optional[Tuple[int, int, int, int]]], np.ndarray]] = None
+
+    # 판별 부분 템플릿 매니페스트 (None이면 전체 템플릿으로 매칭)
+    subtemplates: Optional[SubTemplateIndex] = None
+
+    # 미리 디코딩된 템플릿 번들 (mmap, None이면 PNG 디코딩)
+    bundle: Optional[AssetBundle] = None
+
+    # 화면 배율에 맞춘 템플릿 배율 (configure_scale_profile로 보정)과 로드된 템플릿 캐시
+    template_scale: float = 1.0
+    _template_cache: Dict[str, np.ndarray] = {}
+
+    # 요소별 탐지 방식 매니페스트 (None이면 모든 요소를 템플릿 매칭)
+    manifest: Optional[AssetManifest] = None
+
+    # 색 존재 사전 필터 (None이면 항상 화면 전체 매칭)
+    color_prefilter: Optional[ColorPrefilter] = None
+
+    # 큰 검색 영역 타일 병렬 매칭 (None이면 항상 한 번에 매칭)
+    tiled_matcher: Optional[TiledMatcher] = None
+
+    # 프레임 수명 동안 점수 맵을 공유하는 매칭 엔진 (처음 사용할 때 생성)
+    match_engine: Optional[MatchEngine] = None
+
+    # 템플릿 경로별 희소 픽셀 시그니처 (sparse 모드, 처음 사용할 때 생성)
+    _signatures: Dict[str, PixelSignature] = {}
+
+    # (템플릿 경로, 배율)별 판별 패치: (원본 템플릿, 패치, 중심 오프셋)
+    # 같은 패치 배열을 돌려줘야 색 사전 필터/점수 맵 캐시가 템플릿별로 적중
+    _patches: Dict[Tuple[str, float], Tuple[np.ndarray, np.ndarray, Tuple[int, int]]] = {}
+
+    @classmethod
+    def configure_subtemplates(cls, path: Optional[str]) -> Optional[SubTemplateIndex]:
+        """
+        판별 부분 템플릿 매니페스트 로드 (tools/analyze_subtemplates.py로 생성)
+
+        Args:
+            path: 매니페스트 파일 경로 (None이거나 파일이 없으면 사용 안 함)
+
+        Returns:
+            로드된 SubTemplateIndex 또는 None
+        """
+        cls.subtemplates = None
+        cls._patches = {}
+        if path and os.path.exists(path):
+            cls.subtemplates = SubTemplateIndex.load(path)
+        return cls.subtemplates
+
     @staticmethod
     def load_template(template_path: str) -> np.ndarray:
         """
-        템플릿 이미지 로드
+        템플릿 이미지 로드 (template_scale 배율로 변환, 경로별 캐시)
 
         Args:
             template_path: 템플릿 이미지 경로
@@ -35,11 +98,332 @@ class ImageDetector:
         Raises:
             TemplateLoadError: 템플릿 로드 실패 시
         """
-        template = cv2.imread(template_path)
+        key = os.path.normpath(template_path)
+        template = ImageDetector._template_cache.get(key)
+        if template is not None:
+            return template
+
+        template = ImageDetector._load_original(template_path)
         if template is None:
             raise TemplateLoadError(template_path)
+        template = resize_template(template, ImageDetector.template_scale)
+        ImageDetector._template_cache[key] = template
+        ImageDetector._seed_dominant_hue(template_path, template)
         return template
 
+    @staticmethod
+    def _seed_dominant_hue(template_path: str, template: np.ndarray) -> None:
+        """
+        번들 메타데이터의 대표 색상을 사전 필터 캐시에 등록 (탐지 중 HSV 히스토그램 계산 생략)
+
+        대표 색상 범위와 비율은 배율을 바꿔도 거의 같으므로 변환한 템플릿에도 그대로 사용합니다.
+        """
+        prefilter, bundle = ImageDetector.color_prefilter, ImageDetector.bundle
+        if prefilter is None or bundle is None or bundle.is_stale(template_path):
+            return
+        meta = bundle.metadata(template_path)
+        hue = meta.get('dominant_hue')
+        prefilter.seed_dominant_hue(template, (tuple(hue), meta['dominant_ratio']) if hue else None)
+
+    @staticmethod
+    def _load_original(template_path: str) -> Optional[np.ndarray]:
+        """원본 배율 템플릿 (번들에 최신 항목이 있으면 복사 없이, 없으면 PNG 디코딩)"""
+        bundle = ImageDetector.bundle
+        if bundle is not None and template_path in bundle and not bundle.is_stale(template_path):
+            return bundle.get(template_path)
+        return cv2.imread(template_path)
+
+    @staticmethod
+    def load_template_gray(template_path: str) -> np.ndarray:
+        """
+        그레이스케일 템플릿 로드 (원본 배율이면 번들의 그레이스케일 사용)
+
+        Raises:
+            TemplateLoadError: 템플릿 로드 실패 시
+        """
+        bundle = ImageDetector.bundle
+        if (ImageDetector.template_scale == 1.0 and bundle is not None
+                and template_path in bundle and not bundle.is_stale(template_path)):
+            return bundle.get(template_path, gray=True)
+        return cv2.cvtColor(ImageDetector.load_template(template_path), cv2.COLOR_BGR2GRAY)
+
+    @classmethod
+    def configure_bundle(cls, path: Optional[str]) -> Optional[AssetBundle]:
+        """
+        템플릿 번들 열기 (tools/build_asset_bundle.py로 생성)
+
+        Args:
+            path: 번들 파일 경로 (None이거나 파일이 없으면 사용 안 함)
+
+        Returns:
+            열린 AssetBundle 또는 None (형식이 다르면 None)
+        """
+        if cls.bundle is not None:
+            cls.bundle.close()
+        cls.bundle = None
+        cls._template_cache = {}
+        cls._patches = {}
+
+        if path and os.path.exists(path):
+            try:
+                cls.bundle = AssetBundle(path)
+            except ValueError:
+                cls.bundle = None
+        return cls.bundle
+
+    @staticmethod
+    def list_templates(directory: str = IMAGES_DIR) -> List[str]:
+        """
+        템플릿 이미지 경로 목록 (하위 폴더 포함, 씬 기준 캡처 제외)
+
+        Args:
+            directory: 템플릿 폴더
+
+        Returns:
+            정렬된 경로 리스트
+        """
+        paths = []
+        scenes = os.path.normpath(SCENES_DIR)
+        for root, _, files in os.walk(directory):
+            if os.path.normpath(root).startswith(scenes):
+                continue
+            for filename in files:
+                if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
+                    paths.append(os.path.join(root, filename).replace('\\', '/'))
+        return sorted(paths)
+
+    @classmethod
+    def configure_scale(cls, scale: float, template_paths: Optional[List[str]] = None) -> int:
+        """
+        템플릿 배율 설정 후 템플릿을 미리 변환해 캐시
+
+        Args:
+            scale: 템플릿 배율 (화면 픽셀 / 템플릿 픽셀)
+            template_paths: 미리 로드할 템플릿 경로 (None이면 assets/images 전체)
+
+        Returns:
+            미리 로드한 템플릿 수
+        """
+        cls.template_scale = scale
+        cls._template_cache = {}
+        cls._signatures = {}
+        cls._patches = {}
+
+        loaded = 0
+        for path in template_paths if template_paths is not None else cls.list_templates():
+            try:
+                cls.load_template(path)
+                loaded += 1
+            except TemplateLoadError:
+                pass
+        return loaded
+
+    @classmethod
+    def configure_scale_profile(
+        cls,
+        profile_path: Optional[str],
+        auto_calibrate: bool = False,
+        template_paths: Optional[List[str]] = None,
+        screen: Optional[np.ndarray] = None,
+        force: bool = False,
+        area: Optional[Tuple[int, int, int, int]] = None
+    ) -> Tuple[float, bool]:
+        """
+        해상도별 배율 프로필 적용 (없으면 한 번 보정 후 저장)
+
+        Args:
+            profile_path: 프로필 파일 경로 (None이면 저장하지 않음)
+            auto_calibrate: 프로필에 없을 때 현재 화면으로 보정할지 여부 (전체 템플릿 x 배율 탐색이라 느림)
+            template_paths: 보정/캐시할 템플릿 경로 (None이면 assets/images 전체)
+            screen: 보정에 쓸 화면 (None이면 전체 화면 캡처)
+            force: 저장된 결과가 있어도 다시 보정
+            area: 보정에 쓸 영역 (x1, y1, x2, y2, 예: Detection Area), None이면 화면 전체
+                  (프로필 키는 항상 전체 화면 해상도)
+
+        Returns:
+            (적용한 배율, 이번에 새로 보정했는지 여부)
+            - 보정하지 못한 결과(템플릿 없음, 배율 구분 안 됨)도 저장해 다음 실행에서 다시 보정하지 않음
+        """
+        paths = template_paths if template_paths is not None else cls.list_templates()
+        if screen is None:
+            screen = cls.grab_screen()
+        resolution = (screen.shape[1], screen.shape[0])
+
+        profile = ScaleProfile.load(profile_path) if profile_path else ScaleProfile()
+        key = profile.make_key(resolution, paths)
+        scale = profile.get(key)
+
+        calibrated = False
+        if (force or key not in profile) and auto_calibrate and paths:
+            if area is not None:
+                x1, y1, x2, y2 = area
+                screen = screen[y1:y2, x1:x2]
+            originals = [t for t in (cls._load_original(p) for p in paths) if t is not None]
+            found, score = calibrate_scale(screen, originals)
+            # 다시 보정해도 못 찾았으면 기존 배율 유지
+            if found is not None or key not in profile:
+                profile.set(key, found, score)
+                profile.save()
+            if found is not None:
+                scale, calibrated = found, True
+
+        scale = scale or 1.0
+        cls.configure_scale(scale, paths)
+        return scale, calibrated
+
+    @classmethod
+    def configure_manifest(cls, path: Optional[str]) -> Optional[AssetManifest]:
+        """
+        에셋 매니페스트 로드
+
+        Args:
+            path: 매니페스트 파일 경로 (None이거나 파일이 없으면 사용 안 함)
+
+        Returns:
+            로드된 AssetManifest 또는 None
+        """
+        cls.manifest = None
+        if path and os.path.exists(path):
+            cls.manifest = AssetManifest.load(path)
+        return cls.manifest
+
+    @classmethod
+    def configure_color_prefilter(cls, enabled: bool = True) -> Optional[ColorPrefilter]:
+        """
+        색 존재 사전 필터 설정
+
+        Args:
+            enabled: True면 find_template/find_all_templates 전에 템플릿 대표 색이
+                     충분한 창만 남김
+
+        Returns:
+            설정된 ColorPrefilter 또는 None
+        """
+        cls.color_prefilter = ColorPrefilter() if enabled else None
+        # 이미 캐시한 템플릿은 번들의 대표 색상으로 미리 채움
+        for path, template in list(cls._template_cache.items()):
+            cls._seed_dominant_hue(path, template)
+        return cls.color_prefilter
+
+    @classmethod
+    def configure_tiling(
+        cls,
+        enabled: bool = True,
+        tile_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        sample_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[TiledMatcher]:
+        """
+        타일 병렬 매칭 설정
+
+        Args:
+            enabled: True면 큰 검색 영역을 겹치는 타일로 나눠 스레드 풀에서 매칭
+            tile_size: 타일 크기 (None이면 시작 시 벤치마크로 자동 조정)
+            workers: 스레드 수 (None이면 자동 조정)
+            sample_size: 자동 조정 벤치마크 검색 영역 (width, height), 실제 Detection Area 크기
+                         (None이면 TILE_BENCHMARK_SIZE)
+
+        Returns:
+            설정된 TiledMatcher 또는 None (비활성화, 또는 타일 매칭이 더 느린 환경)
+        """
+        if cls.tiled_matcher is not None:
+            cls.tiled_matcher.close()
+        cls.tiled_matcher = None
+
+        if enabled:
+            if tile_size and workers:
+                cls.tiled_matcher = TiledMatcher(tile_size, workers)
+            else:
+                cls.tiled_matcher = TiledMatcher.autotune(sample_size=sample_size, max_workers=workers)
+        return cls.tiled_matcher
+
+    @staticmethod
+    def match_template(screen: np.ndarray, template: np.ndarray) -> np.ndarray:
+        """
+        TM_CCOEFF_NORMED 매칭 결과 맵 (타일 병렬 매칭이 설정되어 있으면 타일로 나눠 계산)
+
+        Returns:
+            (H - h + 1, W - w + 1) float32 결과 맵
+        """
+        matcher = ImageDetector.tiled_matcher
+        if matcher is None:
+            return cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        return matcher.match(screen, template)
+
+    @staticmethod
+    def _match_windows(screen: np.ndarray, template: np.ndarray) -> List[Tuple[np.ndarray, int, int]]:
+        """
+        사전 필터를 통과한 창마다 템플릿 매칭
+
+        Returns:
+            [(매칭 결과, x 오프셋, y 오프셋), ...] (필터가 없으면 화면 전체 한 번)
+        """
+        prefilter = ImageDetector.color_prefilter
+        windows = prefilter.windows(screen, template) if prefilter is not None else None
+        if windows is None:
+            return [(ImageDetector.match_template(screen, template), 0, 0)]
+
+        return [
+            (ImageDetector.match_template(screen[y1:y2, x1:x2], template), x1, y1)
+            for x1, y1, x2, y2 in windows
+        ]
+
+    @staticmethod
+    def score_map(screen: np.ndarray, template: np.ndarray) -> ScoreMap:
+        """
+        (프레임, 템플릿) 점수 맵 (같은 프레임에서 다시 찾으면 matchTemplate 생략)
+
+        Args:
+            screen: 화면 이미지 (프레임 또는 프레임의 잘린 뷰)
+            template: 템플릿 이미지
+
+        Returns:
+            best() / peaks() / above() 질의를 지원하는 ScoreMap
+        """
+        if ImageDetector.match_engine is None:
+            ImageDetector.match_engine = MatchEngine(ImageDetector._match_windows)
+        return ImageDetector.match_engine.score_map(screen, template)
+
+    @staticmethod
+    def compact_template(template_path: str, template: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        매칭에 쓸 템플릿 선택 (매니페스트에 판별 패치가 있으면 패치)
+
+        Args:
+            template_path: 템플릿 이미지 경로 (매니페스트 키)
+            template: 로드된 전체 템플릿
+
+        Returns:
+            (매칭용 템플릿, 좌상단에서 전체 요소 중심까지의 오프셋)
+            - 패치는 (경로, 배율)별로 한 번만 잘라 같은 배열을 재사용
+        """
+        key = (template_path, ImageDetector.template_scale)
+        cached = ImageDetector._patches.get(key)
+        if cached is not None and cached[0] is template:
+            return cached[1], cached[2]
+
+        patch, center_offset = ImageDetector._cut_patch(template_path, template)
+        ImageDetector._patches[key] = (template, patch, center_offset)
+        return patch, center_offset
+
+    @staticmethod
+    def _cut_patch(template_path: str, template: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """compact_template()의 패치 자르기 (캐시 없음)"""
+        h, w = template.shape[:2]
+        index = ImageDetector.subtemplates
+        sub = index.get(template_path) if index is not None else None
+        if sub is None:
+            return template, (w // 2, h // 2)
+
+        # 템플릿 배율이 바뀌었으면 패치 박스도 같은 배율로 변환
+        full_w, full_h = sub.full_size
+        sx, sy = w / float(full_w), h / float(full_h)
+        if abs(sx - sy) > 0.05:
+            return template, (w // 2, h // 2)
+        x1, y1, x2, y2 = (int(round(sub.box[0] * sx)), int(round(sub.box[1] * sy)),
+                          int(round(sub.box[2] * sx)), int(round(sub.box[3] * sy)))
+        return template[y1:y2, x1:x2].copy(), (w // 2 - x1, h // 2 - y1)
+
     @staticmethod
     def capture_screen(area: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
         """
@@ -51,6 +435,9 @@ class ImageDetector:
         Returns:
             OpenCV 형식의 이미지 (BGR)
         """
+        if ImageDetector.frame_source is not None:
+            return ImageDetector.frame_source(area)
+
         screenshot = pyautogui.screenshot()
 
         if area:
@@ -60,11 +447,17 @@ class ImageDetector:
         # PIL Image to OpenCV (BGR)
         return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
 
+    @staticmethod
+    def grab_screen() -> np.ndarray:
+        """전체 화면 직접 캡처 (공유 캡처 생산자용, frame_source 무시)"""
+        return cv2.cvtColor(np.array(pyautogui.screenshot()), cv2.COLOR_RGB2BGR)
+
     @staticmethod
     def find_template(
         screen: np.ndarray,
         template: np.ndarray,
-        confidence: float = IMAGE_CONFIDENCE_THRESHOLD
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        center_offset: Optional[Tuple[int, int]] = None
     ) -> Optional[Tuple[int, int, float]]:
         """
         화면에서 템플릿 찾기
@@ -73,26 +466,62 @@ class ImageDetector:
             screen: 화면 이미지 (OpenCV 형식)
             template: 템플릿 이미지 (OpenCV 형식)
             confidence: 최소 신뢰도 (0.0 ~ 1.0)
+            center_offset: 매칭 좌상단에서 요소 중심까지의 오프셋 (판별 패치용),
+                           None이면 템플릿 중심
 
         Returns:
             (x, y, confidence) 중심 좌표와 신뢰도, 없으면 None
         """
-        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        best = ImageDetector.score_map(screen, template).best()
 
-        if max_val >= confidence:
+        if best is not None and best[2] >= confidence:
             h, w = template.shape[:2]
-            center_x = max_loc[0] + w // 2
-            center_y = max_loc[1] + h // 2
-            return (center_x, center_y, max_val)
+            dx, dy = center_offset or (w // 2, h // 2)
+            x, y, max_val = best
+            return (x + dx, y + dy, max_val)
 
         return None
 
+    @staticmethod
+    def find_template_sparse(
+        screen: np.ndarray,
+        template: np.ndarray,
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        signature: Optional[PixelSignature] = None
+    ) -> Optional[Tuple[int, int, float]]:
+        """
+        희소 픽셀 시그니처로 템플릿 찾기 (고정 배율 UI용, find_template과 같은 반환 형식)
+
+        템플릿의 판별 픽셀 K개로 후보 위치를 거른 뒤, 남은 몇 곳만 작은 창에서
+        matchTemplate로 확인합니다.
+
+        Args:
+            screen: 화면 이미지
+            template: 템플릿 이미지
+            confidence: 최소 신뢰도 (0.0 ~ 1.0)
+            signature: 미리 만든 시그니처 (None이면 새로 생성)
+
+        Returns:
+            (x, y, confidence) 중심 좌표와 신뢰도, 없으면 None
+        """
+        signature = signature or PixelSignature(template)
+        return signature.find(screen, confidence)
+
+    @staticmethod
+    def get_signature(template_path: str, template: np.ndarray) -> PixelSignature:
+        """템플릿 경로별 시그니처 (캐시)"""
+        signature = ImageDetector._signatures.get(template_path)
+        if signature is None or signature.template.shape != template.shape:
+            signature = PixelSignature(template)
+            ImageDetector._signatures[template_path] = signature
+        return signature
+
     @staticmethod
     def find_all_templates(
         screen: np.ndarray,
         template: np.ndarray,
-        threshold: float = TEMPLATE_MATCH_THRESHOLD
+        threshold: float = TEMPLATE_MATCH_THRESHOLD,
+        center_offset: Optional[Tuple[int, int]] = None
     ) -> List[Tuple[int, int, float]]:
         """
         화면에서 모든 템플릿 매칭 위치 찾기
@@ -101,24 +530,146 @@ class ImageDetector:
             screen: 화면 이미지
             template: 템플릿 이미지
             threshold: 최소 신뢰도
+            center_offset: 매칭 좌상단에서 요소 중심까지의 오프셋, None이면 템플릿 중심
 
         Returns:
             [(x, y, confidence), ...] 중심 좌표와 신뢰도 리스트
         """
-        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-        locations = np.where(result >= threshold)
-
         h, w = template.shape[:2]
-        matches = []
+        dx, dy = center_offset or (w // 2, h // 2)
+        return [
+            (x + dx, y + dy, confidence)
+            for x, y, confidence in ImageDetector.score_map(screen, template).above(threshold)
+        ]
 
-        for pt in zip(*locations[::-1]):
-            x, y = pt
-            confidence = result[y, x]
-            center_x = x + w // 2
-            center_y = y + h // 2
-            matches.append((center_x, center_y, confidence))
+    @staticmethod
+    def find_color_blobs(
+        screen: np.ndarray,
+        hsv_lower: Tuple[int, int, int],
+        hsv_upper: Tuple[int, int, int],
+        size: Tuple[int, int],
+        scale_tolerance: float = COLOR_BLOB_SCALE_TOLERANCE,
+        min_fill: float = COLOR_BLOB_MIN_FILL,
+        downsample: int = COLOR_BLOB_DOWNSAMPLE
+    ) -> List[Tuple[int, int, float]]:
+        """
+        HSV 색 덩어리로 단색 버튼 찾기 (템플릿 상관 없음)
 
-        return matches
+        Args:
+            screen: 화면 이미지 (BGR)
+            hsv_lower: HSV 하한 (H 0~179, H가 상한보다 크면 0/180 경계를 넘는 범위)
+            hsv_upper: HSV 상한
+            size: 기준 크기 (width, height)
+            scale_tolerance: 크기 허용 오차 비율 (0.2면 0.8배 ~ 1.2배)
+            min_fill: 박스 중 색 픽셀 최소 비율 (글자 구멍은 닫기 연산으로 메움)
+            downsample: 축소 배율 (덩어리가 충분히 크면 축소한 화면에서 탐지)
+
+        Returns:
+            [(x, y, fill), ...] 중심 좌표와 채움 비율, 채움 비율 내림차순
+        """
+        width, height = size
+        factor = downsample if downsample > 1 and min(width, height) >= 8 * downsample else 1
+        if factor > 1:
+            small = cv2.resize(screen, (screen.shape[1] // factor, screen.shape[0] // factor),
+                               interpolation=cv2.INTER_NEAREST)
+        else:
+            small = screen
+
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        lower, upper = tuple(hsv_lower), tuple(hsv_upper)
+        if lower[0] <= upper[0]:
+            mask = cv2.inRange(hsv, lower, upper)
+        else:
+            mask = cv2.bitwise_or(
+                cv2.inRange(hsv, lower, (179, upper[1], upper[2])),
+                cv2.inRange(hsv, (0, lower[1], lower[2]), upper)
+            )
+
+        # 버튼 글자/아이콘 구멍 메우기
+        k = max(3, min(width, height) // (4 * factor) | 1)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (k, k)))
+
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+        min_w, max_w = width * (1 - scale_tolerance), width * (1 + scale_tolerance)
+        min_h, max_h = height * (1 - scale_tolerance), height * (1 + scale_tolerance)
+        blobs = []
+        for x, y, w, h, area in stats[1:count]:
+            bw, bh = w * factor, h * factor
+            if not (min_w <= bw <= max_w and min_h <= bh <= max_h):
+                continue
+            fill = area / float(w * h)
+            if fill >= min_fill:
+                blobs.append((int(x * factor + bw // 2), int(y * factor + bh // 2), float(fill)))
+
+        blobs.sort(key=lambda b: b[2], reverse=True)
+        return blobs
+
+    @staticmethod
+    def find_asset(
+        screen: np.ndarray,
+        spec: AssetSpec,
+        confidence: Optional[float] = None
+    ) -> Optional[Tuple[int, int, float]]:
+        """
+        매니페스트 선언대로 요소 찾기 (find_template과 같은 반환 형식)
+
+        Args:
+            screen: 화면 이미지
+            spec: 요소 선언
+            confidence: 호출자가 요구한 최소 신뢰도 (None이면 선언된 confidence)
+                        color_blob에 주어지면 덩어리 위치에서 템플릿 NCC로 확인해 같은 기준으로 판정
+
+        Returns:
+            (x, y, confidence) 중심 좌표와 신뢰도 (confidence 없이 찾은 color_blob은 채움 비율), 없으면 None
+        """
+        if spec.detector == 'color_blob':
+            if spec.size is not None:
+                scale = ImageDetector.template_scale
+                size = (int(round(spec.size[0] * scale)), int(round(spec.size[1] * scale)))
+            else:
+                h, w = ImageDetector.load_template(spec.template).shape[:2]
+                size = (w, h)
+            blobs = ImageDetector.find_color_blobs(
+                screen, spec.hsv_lower, spec.hsv_upper, size, spec.scale_tolerance, spec.min_fill
+            )
+            if confidence is None or spec.template is None:
+                return blobs[0] if blobs else None
+            return ImageDetector._confirm_blobs(screen, blobs, spec, confidence)
+
+        if confidence is None:
+            confidence = spec.confidence
+        template = ImageDetector.load_template(spec.template)
+        if spec.detector == 'sparse':
+            signature = ImageDetector.get_signature(spec.template, template)
+            return ImageDetector.find_template_sparse(screen, template, confidence, signature)
+
+        template, center_offset = ImageDetector.compact_template(spec.template, template)
+        return ImageDetector.find_template(screen, template, confidence, center_offset)
+
+    @staticmethod
+    def _confirm_blobs(
+        screen: np.ndarray,
+        blobs: List[Tuple[int, int, float]],
+        spec: AssetSpec,
+        confidence: float
+    ) -> Optional[Tuple[int, int, float]]:
+        """색 덩어리 주변 작은 창에서만 템플릿 NCC 확인 (채움 비율 순, 처음 통과한 덩어리)"""
+        template = ImageDetector.load_template(spec.template)
+        h, w = template.shape[:2]
+        margin_x = int(w * spec.scale_tolerance) + 2
+        margin_y = int(h * spec.scale_tolerance) + 2
+        for bx, by, _ in blobs:
+            x1, y1 = max(0, bx - w // 2 - margin_x), max(0, by - h // 2 - margin_y)
+            x2 = min(screen.shape[1], bx + w - w // 2 + margin_x)
+            y2 = min(screen.shape[0], by + h - h // 2 + margin_y)
+            if x2 - x1 < w or y2 - y1 < h:
+                continue
+            _, max_val, _, max_loc = cv2.minMaxLoc(
+                cv2.matchTemplate(screen[y1:y2, x1:x2], template, cv2.TM_CCOEFF_NORMED))
+            if max_val >= confidence:
+                return (x1 + max_loc[0] + w // 2, y1 + max_loc[1] + h // 2, max_val)
+        return None
 
     @staticmethod
     def remove_duplicates(
@@ -163,28 +714,81 @@ class ImageDetector:
 
         return filtered
 
+    def find_image_in_screen(
+        self,
+        template_path: str,
+        screen: np.ndarray,
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        mode: str = 'ncc'
+    ) -> Optional[Tuple[int, int, float]]:
+        """
+        이미 캡처한 화면에서 이미지 찾기 (find_image_in_area와 같은 탐지 방식 선택)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            screen: 화면 이미지
+            confidence: 최소 신뢰도
+            mode: 'ncc' 또는 'sparse' (매니페스트에 선언된 요소면 선언된 탐지 방식 사용, 신뢰도는 이 값)
+
+        Returns:
+            (x, y, confidence) screen 기준 중심 좌표, 없으면 None
+        """
+        spec = self.manifest.for_template(template_path) if self.manifest is not None else None
+
+        if spec is not None:
+            # 매니페스트에 선언된 요소면 선언된 탐지 방식 사용 (호출자의 신뢰도 기준 유지)
+            return self.find_asset(screen, spec, confidence)
+
+        template = self.load_template(template_path)
+        if mode == 'sparse':
+            signature = self.get_signature(template_path, template)
+            return self.find_template_sparse(screen, template, confidence, signature)
+
+        template, center_offset = self.compact_template(template_path, template)
+        return self.find_template(screen, template, confidence, center_offset)
+
+    @staticmethod
+    def _narrow_area(
+        area: Optional[Tuple[int, int, int, int]],
+        region: Optional[Tuple[int, int, int, int]]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """선언된 기본 영역(Detection Area 기준)으로 검색 영역 좁히기"""
+        if region is None:
+            return area
+        rx1, ry1, rx2, ry2 = region
+        if area:
+            return (area[0] + rx1, area[1] + ry1, min(area[2], area[0] + rx2), min(area[3], area[1] + ry2))
+        return tuple(region)
+
     def find_image_in_area(
         self,
         template_path: str,
         area: Optional[Tuple[int, int, int, int]] = None,
-        confidence: float = IMAGE_CONFIDENCE_THRESHOLD
+        confidence: Optional[float] = None,
+        mode: str = 'ncc'
     ) -> Optional[Tuple[int, int]]:
         """
         영역 내에서 이미지 찾기 (편의 메서드)
 
         Args:
             template_path: 템플릿 이미지 경로
-            area: 검색 영역 (x1, y1, x2, y2)
-            confidence: 최소 신뢰도
+            area: 검색 영역 (x1, y1, x2, y2), 번들 메타데이터에 기본 영역이 있으면 그 영역으로 좁힘
+            confidence: 최소 신뢰도 (None이면 번들 메타데이터의 신뢰도, 없으면 IMAGE_CONFIDENCE_THRESHOLD)
+            mode: 'ncc' - 전체 정규화 상관 (판별 패치가 있으면 패치)
+                  'sparse' - 희소 픽셀 시그니처 (고정 배율 UI)
+                  매니페스트에 이 템플릿이 선언되어 있으면 선언된 탐지 방식 사용 (신뢰도는 confidence)
 
         Returns:
             (x, y) 절대 좌표, 없으면 None
         """
-        try:
-            template = self.load_template(template_path)
-            screen = self.capture_screen(area)
+        meta = self.bundle.metadata(template_path) if self.bundle is not None else None
+        if confidence is None:
+            confidence = meta['confidence'] if meta else IMAGE_CONFIDENCE_THRESHOLD
+        if meta and meta.get('region'):
+            area = self._narrow_area(area, meta['region'])
 
-            result = self.find_template(screen, template, confidence)
+        try:
+            result = self.find_image_in_screen(template_path, self.capture_screen(area), confidence, mode)
 
             if result:
                 x, y, conf = result
@@ -200,3 +804,38 @@ class ImageDetector:
 
         except Exception:
             return None
+
+    def find_asset_in_area(
+        self,
+        name: str,
+        area: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        매니페스트 요소 이름으로 영역 내에서 찾기 (find_image_in_area와 같은 반환 형식)
+
+        Args:
+            name: 매니페스트 요소 이름
+            area: 검색 영역 (x1, y1, x2, y2)
+
+        Returns:
+            (x, y) 절대 좌표, 없으면 None
+        """
+        spec = self.manifest.get(name) if self.manifest is not None else None
+        if spec is None:
+            return None
+
+        # 선언된 기본 영역(Detection Area 기준)으로 좁히기
+        area = self._narrow_area(area, spec.region)
+
+        try:
+            result = self.find_asset(self.capture_screen(area), spec)
+        except Exception:
+            return None
+
+        if not result:
+            return None
+        x, y, _ = result
+        if area:
+            x += area[0]
+            y += area[1]
+        return (x, y)
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-Instance Orchestration
+한 호스트의 여러 게임 창(인스턴스)을 동시에 실행하는 모듈
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .automation import Automation
+from .constants import FRAME_MAX_AGE
+from .image_detector import ImageDetector
+
+Region = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+class FrameProducer:
+    """
+    공유 화면 캡처 생산자
+
+    여러 인스턴스의 캡처 요청을 하나의 전체 화면 캡처로 합칩니다.
+    요청 시점보다 max_age 이상 먼저 시작된 캡처는 돌려주지 않으므로
+    클릭 직후 요청해도 오래된 화면을 받지 않습니다.
+    """
+
+    def __init__(self, grab: Optional[Callable[[], np.ndarray]] = None):
+        """
+        Args:
+            grab: 전체 화면을 BGR 이미지로 반환하는 함수 (None이면 pyautogui 캡처)
+        """
+        self._grab = grab or self._default_grab
+        self._condition = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._frame_started = 0.0
+        self._capturing = False
+        self.capture_count = 0
+        self.request_count = 0
+
+    @staticmethod
+    def _default_grab() -> np.ndarray:
+        return ImageDetector.grab_screen()
+
+    def get_frame(self, area: Optional[Region] = None, max_age: float = FRAME_MAX_AGE) -> np.ndarray:
+        """
+        최근 프레임 반환 (동시 요청은 캡처 한 번을 공유)
+
+        Args:
+            area: 잘라낼 영역 (x1, y1, x2, y2), None이면 전체 화면
+            max_age: 요청 시점 기준 허용하는 캡처 시작 시각의 최대 차이 (초)
+
+        Returns:
+            BGR 이미지 (영역 지정 시 복사본)
+        """
+        oldest = time.perf_counter() - max_age
+
+        with self._condition:
+            self.request_count += 1
+            while True:
+                if self._frame is not None and self._frame_started >= oldest:
+                    return self._crop(self._frame, area)
+                if not self._capturing:
+                    break
+                # 다른 스레드의 캡처가 끝나기를 기다린 뒤 다시 확인
+                self._condition.wait()
+
+            self._capturing = True
+            started = time.perf_counter()
+
+        # 락 밖에서 캡처 (캡처 중에 들어온 요청은 이 결과를 기다림)
+        try:
+            frame = self._grab()
+        except Exception:
+            with self._condition:
+                self._capturing = False
+                self._condition.notify_all()
+            raise
+
+        with self._condition:
+            self._frame = frame
+            self._frame_started = started
+            self._capturing = False
+            self.capture_count += 1
+            self._condition.notify_all()
+
+        return self._crop(frame, area)
+
+    @staticmethod
+    def _crop(frame: np.ndarray, area: Optional[Region]) -> np.ndarray:
+        if area is None:
+            return frame
+        x1, y1, x2, y2 = area
+        return frame[y1:y2, x1:x2].copy()
+
+
+class InputScheduler:
+    """
+    전역 마우스/키보드 입력 직렬화
+
+    입력 한 번(클릭, 키 입력)은 락 안에서 실행하고, 입력 후 대기(delay)는
+    락 밖에서 하므로 한 인스턴스의 대기가 다른 인스턴스의 입력을 막지 않습니다.
+    """
+
+    def __init__(self, automation: Optional[Automation] = None):
+        self.automation = automation or Automation()
+        self._lock = threading.RLock()
+        self.input_count = 0
+
+    @contextmanager
+    def exclusive(self) -> Iterator[Automation]:
+        """
+        여러 입력을 끊김 없이 실행해야 할 때 사용 (예: 클릭 후 바로 키 입력)
+
+        Example:
+            with scheduler.exclusive() as automation:
+                automation.click(x, y)
+                automation.press_key('enter')
+        """
+        with self._lock:
+            yield self.automation
+
+    def run(self, method: str, *args: Any, delay: float = 0, **kwargs: Any) -> Any:
+        """Automation 메서드를 락 안에서 실행하고, delay만큼 락 밖에서 대기"""
+        with self._lock:
+            result = getattr(self.automation, method)(*args, **kwargs)
+            self.input_count += 1
+        if delay > 0:
+            time.sleep(delay)
+        return result
+
+    def for_instance(self, name: str) -> 'ScheduledAutomation':
+        """인스턴스 전용 Automation 대리 객체 생성"""
+        return ScheduledAutomation(self, name)
+
+
+class ScheduledAutomation:
+    """Automation과 같은 인터페이스로 InputScheduler를 거쳐 입력하는 대리 객체"""
+
+    def __init__(self, scheduler: InputScheduler, owner: str):
+        self.scheduler = scheduler
+        self.owner = owner
+
+    def click(self, x: int, y: int, clicks: int = 1, button: str = 'left', delay: float = 0) -> None:
+        self.scheduler.run('click', x, y, clicks=clicks, button=button, delay=delay)
+
+    def double_click(self, x: int, y: int, delay: float = 0) -> None:
+        self.click(x, y, clicks=2, delay=delay)
+
+    def right_click(self, x: int, y: int, delay: float = 0) -> None:
+        self.click(x, y, button='right', delay=delay)
+
+    def move_to(self, x: int, y: int, duration: float = 0.5, delay: float = 0) -> None:
+        self.scheduler.run('move_to', x, y, duration=duration, delay=delay)
+
+    def drag_to(self, x: int, y: int, duration: float = 0.5, delay: float = 0) -> None:
+        self.scheduler.run('drag_to', x, y, duration=duration, delay=delay)
+
+    def press_key(self, key: str, delay: float = 0) -> None:
+        self.scheduler.run('press_key', key, delay=delay)
+
+    def hotkey(self, *keys: str, delay: float = 0) -> None:
+        self.scheduler.run('hotkey', *keys, delay=delay)
+
+    def type_text(self, text: str, interval: float = 0.1) -> None:
+        self.scheduler.run('type_text', text, interval=interval)
+
+    def scroll(self, amount: int, delay: float = 0) -> None:
+        self.scheduler.run('scroll', amount, delay=delay)
+
+    def click_image(self, image_location: Optional[Tuple[int, int, int, int]], delay: float = 0) -> None:
+        self.scheduler.run('click_image', image_location, delay=delay)
+
+    def wait(self, seconds: float) -> None:
+        """대기 (입력 락을 잡지 않음)"""
+        time.sleep(seconds)
+
+    def __getattr__(self, name: str) -> Any:
+        # log 등 입력이 아닌 속성은 원본 Automation으로 위임
+        return getattr(self.scheduler.automation, name)
+
+
+class GameInstance:
+    """게임 창 하나 (영역, 스토리 대기열, 상태)"""
+
+    def __init__(self, name: str, region: Region, stories: Optional[List[Any]] = None):
+        """
+        Args:
+            name: 인스턴스 이름
+            region: 게임 창의 Detection Area (x1, y1, x2, y2)
+            stories: 실행할 스토리 리스트 (StoryBase 인스턴스)
+        """
+        self.name = name
+        self.region = tuple(region)
+        self.queue: Deque[Any] = deque(stories or [])
+        self.status = "ready"  # ready, running, completed, failed
+        self.current_story: Optional[str] = None
+        self.results: List[Dict[str, Any]] = []
+        self.thread: Optional[threading.Thread] = None
+
+    def add_story(self, story: Any) -> None:
+        """스토리를 대기열에 추가"""
+        self.queue.append(story)
+
+    def get_status(self) -> Dict[str, Any]:
+        """현재 상태 반환"""
+        return {
+            'name': self.name,
+            'region': self.region,
+            'status': self.status,
+            'current_story': self.current_story,
+            'pending': len(self.queue),
+            'completed': sum(1 for r in self.results if r['success']),
+            'failed': sum(1 for r in self.results if not r['success'])
+        }
+
+
+class InstanceManager:
+    """여러 인스턴스를 병렬 실행 (캡처/탐지는 공유, 입력은 직렬화)"""
+
+    def __init__(
+        self,
+        automation: Optional[Automation] = None,
+        producer: Optional[FrameProducer] = None,
+        pause_between_stories: float = 0
+    ):
+        """
+        Args:
+            automation: 공유 Automation (입력 스케줄러가 감쌈)
+            producer: 공유 화면 캡처 생산자 (None이면 새로 생성)
+            pause_between_stories: 같은 인스턴스의 스토리 사이 대기 시간 (초)
+        """
+        self.scheduler = InputScheduler(automation)
+        self.producer = producer or FrameProducer()
+        self.pause_between_stories = pause_between_stories
+        self.instances: List[GameInstance] = []
+
+    def add_instance(self, instance: GameInstance) -> GameInstance:
+        """인스턴스 추가"""
+        self.instances.append(instance)
+        return instance
+
+    def _attach(self, instance: GameInstance, story: Any) -> None:
+        """스토리에 인스턴스 영역과 직렬화된 입력 연결"""
+        story.automation = self.scheduler.for_instance(instance.name)
+        story.instance_name = instance.name  # 인스턴스별 체크포인트 파일
+        if hasattr(story, 'set_detection_area'):
+            story.set_detection_area(instance.region)
+        else:
+            story.detection_area = instance.region
+
+    def _run_instance(self, instance: GameInstance) -> None:
+        """인스턴스 스레드 - 대기열의 스토리를 순서대로 실행"""
+        instance.status = "running"
+        while instance.queue:
+            story = instance.queue.popleft()
+            self._attach(instance, story)
+            instance.current_story = story.name
+            self._record(instance, story, story.run())
+            if instance.queue and self.pause_between_stories > 0:
+                time.sleep(self.pause_between_stories)
+        self._finish(instance)
+
+    async def _arun_instance(self, instance: GameInstance, runtime: Any) -> None:
+        """인스턴스 코루틴 - _run_instance()의 AsyncRuntime 버전"""
+        instance.status = "running"
+        while instance.queue:
+            story = instance.queue.popleft()
+            self._attach(instance, story)
+            instance.current_story = story.name
+            self._record(instance, story, await story.arun(runtime))
+            if instance.queue and self.pause_between_stories > 0:
+                await asyncio.sleep(self.pause_between_stories)
+        self._finish(instance)
+
+    @staticmethod
+    def _record(instance: GameInstance, story: Any, result: bool) -> None:
+        """스토리 결과 기록"""
+        instance.results.append({
+            'name': story.name,
+            'status': story.status,
+            'success': result
+        })
+
+    @staticmethod
+    def _finish(instance: GameInstance) -> None:
+        """대기열을 모두 실행한 인스턴스 상태 설정"""
+        instance.current_story = None
+        failed = any(not r['success'] for r in instance.results)
+        instance.status = "failed" if failed else "completed"
+
+    async def run_async(self, runtime: Any) -> None:
+        """
+        모든 인스턴스를 하나의 이벤트 루프에서 실행 (start() + join()의 코루틴 버전)
+
+        Args:
+            runtime: AsyncRuntime (입력은 런타임의 입력 락과 InputScheduler가 함께 직렬화)
+        """
+        ImageDetector.frame_source = self.producer.get_frame
+        try:
+            await asyncio.gather(*(self._arun_instance(instance, runtime) for instance in self.instances))
+        finally:
+            ImageDetector.frame_source = None
+
+    def start(self) -> None:
+        """모든 인스턴스 실행 시작 (공유 캡처 생산자를 ImageDetector에 연결)"""
+        ImageDetector.frame_source = self.producer.get_frame
+
+        for instance in self.instances:
+            instance.thread = threading.Thread(
+                target=self._run_instance, args=(instance,),
+                name=f"instance-{instance.name}", daemon=True
+            )
+            instance.thread.start()
+
+    def is_running(self) -> bool:
+        """실행 중인 인스턴스가 있는지 확인"""
+        return any(i.thread is not None and i.thread.is_alive() for i in self.instances)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        모든 인스턴스 종료 대기
+
+        Returns:
+            모든 인스턴스가 끝났는지 여부
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        for instance in self.instances:
+            if instance.thread is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            instance.thread.join(remaining)
+        finished = not self.is_running()
+        if finished:
+            ImageDetector.frame_source = None
+        return finished
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """인스턴스별 상태"""
+        return [instance.get_status() for instance in self.instances]
+
+    def print_status(self) -> None:
+        """상태를 한 줄로 출력"""
+        parts = []
+        for status in self.get_status():
+            current = status['current_story'] or '-'
+            parts.append(f"{status['name']}: {status['status']} ({current}, "
+                         f"{status['completed']}✓/{status['failed']}✗/{status['pending']}…)")
+        print(f"\r[인스턴스] {' | '.join(parts)} | 캡처 {self.producer.capture_count}"
+              f"/{self.producer.request_count}", end="", flush=True)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Match Engine
+(프레임, 템플릿)별 매칭 점수 맵을 한 번 계산해 프레임이 살아있는 동안 보관하고
+최고 위치 / 모든 피크 / 임계값 질의에 답하는 모듈
+"""
+
+import hashlib
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+Match = Tuple[int, int, float]  # (x, y, score) 매칭 좌상단 좌표와 점수
+WindowResults = List[Tuple[np.ndarray, int, int]]  # [(결과 맵, x 오프셋, y 오프셋), ...]
+
+
+class ScoreMap:
+    """
+    한 (프레임, 템플릿)의 TM_CCOEFF_NORMED 점수 맵
+
+    사전 필터를 쓰면 맵이 여러 창으로 나뉘므로 창별 결과와 오프셋을 그대로 보관합니다.
+    좌표는 모두 매칭에 넘긴 이미지 기준의 매칭 좌상단입니다.
+    """
+
+    def __init__(self, windows: WindowResults, template_size: Tuple[int, int]):
+        """
+        Args:
+            windows: [(결과 맵, x 오프셋, y 오프셋), ...]
+            template_size: 템플릿 크기 (width, height)
+        """
+        self.windows = windows
+        self.template_size = template_size
+        self._best: Optional[Match] = None
+
+    def best(self) -> Optional[Match]:
+        """
+        최고 점수 위치
+
+        Returns:
+            (x, y, score), 매칭할 창이 없으면 None
+        """
+        if self._best is None:
+            best: Optional[Match] = None
+            for result, offset_x, offset_y in self.windows:
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+                if best is None or max_val > best[2]:
+                    best = (max_loc[0] + offset_x, max_loc[1] + offset_y, float(max_val))
+            self._best = best
+        return self._best
+
+    def above(self, threshold: float) -> List[Match]:
+        """
+        임계값 이상인 모든 위치 (창 순서, 창 안에서는 행 우선 순서)
+
+        Args:
+            threshold: 최소 점수
+
+        Returns:
+            [(x, y, score), ...] 창끼리 겹치는 같은 위치는 한 번만
+        """
+        matches = []
+        seen = set()
+        for result, offset_x, offset_y in self.windows:
+            ys, xs = np.where(result >= threshold)
+            for x, y, score in zip(xs, ys, result[ys, xs]):
+                x, y = int(x) + offset_x, int(y) + offset_y
+                if (x, y) in seen:
+                    continue
+                seen.add((x, y))
+                matches.append((x, y, float(score)))
+        return matches
+
+    def peaks(self, threshold: float, min_distance: Optional[Tuple[int, int]] = None) -> List[Match]:
+        """
+        임계값 이상인 국소 최대값 (점수 높은 순으로 고른 뒤 근처 위치 제외)
+
+        Args:
+            threshold: 최소 점수
+            min_distance: 이 거리 (dx, dy) 미만인 위치는 같은 요소로 봄,
+                          None이면 템플릿 크기의 절반
+
+        Returns:
+            [(x, y, score), ...] 화면 순서 (위에서 아래, 왼쪽에서 오른쪽)
+        """
+        if min_distance is None:
+            min_distance = (self.template_size[0] // 2, self.template_size[1] // 2)
+        min_dx, min_dy = min_distance
+
+        picked: List[Match] = []
+        for x, y, score in sorted(self.above(threshold), key=lambda m: -m[2]):
+            if all(abs(px - x) >= min_dx or abs(py - y) >= min_dy for px, py, _ in picked):
+                picked.append((x, y, score))
+        return sorted(picked, key=lambda m: (m[1], m[0]))
+
+
+class MatchEngine:
+    """
+    프레임 수명 동안 점수 맵을 공유하는 매칭 엔진
+
+    find_template, find_all_templates, find_currency_values가 같은 프레임에서 같은 템플릿을
+    찾으면 matchTemplate는 한 번만 실행됩니다. 프레임의 잘린 뷰(frame[y1:y2, x1:x2])는
+    원본 프레임 + 영역으로 풀어 캐시하므로 뷰 객체가 매번 달라도 재사용됩니다.
+    캐시는 원본 프레임 배열이 해제되면 함께 지워집니다.
+    """
+
+    def __init__(self, match_windows: Callable[[np.ndarray, np.ndarray], WindowResults]):
+        """
+        Args:
+            match_windows: (이미지, 템플릿) -> 창별 결과 맵을 계산하는 함수
+                           (ImageDetector._match_windows: 사전 필터 + 타일 매칭)
+        """
+        self.match_windows = match_windows
+        # id(원본 프레임) -> (weakref, {(영역, 템플릿 키): ScoreMap})
+        self._frames: Dict[int, Tuple[weakref.ref, Dict[Tuple[Box, bytes], ScoreMap]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def template_key(template: np.ndarray) -> bytes:
+        """템플릿 내용 키 (같은 내용이면 다른 배열 객체라도 같은 키)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((template.shape, template.dtype.str)).encode('ascii'))
+        digest.update(np.ascontiguousarray(template).data)
+        return digest.digest()
+
+    @staticmethod
+    def resolve(frame: np.ndarray) -> Tuple[np.ndarray, Box]:
+        """
+        잘린 뷰를 (원본 프레임, 영역)으로 변환
+
+        Returns:
+            (원본 배열, (x1, y1, x2, y2)), 단순한 2D 자르기가 아니면 (frame, 전체 영역)
+        """
+        height, width = frame.shape[:2]
+        root = frame.base
+        if (isinstance(root, np.ndarray) and root.ndim == frame.ndim and root.dtype == frame.dtype
+                and root.strides == frame.strides and root.shape[2:] == frame.shape[2:]):
+            offset = frame.__array_interface__['data'][0] - root.__array_interface__['data'][0]
+            y, rest = divmod(offset, root.strides[0])
+            x, remainder = divmod(rest, root.strides[1])
+            if offset >= 0 and remainder == 0 and y + height <= root.shape[0] and x + width <= root.shape[1]:
+                return root, (x, y, x + width, y + height)
+        return frame, (0, 0, width, height)
+
+    def _forget(self, frame_id: int) -> None:
+        with self._lock:
+            self._frames.pop(frame_id, None)
+
+    def score_map(self, frame: np.ndarray, template: np.ndarray) -> ScoreMap:
+        """
+        (프레임, 템플릿) 점수 맵 (같은 프레임에서는 캐시 사용)
+
+        Args:
+            frame: 검색 이미지 (프레임 또는 프레임의 잘린 뷰)
+            template: 템플릿 이미지
+
+        Returns:
+            frame 기준 좌표의 ScoreMap
+        """
+        root, area = self.resolve(frame)
+        key = (area, self.template_key(template))
+        frame_id = id(root)
+
+        with self._lock:
+            entry = self._frames.get(frame_id)
+            if entry is not None and entry[0]() is root:
+                cached = entry[1].get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return cached
+
+        h, w = template.shape[:2]
+        if frame.shape[0] < h or frame.shape[1] < w:
+            windows: WindowResults = []
+        else:
+            windows = self.match_windows(frame, template)
+        score_map = ScoreMap(windows, (w, h))
+
+        with self._lock:
+            self.misses += 1
+            entry = self._frames.get(frame_id)
+            if entry is None or entry[0]() is not root:
+                try:
+                    ref = weakref.ref(root, lambda _, frame_id=frame_id: self._forget(frame_id))
+                except TypeError:
+                    # 약한 참조를 만들 수 없는 배열 (캐시하지 않음)
+                    return score_map
+                entry = (ref, {})
+                self._frames[frame_id] = entry
+            entry[1][key] = score_map
+        return score_map
+
+    def clear(self) -> None:
+        """모든 캐시 삭제 (프레임을 제자리에서 고쳐 쓴 경우 등)"""
+        with self._lock:
+            self._frames = {}
+
+    def get_stats(self) -> Dict[str, float]:
+        """캐시 통계 (적중/실패 수, 보관 중인 프레임 수)"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'frames': len(self._frames)}
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+OCR Result Cache
+이진화된 ROI 내용 해시 기반 OCR 결과 캐시
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+
+from .constants import OCR_CACHE_MAX_ENTRIES
+
+
+# 캐시 미스 표시용 (None 결과도 캐시되므로 별도 센티넬 사용)
+MISS = object()
+
+
+class OCRCache:
+    """LRU 크기 제한 OCR 결과 캐시 (선택적 디스크 저장)"""
+
+    def __init__(
+        self,
+        max_entries: int = OCR_CACHE_MAX_ENTRIES,
+        persist_path: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            persist_path: 캐시 저장 파일 경로 (None이면 메모리에만 유지)
+        """
+        self.max_entries = max(1, max_entries)
+        self.persist_path = persist_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if persist_path:
+            self.load()
+
+    @staticmethod
+    def make_key(binary: np.ndarray, *extra: str) -> str:
+        """
+        이진화 이미지와 부가 정보(설정 문자열 등)로 캐시 키 생성
+
+        Args:
+            binary: 전처리(이진화)된 ROI 이미지
+            extra: 키에 포함할 추가 문자열 (Tesseract 설정, 언어 등)
+
+        Returns:
+            16진수 해시 문자열
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(binary.shape).encode())
+        digest.update(np.ascontiguousarray(binary).tobytes())
+        for item in extra:
+            digest.update(b'\x00')
+            digest.update(item.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """
+        캐시 조회
+
+        Returns:
+            캐시된 값, 없으면 MISS
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return MISS
+
+    def put(self, key: str, value: Any) -> None:
+        """캐시에 값 저장 (LRU 크기 제한 적용)"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def load(self) -> None:
+        """디스크에서 캐시 로드 (파일이 없거나 손상되면 무시)"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        with self._lock:
+            for key, value in data.get('entries', []):
+                self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = False
+
+    def save(self) -> None:
+        """캐시를 디스크에 저장 (변경 사항이 있을 때만)"""
+        if not self.persist_path or not self._dirty:
+            return
+
+        with self._lock:
+            entries = list(self._entries.items())
+            self._dirty = False
+
+        directory = os.path.dirname(self.persist_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # 임시 파일에 쓴 뒤 교체 (중단 시 파일 손상 방지)
+        tmp_path = self.persist_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.persist_path)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+OCR Word Index
+프레임별 OCR 단어 색인 - 여러 trigger_text 조회를 OCR 한 번으로 처리
+"""
+
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import OCR_LANGUAGE, OCR_INDEX_FUZZY_THRESHOLD
+from .ocr_processor import OCRProcessor
+
+Region = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+# 한글 음절 분해용 자모 테이블
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_STRIP_PATTERN = re.compile(r'[\s\W_]+', re.UNICODE)
+
+
+def normalize_token(text: str) -> str:
+    """
+    비교용 토큰 정규화 (NFC, 소문자, 공백/기호 제거)
+
+    예) " 준비 완료! " -> "준비완료"
+    """
+    return _STRIP_PATTERN.sub('', unicodedata.normalize('NFC', text).lower())
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    한글 음절을 자모로 분해 (퍼지 비교용)
+
+    예) "확인" -> "ㅎㅘㄱㅇㅣㄴ" - OCR이 받침 하나를 틀려도 유사도가 크게 떨어지지 않음
+    """
+    result = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(_CHOSEONG[code // 588])
+            result.append(_JUNGSEONG[(code % 588) // 28])
+            if code % 28:
+                result.append(_JONGSEONG[code % 28])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+@dataclass
+class IndexedWord:
+    """색인된 OCR 단어/줄"""
+    text: str
+    box: Region  # 프레임 좌표 (x1, y1, x2, y2)
+    confidence: float
+    token: str
+    jamo: str
+
+
+class OCRWordIndex:
+    """영역별 OCR 결과를 정규화 토큰 -> 박스 역색인으로 유지하는 클래스"""
+
+    def __init__(
+        self,
+        language: str = OCR_LANGUAGE,
+        fuzzy_threshold: float = OCR_INDEX_FUZZY_THRESHOLD
+    ):
+        """
+        Args:
+            language: OCR 언어 (예: 'kor+eng')
+            fuzzy_threshold: 퍼지 매칭 최소 유사도 (자모 기준, 0.0 ~ 1.0)
+        """
+        self.language = language
+        self.fuzzy_threshold = fuzzy_threshold
+        self.ocr_runs = 0
+
+        # 영역 키 -> (내용 해시, 단어 리스트, 토큰 -> 단어 리스트)
+        self._regions: Dict[Optional[Region], Tuple[str, List[IndexedWord], Dict[str, List[IndexedWord]]]] = {}
+
+    @staticmethod
+    def _key(region) -> Optional[Region]:
+        """영역 키 정규화 (config.json의 리스트도 허용)"""
+        return tuple(int(v) for v in region) if region is not None else None
+
+    @staticmethod
+    def _crop(frame: np.ndarray, region: Optional[Region]) -> Tuple[np.ndarray, int, int]:
+        """영역 잘라내기 (프레임 범위로 제한), (이미지, x 오프셋, y 오프셋) 반환"""
+        if region is None:
+            return frame, 0, 0
+        height, width = frame.shape[:2]
+        x1, y1, x2, y2 = region
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(width, x2), min(height, y2)
+        return frame[y1:y2, x1:x2], x1, y1
+
+    @staticmethod
+    def _content_hash(image: np.ndarray) -> str:
+        """영역 내용 해시 (변경 여부 판정용)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(image.shape).encode())
+        digest.update(np.ascontiguousarray(image).tobytes())
+        return digest.hexdigest()
+
+    def _build(self, image: np.ndarray, offset_x: int, offset_y: int) -> Tuple[List[IndexedWord], Dict[str, List[IndexedWord]]]:
+        """영역 OCR 후 단어/줄 단위 역색인 생성"""
+        self.ocr_runs += 1
+        words: List[IndexedWord] = []
+        index: Dict[str, List[IndexedWord]] = {}
+
+        for text, (x1, y1, x2, y2), confidence in OCRProcessor.read_text_regions(image, self.language):
+            box = (x1 + offset_x, y1 + offset_y, x2 + offset_x, y2 + offset_y)
+
+            # 줄 전체(공백 제거)와 단어 각각을 색인 ("준비 완료"도 "준비완료"로 찾도록)
+            pieces = [text] + text.split()
+            for piece in dict.fromkeys(pieces):
+                token = normalize_token(piece)
+                if not token:
+                    continue
+                word = IndexedWord(piece, box, confidence, token, decompose_jamo(token))
+                words.append(word)
+                index.setdefault(token, []).append(word)
+
+        return words, index
+
+    def update(self, frame: np.ndarray, regions: List[Optional[Region]]) -> int:
+        """
+        프레임 갱신 - 내용이 바뀐 영역만 다시 OCR
+
+        Args:
+            frame: 현재 프레임 (화면 좌표 기준 이미지)
+            regions: 색인할 영역 리스트 (None은 프레임 전체), 중복은 한 번만 처리
+
+        Returns:
+            이번 호출에서 다시 OCR한 영역 수
+        """
+        rebuilt = 0
+        for region in dict.fromkeys(self._key(r) for r in regions):
+            image, offset_x, offset_y = self._crop(frame, region)
+            if image.size == 0:
+                self._regions.pop(region, None)
+                continue
+
+            content_hash = self._content_hash(image)
+            cached = self._regions.get(region)
+            if cached is not None and cached[0] == content_hash:
+                continue
+
+            words, index = self._build(image, offset_x, offset_y)
+            self._regions[region] = (content_hash, words, index)
+            rebuilt += 1
+
+        return rebuilt
+
+    def invalidate(self, region: Optional[Region] = None, all_regions: bool = False) -> None:
+        """색인 무효화 (특정 영역 또는 전체)"""
+        if all_regions:
+            self._regions.clear()
+        else:
+            self._regions.pop(self._key(region), None)
+
+    def find(
+        self,
+        text: str,
+        region: Optional[Region] = None,
+        fuzzy: bool = True
+    ) -> List[Tuple[str, Region, float]]:
+        """
+        색인에서 텍스트 찾기 (정확 일치 -> 부분 일치 -> 자모 퍼지 일치 순)
+
+        Args:
+            text: 찾을 텍스트 (예: "준비완료")
+            region: update()에 넘긴 영역 키 (None은 프레임 전체)
+            fuzzy: 정확/부분 일치가 없을 때 퍼지 매칭 사용 여부
+
+        Returns:
+            [(인식 텍스트, 박스, 점수), ...] 점수 내림차순 (정확 일치 1.0)
+        """
+        cached = self._regions.get(self._key(region))
+        query = normalize_token(text)
+        if cached is None or not query:
+            return []
+
+        _, words, index = cached
+
+        exact = index.get(query)
+        if exact:
+            return [(w.text, w.box, 1.0) for w in exact]
+
+        # 부분 일치 ("시작" in "게임시작")
+        partial = [(w.text, w.box, 0.99) for w in words if query in w.token]
+        if partial or not fuzzy:
+            return partial
+
+        # 자모 단위 유사도
+        query_jamo = decompose_jamo(query)
+        matches = []
+        for w in words:
+            score = SequenceMatcher(None, query_jamo, w.jamo).ratio()
+            if score >= self.fuzzy_threshold:
+                matches.append((w.text, w.box, score))
+        matches.sort(key=lambda m: m[2], reverse=True)
+        return matches
+
+    def find_all(
+        self,
+        queries: List[Tuple[str, Optional[Region]]],
+        fuzzy: bool = True
+    ) -> Dict[Tuple[str, Optional[Region]], List[Tuple[str, Region, float]]]:
+        """
+        여러 (텍스트, 영역) 조회를 색인에서 한 번에 처리
+
+        Returns:
+            {(텍스트, 영역): 매칭 리스트}
+        """
+        results = {}
+        for text, region in queries:
+            key = (text, self._key(region))
+            if key not in results:
+                results[key] = self.find(text, region, fuzzy)
+        return results
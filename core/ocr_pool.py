@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+OCR Worker Pool
+모델을 한 번만 로드하는 장기 실행 OCR 엔진 워커 풀
+"""
+
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+
+from .constants import OCR_LANGUAGE, OCR_POOL_TIMEOUT
+
+try:
+    import tesserocr
+except ImportError:  # 선택 의존성: 없으면 pytesseract 엔진 사용
+    tesserocr = None
+
+
+class OCREngine:
+    """
+    OCR 엔진 인터페이스
+
+    워커 스레드 하나가 엔진 하나를 소유하므로 구현체는 스레드 안전할 필요가 없습니다.
+    timeout은 요청의 남은 시간 (초, None이면 제한 없음)이며, 지킬 수 있는 엔진은 그 안에 예외로
+    끝내야 합니다. 지키지 못하는 엔진의 워커는 풀이 교체합니다 (tools/test_ocr_pool.py의 가짜 엔진 참고).
+    """
+
+    def image_to_string(self, image: np.ndarray, language: str, config: str,
+                        timeout: Optional[float] = None) -> str:
+        """이미지에서 텍스트 추출"""
+        raise NotImplementedError
+
+    def image_to_data(self, image: np.ndarray, language: str, config: str,
+                      timeout: Optional[float] = None) -> Dict[str, List[Any]]:
+        """
+        단어 단위 인식 결과 반환
+
+        Returns:
+            pytesseract.Output.DICT 형식 ('text', 'left', 'top', 'width', 'height', 'conf')
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """엔진 자원 해제"""
+        pass
+
+
+class PytesseractEngine(OCREngine):
+    """pytesseract 기반 엔진 (호출마다 tesseract 프로세스 실행, 시간 초과 시 프로세스 종료, 대체용)"""
+
+    def __init__(self, tesseract_cmd: Optional[str] = None):
+        if tesseract_cmd and os.path.exists(tesseract_cmd):
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    @staticmethod
+    def _timeout(timeout: Optional[float]) -> float:
+        """pytesseract timeout 인자 (0이면 제한 없음)"""
+        return max(timeout, 0.01) if timeout is not None else 0
+
+    def image_to_string(self, image: np.ndarray, language: str, config: str,
+                        timeout: Optional[float] = None) -> str:
+        return pytesseract.image_to_string(image, lang=language, config=config, timeout=self._timeout(timeout))
+
+    def image_to_data(self, image: np.ndarray, language: str, config: str,
+                      timeout: Optional[float] = None) -> Dict[str, List[Any]]:
+        return pytesseract.image_to_data(
+            image, lang=language, config=config, output_type=pytesseract.Output.DICT,
+            timeout=self._timeout(timeout)
+        )
+
+
+class TesserocrEngine(OCREngine):
+    """tesserocr 기반 엔진 (언어별 모델을 메모리에 유지, 호출을 중단할 수 없어 timeout은 풀이 처리)"""
+
+    def __init__(self, tessdata_path: Optional[str] = None, preload: Optional[List[str]] = None):
+        """
+        Args:
+            tessdata_path: tessdata 디렉토리 경로 (None이면 tesserocr 기본값)
+            preload: 워커 시작 시 미리 로드할 언어 리스트 (예: ['kor+eng'])
+        """
+        if tesserocr is None:
+            raise ImportError("tesserocr is not installed")
+        self.tessdata_path = tessdata_path
+        self._apis: Dict[str, Any] = {}
+        for language in preload or []:
+            self._get_api(language)
+
+    def _get_api(self, language: str) -> Any:
+        """언어별 API 반환 (처음 사용할 때만 traineddata 로드)"""
+        api = self._apis.get(language)
+        if api is None:
+            if self.tessdata_path:
+                api = tesserocr.PyTessBaseAPI(path=self.tessdata_path, lang=language)
+            else:
+                api = tesserocr.PyTessBaseAPI(lang=language)
+            self._apis[language] = api
+        return api
+
+    def _prepare(self, image: np.ndarray, language: str, config: str) -> Any:
+        """Tesseract 설정 문자열 적용 및 이미지 설정"""
+        api = self._get_api(language)
+
+        psm = re.search(r'--psm\s+(\d+)', config)
+        api.SetPageSegMode(int(psm.group(1)) if psm else tesserocr.PSM.AUTO)
+
+        # 'digits' 설정 파일과 동일한 효과
+        whitelist = '0123456789' if re.search(r'\bdigits\b', config) else ''
+        api.SetVariable('tessedit_char_whitelist', whitelist)
+
+        if len(image.shape) == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        api.SetImage(Image.fromarray(image))
+        return api
+
+    def image_to_string(self, image: np.ndarray, language: str, config: str,
+                        timeout: Optional[float] = None) -> str:
+        return self._prepare(image, language, config).GetUTF8Text()
+
+    def image_to_data(self, image: np.ndarray, language: str, config: str,
+                      timeout: Optional[float] = None) -> Dict[str, List[Any]]:
+        api = self._prepare(image, language, config)
+        api.Recognize()
+
+        data: Dict[str, List[Any]] = {
+            'text': [], 'left': [], 'top': [], 'width': [], 'height': [], 'conf': []
+        }
+        level = tesserocr.RIL.WORD
+        iterator = api.GetIterator()
+        if iterator is None:
+            return data
+
+        for word in tesserocr.iterate_level(iterator, level):
+            text = word.GetUTF8Text(level)
+            box = word.BoundingBox(level)
+            if not text or box is None:
+                continue
+            x1, y1, x2, y2 = box
+            data['text'].append(text)
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+            data['conf'].append(word.Confidence(level))
+
+        return data
+
+    def close(self) -> None:
+        for api in self._apis.values():
+            api.End()
+        self._apis.clear()
+
+
+def create_default_engine(
+    tesseract_path: Optional[str] = None,
+    preload: Optional[List[str]] = None
+) -> OCREngine:
+    """
+    사용 가능한 가장 빠른 엔진 생성 (tesserocr > pytesseract)
+
+    Args:
+        tesseract_path: tesseract 실행 파일 경로 (tessdata 위치 추정에 사용)
+        preload: 미리 로드할 언어 리스트
+    """
+    if tesserocr is not None:
+        tessdata = None
+        if tesseract_path:
+            candidate = os.path.join(os.path.dirname(tesseract_path), 'tessdata')
+            if os.path.isdir(candidate):
+                tessdata = candidate
+        return TesserocrEngine(tessdata, preload)
+
+    return PytesseractEngine(tesseract_path)
+
+
+class OCRWorkerPool:
+    """
+    요청 큐를 공유하는 장기 실행 OCR 워커 풀
+
+    요청이 시간을 넘기면 엔진에도 남은 시간을 넘겨 호출을 끝내게 하고, 그래도 호출이 끝나지 않은
+    워커는 은퇴시키고 새 워커를 시작합니다 (멈춘 호출 뒤에 다른 요청이 줄 서지 않도록).
+    은퇴한 워커는 호출이 끝나면 엔진을 닫고 종료합니다.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], OCREngine] = create_default_engine,
+        workers: int = 0,
+        timeout: float = OCR_POOL_TIMEOUT
+    ):
+        """
+        Args:
+            engine_factory: 워커마다 한 번 호출되어 엔진을 생성하는 함수
+            workers: 워커 수 (0이면 CPU 코어 수)
+            timeout: 요청 기본 타임아웃 (초)
+        """
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.timeout = timeout
+        self.retired_count = 0
+        self._engine_factory = engine_factory
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._threads: List[Tuple[threading.Thread, threading.Event]] = []
+        self._running: Dict[Future, threading.Event] = {}
+        self._closed = False
+
+        for _ in range(self.workers):
+            self._start_worker()
+
+    def _start_worker(self) -> None:
+        """워커 스레드 시작 (retired가 설정되면 현재 요청을 마친 뒤 종료)"""
+        retired = threading.Event()
+        thread = threading.Thread(
+            target=self._worker_loop, args=(retired,), name=f"ocr-worker-{next(self._ids)}", daemon=True
+        )
+        thread.start()
+        self._threads.append((thread, retired))
+
+    def _worker_loop(self, retired: threading.Event) -> None:
+        """워커 루프 - 엔진을 한 번 생성하고 큐의 요청을 처리"""
+        engine = None
+        engine_error = None
+        try:
+            engine = self._engine_factory()
+        except Exception as e:
+            engine_error = e
+
+        try:
+            while not retired.is_set():
+                item = self._queue.get()
+                if item is None:
+                    break
+
+                future, method, args, deadline = item
+                # 타임아웃으로 취소된 요청은 건너뜀
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                if engine is None:
+                    future.set_exception(engine_error)
+                    continue
+
+                with self._lock:
+                    self._running[future] = retired
+                try:
+                    timeout = deadline - time.perf_counter() if deadline is not None else None
+                    future.set_result(getattr(engine, method)(*args, timeout=timeout))
+                except Exception as e:
+                    future.set_exception(e)
+                finally:
+                    with self._lock:
+                        self._running.pop(future, None)
+        finally:
+            if engine is not None:
+                engine.close()
+
+    def _retire(self, future: Future) -> None:
+        """시간을 넘긴 요청을 처리 중인 워커 은퇴 및 새 워커 시작"""
+        with self._lock:
+            retired = self._running.pop(future, None)
+            if retired is None or self._closed:
+                return
+            retired.set()
+            self._threads = [(t, r) for t, r in self._threads if r is not retired]
+            self.retired_count += 1
+            self._start_worker()
+
+    def submit(self, method: str, image: np.ndarray, language: str, config: str,
+               timeout: Optional[float] = None) -> Future:
+        """
+        OCR 요청 제출
+
+        Args:
+            method: 엔진 메서드 이름 ('image_to_string' 또는 'image_to_data')
+            image: 입력 이미지
+            language: OCR 언어
+            config: Tesseract 설정
+            timeout: 엔진 호출에 넘길 제한 시간 (초, 제출 시점부터, None이면 제한 없음)
+
+        Returns:
+            결과를 담을 Future
+        """
+        if self._closed:
+            raise RuntimeError("OCR worker pool is closed")
+        future: Future = Future()
+        deadline = time.perf_counter() + timeout if timeout is not None else None
+        self._queue.put((future, method, (image, language, config), deadline))
+        return future
+
+    def _call(self, method: str, image: np.ndarray, language: str, config: str,
+              timeout: Optional[float]) -> Any:
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(method, image, language, config, timeout)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # 아직 대기 중이면 취소, 이미 처리 중이면 그 워커를 교체
+            if not future.cancel():
+                self._retire(future)
+            raise
+
+    def image_to_string(
+        self,
+        image: np.ndarray,
+        language: str = OCR_LANGUAGE,
+        config: str = '',
+        timeout: Optional[float] = None
+    ) -> str:
+        """텍스트 추출 (타임아웃 초과 시 concurrent.futures.TimeoutError)"""
+        return self._call('image_to_string', image, language, config, timeout)
+
+    def image_to_data(
+        self,
+        image: np.ndarray,
+        language: str = OCR_LANGUAGE,
+        config: str = '',
+        timeout: Optional[float] = None
+    ) -> Dict[str, List[Any]]:
+        """단어 단위 인식 결과 (타임아웃 초과 시 concurrent.futures.TimeoutError)"""
+        return self._call('image_to_data', image, language, config, timeout)
+
+    def close(self, wait: bool = True) -> None:
+        """워커 종료 (대기 중인 요청은 처리 후 종료, 은퇴한 워커는 기다리지 않음)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = [thread for thread, _ in self._threads]
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
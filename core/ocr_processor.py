@@ -4,17 +4,141 @@ OCR Processing Module
 OCR (광학 문자 인식) 처리 모듈
 """
 
-from typing import Optional, List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Optional, List, Tuple
 import cv2
 import numpy as np
 import pytesseract
 
-from .constants import OCR_CONFIG_DIGITS, OCR_LANGUAGE
+from .constants import (
+    OCR_CONFIG_DIGITS,
+    OCR_CONFIG_DIGITS_BATCH,
+    OCR_BATCH_PADDING,
+    OCR_CONFIG_TEXT_LINE,
+    OCR_LANGUAGE,
+    OCR_POOL_TIMEOUT
+)
+from .ocr_cache import OCRCache, MISS
+from .ocr_pool import OCREngine, OCRWorkerPool, create_default_engine
+from .digit_recognizer import DigitRecognizer, to_white_on_black
+from .text_proposal import TextProposer
+from .image_detector import ImageDetector
+
+ReadMode = Literal['batch', 'parallel', 'serial']
 
 
 class OCRProcessor:
     """OCR 처리 클래스"""
 
+    # 숫자 OCR 결과 캐시 (이진화 ROI 해시 기반, 모든 인스턴스 공유)
+    cache: Optional[OCRCache] = OCRCache()
+
+    @classmethod
+    def configure_cache(
+        cls,
+        max_entries: int,
+        persist_path: Optional[str] = None
+    ) -> OCRCache:
+        """
+        OCR 캐시 재설정
+
+        Args:
+            max_entries: 최대 캐시 항목 수 (0이면 캐시 비활성화)
+            persist_path: 캐시 저장 파일 경로 (None이면 메모리에만 유지)
+
+        Returns:
+            새 캐시 객체 (비활성화 시 None)
+        """
+        if max_entries <= 0:
+            cls.cache = None
+        else:
+            cls.cache = OCRCache(max_entries, persist_path)
+        return cls.cache
+
+    @classmethod
+    def save_cache(cls) -> None:
+        """OCR 캐시를 디스크에 저장 (저장 경로가 설정된 경우)"""
+        if cls.cache is not None:
+            cls.cache.save()
+
+    # 장기 실행 OCR 워커 풀 (None이면 호출마다 pytesseract 직접 실행)
+    pool: Optional[OCRWorkerPool] = None
+
+    @classmethod
+    def configure_pool(
+        cls,
+        workers: int = 0,
+        timeout: float = OCR_POOL_TIMEOUT,
+        engine_factory: Optional[Callable[[], OCREngine]] = None,
+        tesseract_path: Optional[str] = None,
+        preload: Optional[List[str]] = None
+    ) -> OCRWorkerPool:
+        """
+        OCR 워커 풀 시작 (기존 풀은 종료)
+
+        Args:
+            workers: 워커 수 (0이면 CPU 코어 수)
+            timeout: 요청 타임아웃 (초)
+            engine_factory: 엔진 생성 함수 (None이면 사용 가능한 기본 엔진)
+            tesseract_path: tesseract 실행 파일 경로
+            preload: 워커 시작 시 미리 로드할 언어 리스트
+
+        Returns:
+            새 워커 풀
+        """
+        cls.shutdown_pool()
+        if engine_factory is None:
+            def engine_factory():
+                return create_default_engine(tesseract_path, preload)
+        cls.pool = OCRWorkerPool(engine_factory, workers, timeout)
+        return cls.pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """OCR 워커 풀 종료"""
+        if cls.pool is not None:
+            cls.pool.close()
+            cls.pool = None
+
+    # 글리프 템플릿 숫자 인식기 (None이면 항상 Tesseract 사용)
+    digit_recognizer: Optional[DigitRecognizer] = None
+
+    @classmethod
+    def configure_digit_recognizer(cls, glyph_bank_path: Optional[str]) -> Optional[DigitRecognizer]:
+        """
+        글리프 뱅크 로드 (파일이 없으면 빠른 경로 비활성화)
+
+        Args:
+            glyph_bank_path: tools/build_glyph_bank.py로 만든 .npz 경로
+
+        Returns:
+            로드된 인식기 또는 None
+        """
+        if glyph_bank_path and os.path.exists(glyph_bank_path):
+            cls.digit_recognizer = DigitRecognizer.load(glyph_bank_path)
+        else:
+            cls.digit_recognizer = None
+        return cls.digit_recognizer
+
+    @staticmethod
+    def _image_to_string(image: np.ndarray, language: str, config: str) -> str:
+        """워커 풀이 있으면 풀로, 없으면 pytesseract로 텍스트 추출"""
+        pool = OCRProcessor.pool
+        if pool is not None:
+            return pool.image_to_string(image, language, config)
+        return pytesseract.image_to_string(image, lang=language, config=config)
+
+    @staticmethod
+    def _image_to_data(image: np.ndarray, language: str, config: str) -> Dict[str, List[Any]]:
+        """워커 풀이 있으면 풀로, 없으면 pytesseract로 단어 단위 인식"""
+        pool = OCRProcessor.pool
+        if pool is not None:
+            return pool.image_to_data(image, language, config)
+        return pytesseract.image_to_data(
+            image, lang=language, config=config, output_type=pytesseract.Output.DICT
+        )
+
     @staticmethod
     def preprocess_for_digits(image: np.ndarray) -> np.ndarray:
         """
@@ -53,25 +177,201 @@ class OCRProcessor:
             # 전처리
             preprocessed = OCRProcessor.preprocess_for_digits(image)
 
-            # OCR 수행
-            text = pytesseract.image_to_string(preprocessed, config=config)
+            # 캐시 조회 (동일한 글자 이미지면 OCR 생략)
+            cache = OCRProcessor.cache
+            key = None
+            if cache is not None:
+                key = OCRCache.make_key(preprocessed, config)
+                cached = cache.get(key)
+                if cached is not MISS:
+                    return cached
 
-            # 숫자만 추출
-            digits = ''.join(filter(str.isdigit, text))
+            # 글리프 인식 (신뢰도가 낮으면 Tesseract로 대체)
+            value = None
+            if OCRProcessor.digit_recognizer is not None:
+                value = OCRProcessor.digit_recognizer.recognize(preprocessed)
 
-            if digits:
-                return int(digits)
+            if value is None:
+                # OCR 수행
+                text = OCRProcessor._image_to_string(preprocessed, OCR_LANGUAGE, config)
 
-            return None
+                # 숫자만 추출
+                digits = ''.join(filter(str.isdigit, text))
+                value = int(digits) if digits else None
+
+            if cache is not None:
+                cache.put(key, value)
+
+            return value
 
         except Exception:
             return None
 
+    @staticmethod
+    def stitch_rois(
+        binaries: List[np.ndarray],
+        padding: int = OCR_BATCH_PADDING
+    ) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        """
+        여러 이진화 ROI를 흰 여백으로 구분해 하나의 캔버스에 세로로 배치
+
+        Args:
+            binaries: 이진화된 ROI 리스트
+            padding: ROI 사이/주변 여백 (픽셀)
+
+        Returns:
+            (캔버스, [(y_start, y_end), ...]) 각 ROI가 차지하는 세로 구간
+        """
+        width = max(b.shape[1] for b in binaries) + padding * 2
+        height = sum(b.shape[0] for b in binaries) + padding * (len(binaries) + 1)
+        canvas = np.full((height, width), 255, dtype=np.uint8)
+
+        spans = []
+        y = padding
+        for binary in binaries:
+            h, w = binary.shape[:2]
+
+            # 배경을 흰색으로 통일 (Tesseract는 검은 글자/흰 배경을 선호)
+            binary = cv2.bitwise_not(to_white_on_black(binary))
+
+            canvas[y:y+h, padding:padding+w] = binary
+            # 구간 경계는 여백 중간까지 확장 (글자 박스가 약간 벗어나도 매핑되도록)
+            spans.append((y - padding // 2, y + h + padding // 2))
+            y += h + padding
+
+        return canvas, spans
+
+    @staticmethod
+    def extract_digits_batch(
+        images: List[np.ndarray],
+        config: str = OCR_CONFIG_DIGITS_BATCH
+    ) -> List[Optional[int]]:
+        """
+        여러 이미지의 숫자를 Tesseract 한 번 호출로 추출
+
+        ROI들을 하나의 캔버스로 합쳐 image_to_data를 한 번만 실행하고,
+        인식된 단어 박스를 세로 위치로 원래 ROI에 다시 매핑합니다.
+        캐시는 extract_digits와 공유합니다.
+
+        Args:
+            images: 입력 이미지 리스트
+            config: Tesseract 설정 (여러 줄 블록 모드)
+
+        Returns:
+            입력 순서대로 추출된 숫자 리스트 (실패한 항목은 None)
+        """
+        results: List[Optional[int]] = [None] * len(images)
+        if not images:
+            return results
+
+        cache = OCRProcessor.cache
+        pending = []  # [(index, binary, cache_key), ...]
+
+        for i, image in enumerate(images):
+            binary = OCRProcessor.preprocess_for_digits(image)
+            key = None
+            if cache is not None:
+                key = OCRCache.make_key(binary, OCR_CONFIG_DIGITS)
+                cached = cache.get(key)
+                if cached is not MISS:
+                    results[i] = cached
+                    continue
+
+            # 글리프 인식으로 읽히면 묶음에서 제외
+            if OCRProcessor.digit_recognizer is not None:
+                value = OCRProcessor.digit_recognizer.recognize(binary)
+                if value is not None:
+                    results[i] = value
+                    if cache is not None:
+                        cache.put(key, value)
+                    continue
+
+            pending.append((i, binary, key))
+
+        if not pending:
+            return results
+
+        # 한 건이면 단건 OCR이 더 정확함
+        if len(pending) == 1:
+            i = pending[0][0]
+            results[i] = OCRProcessor.extract_digits(images[i])
+            return results
+
+        try:
+            canvas, spans = OCRProcessor.stitch_rois([binary for _, binary, _ in pending])
+            data = OCRProcessor._image_to_data(canvas, OCR_LANGUAGE, config)
+        except Exception:
+            return results
+
+        # 단어 박스를 세로 중심 기준으로 ROI에 매핑
+        words: List[List[Tuple[int, str]]] = [[] for _ in pending]
+        for text, left, top, height in zip(data['text'], data['left'], data['top'], data['height']):
+            digits = ''.join(filter(str.isdigit, text))
+            if not digits:
+                continue
+            center_y = top + height // 2
+            for slot, (y_start, y_end) in enumerate(spans):
+                if y_start <= center_y < y_end:
+                    words[slot].append((left, digits))
+                    break
+
+        for slot, (i, _, key) in enumerate(pending):
+            digits = ''.join(d for _, d in sorted(words[slot]))
+            value = int(digits) if digits else None
+            results[i] = value
+            if cache is not None:
+                cache.put(key, value)
+
+        return results
+
+    @staticmethod
+    def extract_digits_parallel(
+        images: List[np.ndarray],
+        max_workers: Optional[int] = None
+    ) -> List[Optional[int]]:
+        """
+        여러 이미지의 숫자를 스레드 풀에서 동시에 추출
+
+        Args:
+            images: 입력 이미지 리스트
+            max_workers: 최대 동시 작업 수 (None이면 OCR 워커 수 또는 CPU 코어 수)
+
+        Returns:
+            입력 순서대로 추출된 숫자 리스트 (실패한 항목은 None)
+        """
+        return OCRProcessor._map_parallel(OCRProcessor.extract_digits, images, max_workers)
+
+    @staticmethod
+    def _map_parallel(func: Callable, items: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """
+        항목별 OCR 작업을 스레드 풀에서 실행 (입력 순서 유지)
+
+        Args:
+            func: 항목 하나를 처리하는 함수
+            items: 입력 리스트
+            max_workers: 최대 동시 작업 수 (None이면 OCR 워커 수 또는 CPU 코어 수)
+        """
+        if not items:
+            return []
+
+        if max_workers is None:
+            pool = OCRProcessor.pool
+            max_workers = pool.workers if pool is not None else (os.cpu_count() or 1)
+        max_workers = max(1, min(max_workers, len(items)))
+
+        if max_workers == 1:
+            return [func(item) for item in items]
+
+        # Tesseract 호출은 GIL을 놓고 대기하므로 스레드로 충분
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr-read") as executor:
+            return list(executor.map(func, items))
+
     @staticmethod
     def extract_text(
         image: np.ndarray,
         language: str = OCR_LANGUAGE,
-        config: str = ''
+        config: str = '',
+        use_proposals: bool = False
     ) -> str:
         """
         이미지에서 텍스트 추출
@@ -80,21 +380,74 @@ class OCRProcessor:
             image: 입력 이미지
             language: OCR 언어 (기본: 영어)
             config: Tesseract 설정
+            use_proposals: True면 텍스트 후보 박스만 읽어 줄 단위로 합침
+                (큰 영역에서 훨씬 빠름, config는 무시됨)
 
         Returns:
             추출된 텍스트
         """
+        if use_proposals:
+            regions = OCRProcessor.read_text_regions(image, language)
+            return '\n'.join(text for text, _, _ in regions)
+
         try:
-            text = pytesseract.image_to_string(image, lang=language, config=config)
+            text = OCRProcessor._image_to_string(image, language, config)
             return text.strip()
         except Exception:
             return ""
 
+    @staticmethod
+    def read_text_regions(
+        image: np.ndarray,
+        language: str = OCR_LANGUAGE,
+        config: str = OCR_CONFIG_TEXT_LINE,
+        proposer: Optional[TextProposer] = None
+    ) -> List[Tuple[str, Tuple[int, int, int, int], float]]:
+        """
+        텍스트 후보 박스만 OCR하여 줄 단위 결과 반환
+
+        Args:
+            image: 입력 이미지
+            language: OCR 언어
+            config: 줄 단위 Tesseract 설정
+            proposer: 텍스트 영역 제안기 (None이면 기본 설정)
+
+        Returns:
+            [(text, (x1, y1, x2, y2), confidence), ...] 위에서 아래 순서,
+            confidence는 0.0 ~ 1.0 (단어 신뢰도 평균)
+        """
+        proposer = proposer or TextProposer()
+        boxes = proposer.propose(image)
+
+        def read_box(box):
+            x1, y1, x2, y2 = box
+            try:
+                data = OCRProcessor._image_to_data(image[y1:y2, x1:x2], language, config)
+            except Exception:
+                return None
+
+            words = []
+            confs = []
+            for text, conf in zip(data['text'], data['conf']):
+                conf = float(conf)
+                if conf < 0 or not text.strip():
+                    continue
+                words.append(text.strip())
+                confs.append(conf)
+
+            if not words:
+                return None
+            return (' '.join(words), box, sum(confs) / len(confs) / 100.0)
+
+        return [r for r in OCRProcessor._map_parallel(read_box, boxes) if r is not None]
+
     @staticmethod
     def find_currency_values(
         screen: np.ndarray,
         template: np.ndarray,
-        threshold: float = 0.7
+        threshold: float = 0.7,
+        read_mode: ReadMode = 'batch',
+        search_box: Optional[Tuple[int, int, int, int]] = None
     ) -> List[Tuple[int, int, int]]:
         """
         화면에서 재화(currency) 값과 위치 찾기
@@ -103,37 +456,43 @@ class OCRProcessor:
             screen: 화면 이미지
             template: 재화 아이콘 템플릿
             threshold: 템플릿 매칭 임계값
+            read_mode: 숫자 읽기 방식
+                'batch' - 모든 배지를 Tesseract 한 번 호출로 읽음 (기본값)
+                'parallel' - 배지별로 동시에 읽음 (워커가 여러 개인 OCR 풀과 여유 코어가 있을 때만 유리)
+                'serial' - 배지별로 순서대로 읽음
+            search_box: 배지를 찾을 영역 (x1, y1, x2, y2), None이면 화면 전체
+                        (예: SearchPlan으로 찾은 캐릭터 목록 패널)
 
         Returns:
-            [(value, x, y), ...] 재화 값과 중심 좌표 리스트
+            [(value, x, y), ...] 재화 값과 중심 좌표 리스트 (screen 좌표)
         """
-        # 템플릿 매칭
-        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-        locations = np.where(result >= threshold)
-
         h, w = template.shape[:2]
-        currency_list = []
-
-        for pt in zip(*locations[::-1]):
-            x, y = pt
-
-            # 중복 제거
-            is_duplicate = False
-            for _, cx, cy in currency_list:
-                if abs(cx - x) < w // 2 and abs(cy - y) < h // 2:
-                    is_duplicate = True
-                    break
+        box_x, box_y = 0, 0
+        search_area = screen
+        if search_box is not None:
+            box_x, box_y, box_x2, box_y2 = search_box
+            search_area = screen[box_y:box_y2, box_x:box_x2]
 
-            if not is_duplicate:
-                # 왼쪽 절반에서 숫자 읽기 (은동전)
-                roi = screen[y:y+h, x:x+w//2]
+        # 1단계: 배지 위치 수집 (같은 프레임의 점수 맵 재사용, 템플릿 절반 거리 안의 중복은 최고 점수만)
+        positions = [
+            (x + box_x, y + box_y)
+            for x, y, _ in ImageDetector.score_map(search_area, template).peaks(threshold)
+        ]
 
-                # OCR로 숫자 추출
-                value = OCRProcessor.extract_digits(roi)
+        # 2단계: 왼쪽 절반(은동전) 숫자 읽기 (결과는 화면 순서 유지)
+        rois = [screen[y:y+h, x:x+w//2] for x, y in positions]
+        if read_mode == 'batch':
+            values = OCRProcessor.extract_digits_batch(rois)
+        elif read_mode == 'parallel':
+            values = OCRProcessor.extract_digits_parallel(rois)
+        else:
+            values = [OCRProcessor.extract_digits(roi) for roi in rois]
 
-                if value is not None:
-                    center_x = x + w // 2
-                    center_y = y + h // 2
-                    currency_list.append((value, center_x, center_y))
+        currency_list = []
+        for (x, y), value in zip(positions, values):
+            if value is not None:
+                center_x = x + w // 2
+                center_y = y + h // 2
+                currency_list.append((value, center_x, center_y))
 
         return currency_list
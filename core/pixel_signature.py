@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Sparse Pixel-Signature Detector
+고정 배율 UI 요소를 템플릿의 판별 픽셀 K개만 비교해 찾는 모듈
+"""
+
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    IMAGE_CONFIDENCE_THRESHOLD,
+    SIGNATURE_SAMPLES,
+    SIGNATURE_PREFILTER_SAMPLES,
+    SIGNATURE_TOLERANCE,
+    SIGNATURE_MAX_MISMATCH,
+    SIGNATURE_MAX_CANDIDATES
+)
+
+
+class PixelSignature:
+    """
+    템플릿의 희소 픽셀 시그니처
+
+    1단계: 앞쪽 몇 개 픽셀을 프레임 전체 후보 위치에서 한 번에 비교 (이동한 strided 뷰)
+    2단계: 살아남은 위치에서만 나머지 픽셀을 gather로 비교
+    3단계: 상위 후보 주변 작은 창에서 cv2.matchTemplate로 확인 (find_template과 같은 신뢰도)
+    """
+
+    def __init__(
+        self,
+        template: np.ndarray,
+        samples: int = SIGNATURE_SAMPLES,
+        prefilter_samples: int = SIGNATURE_PREFILTER_SAMPLES,
+        tolerance: int = SIGNATURE_TOLERANCE,
+        max_mismatch: float = SIGNATURE_MAX_MISMATCH
+    ):
+        """
+        Args:
+            template: 템플릿 이미지 (BGR 또는 그레이스케일)
+            samples: 비교할 픽셀 수 K
+            prefilter_samples: 프레임 전체에서 비교할 앞쪽 픽셀 수
+            tolerance: 픽셀 밝기 허용 오차 (0 ~ 255)
+            max_mismatch: 2단계에서 허용하는 불일치 픽셀 비율
+        """
+        self.template = template
+        self.gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY) if len(template.shape) == 3 else template
+        self.height, self.width = self.gray.shape[:2]
+        self.tolerance = tolerance
+        self.max_mismatch = max_mismatch
+
+        self.ys, self.xs = self._select_pixels(self.gray, samples)
+        self.values = self.gray[self.ys, self.xs].astype(np.int16)
+        self.prefilter_samples = min(prefilter_samples, len(self.ys))
+
+    @staticmethod
+    def _select_pixels(gray: np.ndarray, samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        판별 픽셀 선택
+
+        평균 밝기에서 멀고(판별력) 주변 3x3이 평탄한(1픽셀 어긋남에 강함) 픽셀을
+        격자 칸마다 하나씩 골라 템플릿 전체에 퍼지게 합니다.
+
+        Returns:
+            (ys, xs) 점수 내림차순
+        """
+        height, width = gray.shape[:2]
+        g = gray.astype(np.float32)
+        mean = cv2.blur(g, (3, 3))
+        local_std = np.sqrt(np.maximum(cv2.blur(g * g, (3, 3)) - mean * mean, 0))
+        score = np.abs(g - g.mean()) / (1.0 + local_std)
+
+        # 가장자리 1픽셀 제외
+        score[[0, -1], :] = -1
+        score[:, [0, -1]] = -1
+
+        cells = max(1, int(np.ceil(np.sqrt(samples))))
+        candidates: List[Tuple[float, int, int]] = []
+        for row in range(cells):
+            for col in range(cells):
+                y1, y2 = row * height // cells, (row + 1) * height // cells
+                x1, x2 = col * width // cells, (col + 1) * width // cells
+                if y2 <= y1 or x2 <= x1:
+                    continue
+                cell = score[y1:y2, x1:x2]
+                index = int(cell.argmax())
+                cy, cx = divmod(index, cell.shape[1])
+                candidates.append((float(cell[cy, cx]), y1 + cy, x1 + cx))
+
+        candidates.sort(reverse=True)
+        candidates = candidates[:samples]
+        ys = np.array([c[1] for c in candidates], dtype=np.intp)
+        xs = np.array([c[2] for c in candidates], dtype=np.intp)
+        return ys, xs
+
+    def candidates(self, gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        시그니처가 맞는 후보 위치 (좌상단)
+
+        Args:
+            gray: 그레이스케일 화면
+
+        Returns:
+            (ys, xs, 불일치 수) 불일치 수 오름차순, 같으면 샘플 밝기 차이 합 오름차순
+            (find()가 max_candidates개만 확인하므로 가장 그럴듯한 위치가 앞에 오도록 정렬)
+        """
+        empty = np.zeros(0, dtype=np.intp)
+        rows = gray.shape[0] - self.height + 1
+        cols = gray.shape[1] - self.width + 1
+        if rows <= 0 or cols <= 0 or len(self.ys) == 0:
+            return empty, empty, empty
+
+        # 1단계: 모든 위치에서 앞쪽 픽셀 비교 (샘플 위치만큼 이동한 뷰, 복사 없음)
+        # 생존 위치가 많으면(1% 초과) gather가 커지므로 전체 비교를 더 진행
+        mask = None
+        stage = 0
+        limit = max(1, rows * cols // 100)
+        while stage < len(self.ys):
+            y, x = self.ys[stage], self.xs[stage]
+            value = int(self.values[stage])
+            ok = cv2.inRange(gray[y:y + rows, x:x + cols], value - self.tolerance, value + self.tolerance)
+            mask = ok if mask is None else cv2.bitwise_and(mask, ok)
+            stage += 1
+
+            survivors = cv2.countNonZero(mask)
+            if survivors == 0:
+                return empty, empty, empty
+            if stage >= self.prefilter_samples and survivors <= limit:
+                break
+
+        cy, cx = np.nonzero(mask)
+
+        if stage == len(self.ys):
+            # 모든 샘플을 1단계에서 비교함 (생존 위치가 많을 수 있어 gather 대신 이동한 뷰로 차이 합 계산)
+            distance = np.zeros((rows, cols), dtype=np.float32)
+            for y, x, value in zip(self.ys, self.xs, self.values.tolist()):
+                distance += cv2.absdiff(gray[y:y + rows, x:x + cols], value)
+            order = np.argsort(distance[cy, cx], kind='stable')
+            return cy[order], cx[order], np.zeros(len(cy), dtype=np.intp)
+
+        # 2단계: 생존 위치(1% 이하)에서 전체 샘플 gather (불일치는 나머지 픽셀만 셈)
+        gathered = gray[cy[:, None] + self.ys[None, :], cx[:, None] + self.xs[None, :]].astype(np.int16)
+        diff = np.abs(gathered - self.values[None, :])
+        mismatches = (diff[:, stage:] > self.tolerance).sum(axis=1)
+        keep = mismatches <= int((len(self.ys) - stage) * self.max_mismatch)
+
+        mismatches, distance = mismatches[keep], diff[keep].sum(axis=1)
+        order = np.lexsort((distance, mismatches))
+        return cy[keep][order], cx[keep][order], mismatches[order]
+
+    def find(
+        self,
+        screen: np.ndarray,
+        confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+        max_candidates: int = SIGNATURE_MAX_CANDIDATES
+    ) -> Optional[Tuple[int, int, float]]:
+        """
+        화면에서 템플릿 찾기 (ImageDetector.find_template과 같은 반환 형식)
+
+        Args:
+            screen: 화면 이미지 (BGR 또는 그레이스케일)
+            confidence: 최소 신뢰도 (확인 단계 TM_CCOEFF_NORMED 기준)
+            max_candidates: 확인할 최대 후보 수
+
+        Returns:
+            (x, y, confidence) 중심 좌표와 신뢰도, 없으면 None
+        """
+        gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY) if len(screen.shape) == 3 else screen
+        ys, xs, _ = self.candidates(gray)
+
+        # 인접 후보는 같은 위치로 보고 대표 하나만 확인
+        confirmed: List[Tuple[int, int]] = []
+        best = None
+        pad = 2
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            if any(abs(y - py) <= pad and abs(x - px) <= pad for py, px in confirmed):
+                continue
+            confirmed.append((y, x))
+
+            # 3단계: 후보 주변 작은 창에서만 NCC 확인 (컬러 템플릿이면 컬러로)
+            y1, x1 = max(0, y - pad), max(0, x - pad)
+            y2 = min(screen.shape[0], y + self.height + pad)
+            x2 = min(screen.shape[1], x + self.width + pad)
+            source = screen if screen.ndim == self.template.ndim else gray
+            template = self.template if screen.ndim == self.template.ndim else self.gray
+            result = cv2.matchTemplate(source[y1:y2, x1:x2], template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if best is None or max_val > best[2]:
+                best = (x1 + max_loc[0] + self.width // 2, y1 + max_loc[1] + self.height // 2, max_val)
+
+            if len(confirmed) >= max_candidates:
+                break
+
+        if best is not None and best[2] >= confidence:
+            return best
+        return None
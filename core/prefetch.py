@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Speculative Prefetch
+클릭 후 대기하는 동안 다음 단계의 탐지를 백그라운드에서 미리 반복하는 모듈
+"""
+
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+from .constants import PREFETCH_INTERVAL
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class Prefetch(Generic[T]):
+    """
+    다음 단계 탐지를 백그라운드 스레드에서 반복 실행
+
+    detect()가 참인 값(빈 리스트/None이 아닌 값)을 처음 반환하면 멈추고 그 결과를 보관합니다.
+    대기 쪽은 wait()로 결과가 나오는 즉시 깨어나므로 "UI 준비됨"과 "알아챔" 사이 간격이 없습니다.
+
+    Example:
+        badges = self.prefetch(self.detect_currency_positions)
+        self.automation.click(x, y)
+        self.smart_sleep(2, until=badges)
+        currency_list = badges.take() or self.find_all_currency_positions()
+    """
+
+    def __init__(self, detect: Callable[[], Optional[T]], interval: float = PREFETCH_INTERVAL, name: str = "prefetch"):
+        """
+        Args:
+            detect: 다음 단계 탐지 함수 (찾지 못하면 None 또는 빈 값 반환)
+            interval: 탐지 반복 간격 (초)
+            name: 스레드 이름 (로그용)
+        """
+        self.detect = detect
+        self.interval = interval
+        self.name = name
+        self.attempts = 0
+        self.latency: Optional[float] = None  # 시작부터 첫 양성 결과까지 걸린 시간 (초)
+
+        self._result: Optional[T] = None
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name=f"prefetch-{name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._cancelled.is_set():
+            self.attempts += 1
+            try:
+                result = self.detect()
+            except Exception as e:
+                # 화면 전환 중 일시적 실패는 다음 시도에서 다시 확인
+                logger.debug(f"Prefetch {self.name} failed: {e}")
+                result = None
+
+            if result and not self._cancelled.is_set():
+                self._result = result
+                self.latency = time.perf_counter() - self._started
+                self._done.set()
+                return
+            self._cancelled.wait(self.interval)
+
+    def done(self) -> bool:
+        """양성 결과가 나왔는지 여부"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        결과가 나올 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            결과가 나왔으면 True
+        """
+        return self._done.wait(timeout)
+
+    def take(self) -> Optional[T]:
+        """
+        결과를 가져오고 백그라운드 탐지 중지
+
+        Returns:
+            첫 양성 결과, 아직 없으면 None
+        """
+        self.cancel()
+        return self._result
+
+    def cancel(self) -> None:
+        """백그라운드 탐지 중지 (진행 중인 탐지 한 번은 끝까지 실행됨)"""
+        self._cancelled.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """cancel() 후 진행 중인 탐지가 끝날 때까지 대기 (같은 조건을 다시 평가하기 전)"""
+        self._thread.join(timeout)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Rule Engine
+config.json "actions" 규칙을 프레임당 한 번의 평가로 실행하는 엔진
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .automation import Automation
+from .config import ActionConfig
+from .constants import OCR_LANGUAGE, RULE_COOLDOWN
+from .image_detector import ImageDetector
+from .ocr_index import OCRWordIndex, Region
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CompiledRule:
+    """컴파일된 규칙 (설정 + 실행 통계)"""
+
+    def __init__(self, action: ActionConfig):
+        self.action = action
+        self.region: Optional[Region] = action.trigger_region
+        self.evaluations = 0
+        self.fire_count = 0
+        self.eval_time = 0.0  # 누적 평가 시간 (영역 OCR 분담분 포함, 초)
+        self.last_fired = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """규칙별 통계 반환"""
+        return {
+            'name': self.action.name,
+            'evaluations': self.evaluations,
+            'fires': self.fire_count,
+            'total_ms': self.eval_time * 1000,
+            'avg_ms': self.eval_time * 1000 / self.evaluations if self.evaluations else 0.0
+        }
+
+
+class RuleEngine:
+    """텍스트 트리거 규칙 엔진"""
+
+    def __init__(
+        self,
+        actions: List[ActionConfig],
+        automation: Optional[Automation] = None,
+        language: str = OCR_LANGUAGE,
+        cooldown: float = RULE_COOLDOWN,
+        ocr_index: Optional[OCRWordIndex] = None
+    ):
+        """
+        Args:
+            actions: 액션 설정 리스트 (비활성 항목은 컴파일에서 제외)
+            automation: 액션 실행에 사용할 Automation (None이면 새로 생성)
+            language: 트리거 텍스트 OCR 언어
+            cooldown: 같은 규칙이 다시 실행되기까지 최소 간격 (초)
+            ocr_index: 공유할 OCR 단어 색인 (None이면 새로 생성)
+        """
+        self.automation = automation or Automation()
+        self.cooldown = cooldown
+        self.ocr_index = ocr_index or OCRWordIndex(language)
+        self.frame_count = 0
+        self.plan = self.compile(actions)
+
+    @staticmethod
+    def compile(actions: List[ActionConfig]) -> Dict[Optional[Region], List[CompiledRule]]:
+        """
+        활성 규칙을 영역별로 묶은 실행 계획 생성
+
+        Returns:
+            {영역(None은 전체 화면): [규칙, ...]}
+        """
+        plan: Dict[Optional[Region], List[CompiledRule]] = {}
+        for action in actions:
+            if action.enabled:
+                rule = CompiledRule(action)
+                plan.setdefault(rule.region, []).append(rule)
+        return plan
+
+    @property
+    def rules(self) -> List[CompiledRule]:
+        """모든 컴파일된 규칙"""
+        return [rule for rules in self.plan.values() for rule in rules]
+
+    def evaluate(self, frame: np.ndarray, dispatch: bool = True) -> List[Tuple[CompiledRule, Region]]:
+        """
+        프레임 한 장에 대해 모든 규칙 평가 (영역별 OCR은 한 번만)
+
+        Args:
+            frame: 전체 화면 이미지 (화면 좌표 기준)
+            dispatch: True면 매칭된 규칙의 액션 실행
+
+        Returns:
+            [(실행된 규칙, 매칭된 텍스트 박스), ...]
+        """
+        self.frame_count += 1
+        fired = []
+        now = time.time()
+
+        for region, rules in self.plan.items():
+            # 영역 OCR (내용이 바뀌었을 때만 실제 OCR 수행), 비용은 규칙 수로 분담
+            start = time.perf_counter()
+            self.ocr_index.update(frame, [region])
+            shared_cost = (time.perf_counter() - start) / len(rules)
+
+            for rule in rules:
+                start = time.perf_counter()
+                matches = self.ocr_index.find(rule.action.trigger_text, region)
+                rule.evaluations += 1
+                rule.eval_time += shared_cost + (time.perf_counter() - start)
+
+                if not matches or now - rule.last_fired < self.cooldown:
+                    continue
+
+                box = matches[0][1]
+                rule.fire_count += 1
+                rule.last_fired = now
+                fired.append((rule, box))
+
+        if dispatch:
+            for rule, box in fired:
+                self.dispatch(rule.action, box)
+
+        return fired
+
+    def run_once(self, dispatch: bool = True) -> List[Tuple[CompiledRule, Region]]:
+        """화면을 캡처해 규칙 평가 (편의 메서드)"""
+        return self.evaluate(ImageDetector.capture_screen(), dispatch)
+
+    def dispatch(self, action: ActionConfig, box: Region) -> None:
+        """
+        규칙 액션 실행
+
+        click 좌표(x, y 또는 click_x, click_y)가 없으면 매칭된 텍스트 박스 중심을 클릭합니다.
+        """
+        params = action.action_params
+        delay = params.get("delay", 0)
+        center_x = (box[0] + box[2]) // 2
+        center_y = (box[1] + box[3]) // 2
+
+        logger.info(f"Rule fired: {action.name} ('{action.trigger_text}' at {box})")
+
+        if action.action_type == 'click':
+            self.automation.click(params.get("x", center_x), params.get("y", center_y), delay=delay)
+        elif action.action_type == 'key':
+            self.automation.press_key(params["key"], delay=delay)
+        elif action.action_type == 'click_and_key':
+            self.automation.click(params.get("click_x", center_x), params.get("click_y", center_y))
+            self.automation.press_key(params["key"], delay=delay)
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """규칙별 평가 비용 및 실행 횟수"""
+        return [rule.get_stats() for rule in self.rules]
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Scale Profile
+해상도/DPI별 템플릿 배율을 한 번 보정해 디스크에 저장하는 모듈
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    SCALE_RANGE,
+    SCALE_COARSE_STEPS,
+    SCALE_FINE_STEPS,
+    SCALE_MIN_SCORE,
+    SCALE_TOP_TEMPLATES,
+    SCALE_MIN_MARGIN
+)
+
+
+def resize_template(template: np.ndarray, scale: float) -> np.ndarray:
+    """템플릿 배율 변경 (축소는 INTER_AREA, 확대는 INTER_LINEAR)"""
+    if abs(scale - 1.0) < 1e-3:
+        return template
+    h, w = template.shape[:2]
+    size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    return cv2.resize(template, size, interpolation=interpolation)
+
+
+def score_scale(screen: np.ndarray, templates: List[np.ndarray], scale: float) -> Tuple[float, int]:
+    """
+    한 배율의 점수
+
+    Returns:
+        (점수 상위 SCALE_TOP_TEMPLATES개 템플릿의 최고 매칭 점수 평균, SCALE_MIN_SCORE 이상으로 찾은 템플릿 수)
+        - 찾은 개수로 먼저 비교하면 작은 배율에서 작은 템플릿이 아무 데나 0.7을 넘어 이기므로,
+          화면에 확실히 있는 몇 개의 점수로만 비교
+    """
+    scores = []
+    for template in templates:
+        scaled = resize_template(template, scale)
+        if scaled.shape[0] > screen.shape[0] or scaled.shape[1] > screen.shape[1]:
+            continue
+        result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
+        scores.append(float(result.max()))
+    if not scores:
+        return 0.0, 0
+    top = sorted(scores, reverse=True)[:SCALE_TOP_TEMPLATES]
+    return float(np.mean(top)), sum(1 for score in scores if score >= SCALE_MIN_SCORE)
+
+
+def calibrate_scale(
+    screen: np.ndarray,
+    templates: List[np.ndarray],
+    scale_range: Tuple[float, float] = SCALE_RANGE,
+    coarse_steps: int = SCALE_COARSE_STEPS,
+    fine_steps: int = SCALE_FINE_STEPS,
+    min_margin: float = SCALE_MIN_MARGIN
+) -> Tuple[Optional[float], float]:
+    """
+    화면에 가장 잘 맞는 템플릿 배율 찾기 (로그 간격 거친 탐색 후 최적 주변 정밀 탐색)
+
+    Args:
+        screen: 현재 화면 (템플릿 일부가 보이는 상태, Detection Area만 줘도 됨)
+        templates: 기준 템플릿 리스트 (원본 배율)
+        scale_range: 탐색할 배율 범위 (min, max)
+        coarse_steps: 거친 탐색 단계 수
+        fine_steps: 정밀 탐색 단계 수
+        min_margin: 최적 점수가 이웃하지 않은 거친 단계의 최고 점수보다 높아야 하는 차이
+
+    Returns:
+        (최적 배율, 점수), 템플릿을 찾지 못했거나 다른 배율과 구분되지 않으면 (None, 점수)
+    """
+    coarse = np.geomspace(scale_range[0], scale_range[1], coarse_steps)
+    ranked = [(score_scale(screen, templates, float(s)), float(s)) for s in coarse]
+    (best_score, best_found), best_scale = max(ranked, key=lambda r: r[0][0])
+    if best_found == 0:
+        return None, best_score
+
+    # 이웃한 거친 단계를 제외한 최고 점수와 차이가 작으면 배율을 확신할 수 없음
+    ratio = (scale_range[1] / scale_range[0]) ** (1.0 / max(1, coarse_steps - 1))
+    others = [score for (score, _), s in ranked
+              if abs(np.log(s / best_scale)) > np.log(ratio) * 1.01]
+    if others and best_score - max(others) < min_margin:
+        return None, best_score
+
+    # 이웃한 거친 단계 사이를 정밀 탐색
+    for scale in np.geomspace(best_scale / ratio, best_scale * ratio, fine_steps):
+        score, found = score_scale(screen, templates, float(scale))
+        if found > 0 and score > best_score:
+            best_score, best_scale = score, float(scale)
+
+    return float(best_scale), best_score
+
+
+class ScaleProfile:
+    """(해상도, 템플릿 세트)별 보정 배율 저장소 (JSON)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 프로필 파일 경로 (None이면 저장하지 않음)
+        """
+        self.path = path
+        self.entries: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def make_key(resolution: Tuple[int, int], template_paths: Iterable[str]) -> str:
+        """
+        프로필 키 생성
+
+        Args:
+            resolution: 화면 해상도 (width, height)
+            template_paths: 템플릿 경로들 (순서 무관)
+
+        Returns:
+            "1920x1080:<템플릿 세트 해시>"
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        for path in sorted(os.path.normpath(p).replace('\\', '/') for p in template_paths):
+            digest.update(path.encode('utf-8'))
+            digest.update(b'\0')
+        return f"{resolution[0]}x{resolution[1]}:{digest.hexdigest()}"
+
+    def __contains__(self, key: str) -> bool:
+        """보정을 시도한 적이 있는지 (보정 실패 결과 포함)"""
+        return key in self.entries
+
+    def get(self, key: str) -> Optional[float]:
+        """저장된 배율 (없거나 보정하지 못한 항목이면 None)"""
+        entry = self.entries.get(key)
+        return entry.get('scale') if entry else None
+
+    def set(self, key: str, scale: Optional[float], score: float) -> None:
+        """
+        보정 결과 저장
+
+        Args:
+            key: 프로필 키
+            scale: 배율 (None이면 보정하지 못함 - 다음 실행에서 다시 보정하지 않고 1.0 사용)
+            score: 최적 배율 점수
+        """
+        self.entries[key] = {
+            'scale': round(scale, 4) if scale is not None else None,
+            'score': round(score, 4),
+            'calibrated_at': time.time()
+        }
+
+    @classmethod
+    def load(cls, path: str) -> 'ScaleProfile':
+        """프로필 파일 로드 (없거나 손상되면 빈 프로필)"""
+        profile = cls(path)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    profile.entries = json.load(f).get('profiles', {})
+            except (OSError, ValueError):
+                profile.entries = {}
+        return profile
+
+    def save(self) -> None:
+        """프로필 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'profiles': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
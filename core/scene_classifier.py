@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Scene Classifier
+현재 게임 화면(씬)을 한 번의 벡터 비교로 판별하는 모듈
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import SCENE_THUMBNAIL_SIZE, SCENE_MIN_CONFIDENCE
+
+Anchor = Tuple[float, float, float, float]  # 비율 좌표 (x1, y1, x2, y2), 0.0 ~ 1.0
+
+
+class SceneClassifier:
+    """
+    축소 썸네일 + 앵커 마스크 기반 씬 분류기
+
+    모든 씬의 시그니처를 행렬로 묶어 두고, 현재 프레임 특징 벡터 하나와
+    마스크 NCC를 행렬-벡터 곱 몇 번으로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        thumbnail_size: Tuple[int, int] = SCENE_THUMBNAIL_SIZE,
+        min_confidence: float = SCENE_MIN_CONFIDENCE
+    ):
+        """
+        Args:
+            thumbnail_size: 특징 썸네일 크기 (width, height)
+            min_confidence: 이 값 미만이면 알 수 없는 씬(None)으로 판정
+        """
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.min_confidence = min_confidence
+        self.scene_ids: List[str] = []
+
+        dim = self.thumbnail_size[0] * self.thumbnail_size[1] * 3
+        self._templates = np.zeros((0, dim), dtype=np.float32)  # 마스크 내 평균 0, 노름 1
+        self._masks = np.zeros((0, dim), dtype=np.float32)      # 앵커 영역 1, 나머지 0
+        self._counts = np.zeros(0, dtype=np.float32)            # 마스크 픽셀 수
+
+    def features(self, frame: np.ndarray) -> np.ndarray:
+        """
+        프레임을 특징 벡터로 변환 (컬러 썸네일)
+
+        Args:
+            frame: BGR 이미지 (Detection Area 캡처)
+        """
+        if len(frame.shape) == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        thumbnail = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        return thumbnail.astype(np.float32).ravel()
+
+    def _anchor_mask(self, anchors: Optional[List[Anchor]]) -> np.ndarray:
+        """앵커 비율 영역을 썸네일 마스크 벡터로 변환 (앵커가 없으면 전체)"""
+        width, height = self.thumbnail_size
+        if not anchors:
+            return np.ones(width * height * 3, dtype=np.float32)
+
+        mask = np.zeros((height, width, 3), dtype=np.float32)
+        for x1, y1, x2, y2 in anchors:
+            c1, r1 = int(x1 * width), int(y1 * height)
+            c2, r2 = max(c1 + 1, int(np.ceil(x2 * width))), max(r1 + 1, int(np.ceil(y2 * height)))
+            mask[r1:r2, c1:c2] = 1.0
+        return mask.ravel()
+
+    def add_scene(self, scene_id: str, frame: np.ndarray, anchors: Optional[List[Anchor]] = None) -> None:
+        """
+        기준 프레임으로 씬 시그니처 등록
+
+        Args:
+            scene_id: 씬 이름 (예: 'title', 'character_select')
+            frame: 해당 씬의 기준 캡처 (Detection Area)
+            anchors: 씬을 구분하는 고정 UI 영역 비율 좌표 리스트 (None이면 화면 전체)
+        """
+        mask = self._anchor_mask(anchors)
+        template = self.features(frame) * mask
+        count = float(mask.sum())
+        template -= mask * (template.sum() / count)
+        norm = np.linalg.norm(template)
+        if norm > 0:
+            template /= norm
+
+        if scene_id in self.scene_ids:
+            index = self.scene_ids.index(scene_id)
+            self._templates[index] = template
+            self._masks[index] = mask
+            self._counts[index] = count
+            return
+
+        self.scene_ids.append(scene_id)
+        self._templates = np.vstack([self._templates, template[None, :]])
+        self._masks = np.vstack([self._masks, mask[None, :]])
+        self._counts = np.append(self._counts, np.float32(count))
+
+    def scores(self, frame: np.ndarray) -> np.ndarray:
+        """
+        모든 씬에 대한 마스크 NCC 점수 (-1.0 ~ 1.0)
+
+        Returns:
+            scene_ids 순서의 점수 배열
+        """
+        if not self.scene_ids:
+            return np.zeros(0, dtype=np.float32)
+
+        f = self.features(frame)
+        # 템플릿은 마스크 내 평균 0이므로 분자는 T @ f 하나로 충분
+        numerator = self._templates @ f
+        mean = (self._masks @ f) / self._counts
+        variance = self._masks @ (f * f) - self._counts * mean * mean
+        denominator = np.sqrt(np.maximum(variance, 1e-6))
+        return numerator / denominator
+
+    def classify(self, frame: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        현재 프레임의 씬 판별
+
+        Args:
+            frame: BGR 이미지 (Detection Area 캡처)
+
+        Returns:
+            (씬 이름, 신뢰도) - 신뢰도가 min_confidence 미만이면 (None, 신뢰도)
+        """
+        scores = self.scores(frame)
+        if len(scores) == 0:
+            return None, 0.0
+
+        best = int(scores.argmax())
+        confidence = float(scores[best])
+        if confidence < self.min_confidence:
+            return None, confidence
+        return self.scene_ids[best], confidence
+
+    @classmethod
+    def load(cls, path: str, min_confidence: float = SCENE_MIN_CONFIDENCE) -> 'SceneClassifier':
+        """시그니처 파일(.npz)에서 분류기 생성"""
+        with np.load(path) as data:
+            classifier = cls(tuple(int(v) for v in data['thumbnail_size']), min_confidence)
+            classifier.scene_ids = [str(s) for s in data['scene_ids']]
+            classifier._templates = data['templates'].astype(np.float32)
+            classifier._masks = data['masks'].astype(np.float32)
+            classifier._counts = data['counts'].astype(np.float32)
+        return classifier
+
+    def save(self, path: str) -> None:
+        """시그니처를 .npz 파일로 저장"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        np.savez_compressed(
+            path,
+            thumbnail_size=np.array(self.thumbnail_size),
+            scene_ids=np.array(self.scene_ids),
+            templates=self._templates,
+            masks=self._masks,
+            counts=self._counts
+        )
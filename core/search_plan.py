@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Hierarchical Search Plan
+부모 앵커(패널)를 먼저 찾고, 자식 요소는 부모 박스 안에서만 찾는 검색 계획 모듈
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import IMAGE_CONFIDENCE_THRESHOLD, SEARCH_PARENT_MARGIN
+from .exceptions import ConfigurationError, TemplateLoadError
+from .image_detector import ImageDetector
+from .pixel_signature import PixelSignature
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+@dataclass(frozen=True)
+class SearchElement:
+    """
+    검색 계획의 UI 요소 선언
+
+    Example:
+        SearchElement("character_panel", "assets/images/system/character_list_panel.png")
+        SearchElement("currency_badge", "assets/images/system/character_choice_coins.png",
+                      parent="character_panel")
+    """
+    name: str
+    template_path: str
+    parent: Optional[str] = None  # 부모 요소 이름 (None이면 프레임 전체에서 검색)
+    confidence: float = IMAGE_CONFIDENCE_THRESHOLD
+    margin: int = SEARCH_PARENT_MARGIN  # 부모 박스 주변 여유 (픽셀)
+    # 자식 검색에 쓸 이 요소의 영역 (매칭 좌상단 기준 x1, y1, x2, y2)
+    # 예) 패널 제목만 템플릿으로 쓰고 그 아래 목록 전체를 영역으로 지정, None이면 템플릿 크기
+    extent: Optional[Box] = None
+    detector: str = 'ncc'  # 'ncc' 또는 'sparse' (고정 배율 UI, 희소 픽셀 시그니처)
+
+
+class SearchPlan:
+    """
+    컴파일된 계층 검색 계획
+
+    요소 선언을 시작 시 한 번 컴파일(템플릿 로드, 부모 관계 검증)하고,
+    프레임마다 부모 박스는 한 번만 찾아 모든 자식 검색에 재사용합니다.
+    """
+
+    # 컴파일된 계획 캐시 (같은 선언은 한 번만 컴파일)
+    _compiled: Dict[Tuple[Tuple[SearchElement, ...], bool, float], 'SearchPlan'] = {}
+    _compile_lock = threading.Lock()
+
+    def __init__(self, elements: Sequence[SearchElement], strict: bool = False):
+        """
+        Args:
+            elements: 요소 선언 리스트 (부모가 자식보다 먼저 올 필요 없음)
+            strict: True면 템플릿 로드 실패 시 예외, False면 해당 요소를 제외하고
+                    그 자식은 프레임 전체에서 검색
+
+        Raises:
+            ConfigurationError: 중복 이름, 없는 부모, 순환 참조
+            TemplateLoadError: strict=True이고 템플릿 로드 실패 시
+        """
+        self.elements: Dict[str, SearchElement] = {}
+        for element in elements:
+            if element.name in self.elements:
+                raise ConfigurationError(element.name, "Duplicate search element")
+            self.elements[element.name] = element
+
+        self.templates: Dict[str, np.ndarray] = {}
+        # 매칭용 (템플릿 또는 판별 패치, 요소 중심 오프셋)
+        self.patches: Dict[str, Tuple[np.ndarray, Tuple[int, int]]] = {}
+        self.signatures: Dict[str, PixelSignature] = {}
+        for name, element in self.elements.items():
+            if element.parent is not None and element.parent not in self.elements:
+                raise ConfigurationError(name, f"Unknown parent '{element.parent}'")
+            if element.detector not in ('ncc', 'sparse'):
+                raise ConfigurationError(name, f"Unknown detector '{element.detector}'")
+            try:
+                self.templates[name] = ImageDetector.load_template(element.template_path)
+                self.patches[name] = ImageDetector.compact_template(element.template_path, self.templates[name])
+                if element.detector == 'sparse':
+                    self.signatures[name] = ImageDetector.get_signature(element.template_path, self.templates[name])
+            except TemplateLoadError:
+                if strict:
+                    raise
+                logger.warning(f"Search element '{name}' disabled: cannot load {element.template_path}")
+
+        # 조상 체인 (가까운 부모부터), 순환 참조 검사 포함
+        self.ancestors: Dict[str, List[str]] = {}
+        for name in self.elements:
+            chain: List[str] = []
+            parent = self.elements[name].parent
+            while parent is not None:
+                if parent == name or parent in chain:
+                    raise ConfigurationError(name, "Circular parent reference")
+                chain.append(parent)
+                parent = self.elements[parent].parent
+            self.ancestors[name] = chain
+
+        # (프레임, {요소 이름: 찾은 박스 또는 None}) - 프레임이 바뀌면 통째로 교체
+        self._frame_state: Tuple[Optional[np.ndarray], Dict[str, Optional[Box]]] = (None, {})
+        self.searched_pixels = 0
+        self.full_pixels = 0
+
+    @classmethod
+    def compile(cls, elements: Sequence[SearchElement], strict: bool = False) -> 'SearchPlan':
+        """
+        검색 계획 컴파일 (같은 선언이면 캐시된 계획 반환)
+
+        Args:
+            elements: 요소 선언 리스트
+            strict: 템플릿 로드 실패를 예외로 처리할지 여부
+
+        Returns:
+            SearchPlan
+        """
+        # 템플릿 배율이 바뀌면 다시 컴파일
+        key = (tuple(elements), strict, ImageDetector.template_scale)
+        with cls._compile_lock:
+            plan = cls._compiled.get(key)
+            if plan is None:
+                plan = cls(elements, strict)
+                cls._compiled[key] = plan
+            return plan
+
+    def template(self, name: str) -> Optional[np.ndarray]:
+        """요소 템플릿 (로드 실패한 요소는 None)"""
+        return self.templates.get(name)
+
+    def _state(self, frame: np.ndarray) -> Dict[str, Optional[Box]]:
+        """현재 프레임의 요소 박스 캐시 (새 프레임이면 비움)"""
+        state = self._frame_state
+        if state[0] is not frame:
+            state = (frame, {})
+            self._frame_state = state
+        return state[1]
+
+    def search_box(self, frame: np.ndarray, name: str) -> Optional[Box]:
+        """
+        요소를 검색할 프레임 영역
+
+        가장 가까운 사용 가능한 부모의 박스(+margin)를 반환합니다.
+        부모 템플릿이 없으면 그 위 조상, 조상이 모두 없으면 프레임 전체입니다.
+
+        Args:
+            frame: 현재 프레임
+            name: 요소 이름
+
+        Returns:
+            (x1, y1, x2, y2) 검색 영역, 부모가 화면에 없으면 None
+        """
+        height, width = frame.shape[:2]
+        margin = self.elements[name].margin
+
+        for ancestor in self.ancestors[name]:
+            if ancestor not in self.templates:
+                continue
+            box = self.locate_box(frame, ancestor)
+            if box is None:
+                return None
+            x1, y1, x2, y2 = box
+            return (max(0, x1 - margin), max(0, y1 - margin),
+                    min(width, x2 + margin), min(height, y2 + margin))
+
+        return (0, 0, width, height)
+
+    def locate_box(self, frame: np.ndarray, name: str) -> Optional[Box]:
+        """
+        요소의 박스 찾기 (프레임당 한 번만 검색)
+
+        Returns:
+            (x1, y1, x2, y2) 프레임 좌표, 없으면 None
+        """
+        state = self._state(frame)
+        if name in state:
+            return state[name]
+
+        box = None
+        template = self.templates.get(name)
+        area = self.search_box(frame, name) if template is not None else None
+        if area is not None:
+            match = self._match(frame, name, area)
+            if match is not None:
+                x, y, _ = match
+                h, w = template.shape[:2]
+                left, top = x - w // 2, y - h // 2
+                extent = self.elements[name].extent
+                if extent is None:
+                    dx1, dy1, dx2, dy2 = 0, 0, w, h
+                else:
+                    # extent는 원본 템플릿 픽셀 기준
+                    scale = ImageDetector.template_scale
+                    dx1, dy1, dx2, dy2 = (int(round(v * scale)) for v in extent)
+                height, width = frame.shape[:2]
+                box = (max(0, left + dx1), max(0, top + dy1),
+                       min(width, left + dx2), min(height, top + dy2))
+
+        state[name] = box
+        return box
+
+    def _match(self, frame: np.ndarray, name: str, area: Box) -> Optional[Tuple[int, int, float]]:
+        """영역 안에서 요소 찾기 (프레임 좌표 중심 반환)"""
+        x1, y1, x2, y2 = area
+        patch, center_offset = self.patches[name]
+        h, w = self.templates[name].shape[:2] if name in self.signatures else patch.shape[:2]
+        if x2 - x1 < w or y2 - y1 < h:
+            return None
+
+        self.searched_pixels += (x2 - x1) * (y2 - y1)
+        self.full_pixels += frame.shape[0] * frame.shape[1]
+
+        confidence = self.elements[name].confidence
+        if name in self.signatures:
+            result = self.signatures[name].find(frame[y1:y2, x1:x2], confidence)
+        else:
+            result = ImageDetector.find_template(frame[y1:y2, x1:x2], patch, confidence, center_offset)
+        if result is None:
+            return None
+        x, y, conf = result
+        return (x + x1, y + y1, conf)
+
+    def locate(self, frame: np.ndarray, name: str) -> Optional[Tuple[int, int, float]]:
+        """
+        요소 찾기 (부모 박스 안에서만 검색)
+
+        Args:
+            frame: 현재 프레임
+            name: 요소 이름
+
+        Returns:
+            (x, y, confidence) 프레임 좌표 중심과 신뢰도, 없으면 None
+        """
+        if name not in self.templates:
+            return None
+        area = self.search_box(frame, name)
+        if area is None:
+            return None
+        return self._match(frame, name, area)
+
+    def locate_all(
+        self,
+        frame: np.ndarray,
+        name: str,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[int, int, float]]:
+        """
+        요소의 모든 매칭 찾기 (부모 박스 안에서만, 중복 제거, 항상 NCC)
+
+        Args:
+            frame: 현재 프레임
+            name: 요소 이름
+            threshold: 최소 신뢰도 (None이면 요소의 confidence)
+
+        Returns:
+            [(x, y, confidence), ...] 프레임 좌표
+        """
+        template = self.templates.get(name)
+        area = self.search_box(frame, name) if template is not None else None
+        if area is None:
+            return []
+
+        x1, y1, x2, y2 = area
+        patch, center_offset = self.patches[name]
+        if x2 - x1 < patch.shape[1] or y2 - y1 < patch.shape[0]:
+            return []
+
+        self.searched_pixels += (x2 - x1) * (y2 - y1)
+        self.full_pixels += frame.shape[0] * frame.shape[1]
+
+        threshold = self.elements[name].confidence if threshold is None else threshold
+        matches = ImageDetector.find_all_templates(frame[y1:y2, x1:x2], patch, threshold, center_offset)
+        h, w = template.shape[:2]
+        matches = ImageDetector.remove_duplicates(matches, max(1, min(w, h) // 2))
+        return [(int(x) + x1, int(y) + y1, float(conf)) for x, y, conf in matches]
+
+    def get_stats(self) -> Dict[str, float]:
+        """검색한 픽셀 비율 통계 (전체 프레임 검색 대비)"""
+        ratio = self.searched_pixels / self.full_pixels if self.full_pixels else 1.0
+        return {
+            'searched_pixels': self.searched_pixels,
+            'full_pixels': self.full_pixels,
+            'pixel_ratio': ratio
+        }
@@ -5,20 +5,86 @@ Story Base Module
 """
 
 import sys
+import asyncio
 import datetime
+import threading
 import time
-import cv2
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from core.monitor import Monitor
 from core.automation import Automation
+from core.image_detector import ImageDetector
+from core.prefetch import Prefetch
+from core.conditions import Check, Condition, Frame, PollPolicy, WaitResult
+from core.config import StoryConfig
+from core.checkpoint import StoryCheckpoint
+from core.constants import PREFETCH_INTERVAL, RETRY_WAIT_TIMEOUT, STEP_DEADLINE, CHECKPOINT_MAX_AGE
 
 if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+@dataclass
+class Step:
+    """
+    스토리 단계 (탐지 -> 동작 -> 확인)
+
+    detect/confirm은 Condition 또는 인자 없는 함수 (참인 값을 반환하면 만족)이고,
+    deadline 안에 만족하지 않으면 그 단계만 다시 시도합니다. 재시도를 모두 쓰면
+    fallback 단계로 가고, fallback이 없으면 스토리가 실패합니다.
+
+    pre_delay/delay 대기는 act 밖에서 하므로 asyncio 런타임에서 입력 잠금과 스레드를 점유하지 않습니다.
+    prefetch가 켜져 있으면 act 직후 다음 단계의 detect를 백그라운드에서 시작하고,
+    delay 대기는 다음 단계 대상이 보이는 즉시 끝나며 다음 단계는 그 결과를 바로 사용합니다.
+
+    Example:
+        Step("start", detect=TemplatePresent("assets/images/UI/game_start.png"),
+             act=lambda pos: self.click_at(*pos), next="select", deadline=10,
+             delay=3, prefetch=True)
+    """
+    name: str
+    detect: Optional[Union[Condition, Callable[[], Any]]] = None  # 값은 act에 전달
+    act: Optional[Callable[[Any], Any]] = None  # False를 반환하면 실패
+    confirm: Optional[Union[Condition, Callable[[], Any]]] = None  # 동작이 반영되었는지 확인
+    next: Optional[str] = None  # 성공 시 다음 단계 (None이면 스토리 완료)
+    fallback: Optional[str] = None  # 재시도를 모두 실패했을 때 갈 단계
+    deadline: float = STEP_DEADLINE  # 시도당 detect/confirm 대기 한도 (초)
+    retries: Optional[int] = None  # 재시도 횟수 (None이면 StoryConfig.retry_count)
+    scene: Optional[str] = None  # 이 단계를 시작할 때의 씬 (재시작 시 현재 씬으로 시작 단계 결정)
+    pre_delay: float = 0.0  # detect 후 act 전 대기 (초, 버튼이 보인 뒤 눌리기까지)
+    delay: float = 0.0  # act 후 confirm/다음 단계 전 최대 대기 (초, 화면 전환 시간)
+    prefetch: bool = False  # act 직후 다음 단계 detect를 미리 시작 (찾으면 delay를 일찍 끝냄)
+
+
+@dataclass
+class StepTiming:
+    """단계 시도 한 번의 기록"""
+    step: str
+    attempt: int
+    status: str  # ok, detect_timeout, act_failed, confirm_timeout, error, cancelled, story_timeout
+    detect: float = 0.0  # 초
+    act: float = 0.0
+    confirm: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.detect + self.act + self.confirm
+
+
 class StoryBase:
     """스토리 베이스 클래스"""
 
+    # 씬 분류기 (MainRunner에서 설정, 모든 스토리 공유)
+    scene_classifier = None
+
+    # 체크포인트 폴더 (MainRunner에서 설정, None이면 체크포인트 사용 안 함)
+    checkpoint_dir = None
+    checkpoint_max_age = CHECKPOINT_MAX_AGE
+
+    # 캡처 + 탐지 워커 프로세스 (MainRunner에서 설정, None이면 이 프로세스에서 탐지)
+    detection_process = None
+
     def __init__(self, name, description=""):
         """
         Args:
@@ -32,6 +98,14 @@ class StoryBase:
         self.status = "ready"  # ready, running, completed, failed
         self.log_enabled = True
         self.realtime_monitor = None  # MainRunner에서 설정될 수 있음
+        self._prefetches = []  # 실행 중인 미리 탐지 (스토리 종료 시 모두 중지)
+        self._step_prefetch = None  # (다음 단계 이름, 조건, Prefetch 또는 asyncio 태스크) - Step.prefetch
+        self.cancel_event = threading.Event()  # cancel()로 설정, 진행 중인 대기를 즉시 끝냄
+        self.story_config = StoryConfig()  # config.json "stories" 항목 (timeout, retry_count)
+        self.step_timings: List[StepTiming] = []  # run_steps()의 단계별 기록
+        self.context: Dict[str, Any] = {}  # 체크포인트에 저장할 값 (remember()로 기록)
+        self.completed_steps: List[str] = []  # 이번 실행(이어서 실행 포함)에서 완료한 단계
+        self.instance_name = None  # 멀티 인스턴스 실행 시 InstanceManager에서 설정
 
     def log(self, message):
         """로그 출력"""
@@ -67,11 +141,7 @@ class StoryBase:
 
     def run(self):
         """스토리 실행 (메인 실행 메서드)"""
-        self.log("=" * 60)
-        self.log(f"Starting story: {self.name}")
-        if self.description:
-            self.log(f"Description: {self.description}")
-        self.log("=" * 60)
+        self._begin_run()
 
         try:
             # 사전 조건 확인
@@ -82,17 +152,7 @@ class StoryBase:
 
             # 스토리 실행
             self.status = "running"
-            result = self.start()
-
-            # 결과 처리
-            if result:
-                self.status = "completed"
-                self.log("✓ Story completed successfully")
-            else:
-                self.status = "failed"
-                self.log("❌ Story failed")
-
-            return result
+            return self._finish_run(self.start())
 
         except KeyboardInterrupt:
             self.log("⚠ Story interrupted by user")
@@ -100,18 +160,99 @@ class StoryBase:
             return False
 
         except Exception as e:
-            self.log(f"❌ Error occurred: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self._fail_run(e)
+            return False
+
+        finally:
+            self._end_run()
+
+    async def astart(self, runtime):
+        """
+        스토리 시작 (코루틴, AsyncRuntime에서 실행할 때)
+
+        기본 구현은 start()를 작업 스레드에서 실행합니다. 단계 그래프 스토리는
+        `return await self.arun_steps(runtime, self.build_steps())`로 오버라이드하면
+        대기 중에 스레드를 점유하지 않습니다.
+
+        Args:
+            runtime: AsyncRuntime
+
+        Returns:
+            bool: 성공 여부
+        """
+        return await runtime.offload(self.start)
+
+    async def arun(self, runtime):
+        """
+        스토리 실행 (run()의 코루틴 버전)
+
+        태스크가 취소되면 cancel_event를 설정해 작업 스레드에서 진행 중인 대기도 끝냅니다.
+
+        Args:
+            runtime: AsyncRuntime
+
+        Returns:
+            bool: 성공 여부
+        """
+        self._begin_run()
+
+        try:
+            if not await runtime.offload(self.check_precondition):
+                self.log("❌ Precondition check failed")
+                self.status = "failed"
+                return False
+
+            self.status = "running"
+            return self._finish_run(await self.astart(runtime))
+
+        except asyncio.CancelledError:
+            self.cancel()
+            self.log("⚠ Story cancelled")
             self.status = "failed"
+            raise
+
+        except Exception as e:
+            self._fail_run(e)
             return False
 
         finally:
-            # 정리 작업
-            self.cleanup()
-            self.log("=" * 60)
-            self.log(f"Story ended: {self.name} (Status: {self.status})")
-            self.log("=" * 60)
+            self._end_run()
+
+    def _begin_run(self):
+        """실행 시작 로그 및 취소 상태 초기화"""
+        self.log("=" * 60)
+        self.log(f"Starting story: {self.name}")
+        if self.description:
+            self.log(f"Description: {self.description}")
+        self.log("=" * 60)
+        self.cancel_event.clear()
+
+    def _finish_run(self, result):
+        """결과 처리 (상태 설정 후 결과 그대로 반환)"""
+        if result:
+            self.status = "completed"
+            self.log("✓ Story completed successfully")
+        else:
+            self.status = "failed"
+            self.log("❌ Story failed")
+        return result
+
+    def _fail_run(self, error):
+        """실행 중 예외 처리"""
+        self.log(f"❌ Error occurred: {str(error)}")
+        import traceback
+        traceback.print_exc()
+        self.status = "failed"
+
+    def _end_run(self):
+        """정리 작업 (남은 미리 탐지 중지)"""
+        for prefetch in self._prefetches:
+            prefetch.cancel()
+        self._prefetches = []
+        self.cleanup()
+        self.log("=" * 60)
+        self.log(f"Story ended: {self.name} (Status: {self.status})")
+        self.log("=" * 60)
 
     def wait_and_click(self, image_path, timeout=10, delay=0):
         """
@@ -145,25 +286,564 @@ class StoryBase:
         """
         return self.monitor.wait_for_color(x, y, color, timeout)
 
-    def smart_sleep(self, seconds: float) -> None:
+    def identify_scene(self, area=None):
+        """
+        현재 화면의 씬 판별
+
+        Args:
+            area: 캡처 영역 (None이면 스토리의 detection_area)
+
+        Returns:
+            (씬 이름, 신뢰도) - 분류기가 없거나 알 수 없으면 (None, 신뢰도)
+        """
+        if self.scene_classifier is None:
+            return None, 0.0
+
+        area = area or getattr(self, 'detection_area', None)
+        scene_id, confidence = self.scene_classifier.classify(ImageDetector.capture_screen(area))
+        self.log(f"Scene: {scene_id or 'unknown'} ({confidence:.2f})")
+        return scene_id, confidence
+
+    def prefetch(self, detect, interval=PREFETCH_INTERVAL, name="next step"):
         """
-        스마트 대기 - OpenCV 창 업데이트를 유지하면서 대기
+        다음 단계가 찾을 대상을 선언하고 백그라운드에서 미리 탐지 시작
+
+        클릭 직전에 호출한 뒤 smart_sleep(seconds, until=prefetch)로 기다리면
+        대상이 나타나는 즉시 대기가 끝나고 take()로 결과를 바로 넘겨받습니다.
 
         Args:
-            seconds: 대기 시간 (초)
+            detect: 탐지 함수 (찾지 못하면 None 또는 빈 값 반환, 로그 없이 조용히 실행 권장)
+            interval: 탐지 반복 간격 (초)
+            name: 로그용 이름
+
+        Returns:
+            Prefetch 객체
         """
-        if seconds <= 0:
+        prefetch = Prefetch(detect, interval=interval, name=name)
+        self._prefetches = [p for p in self._prefetches if not p.done()] + [prefetch]
+        return prefetch
+
+    def take_prefetched(self, prefetch):
+        """
+        미리 탐지한 결과 가져오기 (탐지 중지)
+
+        Args:
+            prefetch: prefetch()가 반환한 객체
+
+        Returns:
+            첫 양성 결과, 대기 중에 찾지 못했으면 None
+        """
+        result = prefetch.take()
+        if result:
+            self.log(f"✓ {prefetch.name} ready after {prefetch.latency:.2f}s (prefetched, {prefetch.attempts} attempts)")
+        return result
+
+    def cancel(self):
+        """진행 중인 wait_until / smart_sleep 취소 (다른 스레드에서 호출 가능)"""
+        self.cancel_event.set()
+
+    def wait_until(self, predicate, timeout=RETRY_WAIT_TIMEOUT, poll_policy=None, area=None):
+        """
+        조건이 만족될 때까지 대기
+
+        폴링마다 화면을 한 번만 캡처해 모든 조건이 공유하고, 폴링 사이에는 cancel_event를
+        기다리므로 cancel()을 호출하면 바로 돌아옵니다. GUI 이벤트 루프와 무관합니다
+        (미리보기 창은 RealtimeMonitor 스레드가 갱신).
+
+        Args:
+            predicate: core.conditions의 Condition (|, &, ~로 조합 가능)
+            timeout: 최대 대기 시간 (초)
+            poll_policy: 폴링 간격 정책 (None이면 기본 PollPolicy)
+            area: 캡처 영역 (None이면 스토리의 detection_area)
+
+        Returns:
+            WaitResult - 만족한 조건 이름, 값, 지연 시간 (bool로 만족 여부 확인)
+
+        탐지 워커 프로세스가 있으면 조건은 워커가 게시한 최신 프레임에서 평가됩니다.
+        """
+        poll_policy = poll_policy or PollPolicy()
+        area = area or getattr(self, 'detection_area', None)
+        predicate.reset()
+
+        started = time.perf_counter()
+        deadline = started + timeout
+        polls = 0
+
+        for delay in poll_policy.delays():
+            polls += 1
+            value, fired = self._evaluate(predicate, area)
+            now = time.perf_counter()
+            if value:
+                return WaitResult('fired', fired, value, now - started, polls)
+
+            remaining = deadline - now
+            if remaining <= 0:
+                return WaitResult('timeout', None, None, now - started, polls)
+            if self.cancel_event.wait(min(delay, remaining)):
+                return WaitResult('cancelled', None, None, time.perf_counter() - started, polls)
+
+    def _evaluate(self, predicate, area):
+        """
+        조건을 새 프레임에서 한 번 평가 (탐지 워커 프로세스가 있으면 워커에서)
+
+        Returns:
+            (값, 만족한 조건 이름) - 워커에서 평가하면 이쪽 조건의 fired()가 갱신되지 않으므로 이름을 함께 받음
+        """
+        if self.detection_process is not None:
+            return self.detection_process.evaluate_fired(predicate, area)
+        value = predicate.evaluate(Frame(area))
+        return value, predicate.fired()
+
+    @property
+    def checkpoint(self):
+        """이 스토리(와 인스턴스)의 StoryCheckpoint, checkpoint_dir이 없으면 None"""
+        if not self.checkpoint_dir:
+            return None
+        path = StoryCheckpoint.path_for(self.checkpoint_dir, self.name, self.instance_name)
+        return StoryCheckpoint(path, self.checkpoint_max_age)
+
+    def remember(self, key, value):
+        """
+        체크포인트에 함께 저장할 값 기록 (탐지한 위치, 선택한 캐릭터 등)
+
+        Args:
+            key: 이름
+            value: JSON으로 저장 가능한 값 (튜플은 리스트로 저장됨)
+        """
+        self.context[key] = value
+
+    def resume_step(self, steps: Sequence[Step], default: Optional[str] = None) -> str:
+        """
+        이어서 실행할 단계 결정
+
+        체크포인트가 있으면 저장된 단계와 context를 복원하고, 씬 분류기가 있으면 현재 씬을 다시
+        판별해 확인합니다. 현재 씬에서 시작하는 단계가 있으면 그 단계로 이동하되, 저장된 단계가
+        그 씬의 단계에서 (다른 씬을 거치지 않고) 이어지는 단계면 저장된 단계에서 이어서 실행합니다.
+
+        Args:
+            steps: 단계 목록
+            default: 체크포인트도 씬 일치도 없을 때 시작 단계 (None이면 첫 단계)
+
+        Returns:
+            시작 단계 이름
+        """
+        names = [step.name for step in steps]
+        checkpoint = self.checkpoint
+        data = checkpoint.load() if checkpoint is not None else None
+
+        saved = None
+        if data is not None and data['step'] in names:
+            saved = next(step for step in steps if step.name == data['step'])
+            self.context = dict(data.get('context') or {})
+            self.completed_steps = list(data.get('completed') or [])
+
+        scene_id = None
+        if self.scene_classifier is not None:
+            scene_id, _ = self.identify_scene()
+        scene_step = next((step for step in steps if scene_id and step.scene == scene_id), None)
+
+        if saved is not None and (scene_step is None or self._follows(steps, scene_step, saved)):
+            self.log(f"↻ Resuming from checkpoint: '{saved.name}' (completed: {', '.join(self.completed_steps) or '-'})")
+            return saved.name
+        if scene_step is not None:
+            if saved is not None:
+                self.log(f"↻ Checkpoint step '{saved.name}' does not match scene '{scene_id}'")
+                if scene_step.name in self.completed_steps:
+                    self.completed_steps = self.completed_steps[:self.completed_steps.index(scene_step.name)]
+            self.log(f"↻ Starting from '{scene_step.name}' (scene: {scene_id})")
+            return scene_step.name
+        return default or names[0]
+
+    @staticmethod
+    def _follows(steps: Sequence[Step], anchor: Step, step: Step) -> bool:
+        """
+        step이 anchor 단계의 씬에서 이어지는 단계인지 (next/fallback을 따라 다른 씬의 단계를 거치지 않고 도달)
+        """
+        graph = {s.name: s for s in steps}
+        pending, seen = [anchor.name], set()
+        while pending:
+            name = pending.pop()
+            if name in seen or name not in graph:
+                continue
+            seen.add(name)
+            current = graph[name]
+            if current is not anchor and current.scene not in (None, anchor.scene):
+                continue
+            if name == step.name:
+                return True
+            pending.extend(target for target in (current.next, current.fallback) if target is not None)
+        return False
+
+    def run_steps(self, steps: Sequence[Step], start: Optional[str] = None, resume: bool = True) -> bool:
+        """
+        단계 그래프 실행
+
+        각 단계는 detect -> act -> confirm 순서로 실행하고, 실패하면 그 단계만 재시도합니다.
+        스토리 전체는 StoryConfig.timeout 안에 끝나야 하며 단계 대기 한도도 남은 시간으로 줄어듭니다.
+        단계가 성공할 때마다 다음 단계와 context를 체크포인트에 저장하고, 스토리를 끝까지 마치면 삭제합니다.
+        단계가 최종 실패하면 체크포인트를 마지막 씬 기준 단계(Step.scene)로 되돌립니다.
+
+        Args:
+            steps: 단계 목록 (이름은 고유해야 함)
+            start: 시작 단계 이름 (None이면 resume_step()으로 결정)
+            resume: start가 없을 때 체크포인트/현재 씬으로 시작 단계 결정 (False면 첫 단계)
+
+        Returns:
+            마지막 단계까지 성공하면 True
+
+        Raises:
+            ValueError: 단계 이름이 중복되거나 없는 단계를 가리킬 때
+        """
+        graph, name = self._prepare_steps(steps, start, resume)
+        checkpoint = self.checkpoint
+        story_deadline = time.perf_counter() + self.story_config.timeout
+
+        try:
+            while name is not None:
+                step = graph[name]
+                retries = self._step_retries(step)
+                for attempt in range(1, retries + 2):
+                    timing = self._run_step(step, attempt, story_deadline, graph.get(step.next))
+                    if self._attempt_finished(step, timing, attempt, retries):
+                        break
+                ok, name = self._advance(graph, step, timing, retries, checkpoint)
+                if not ok:
+                    return False
+            return True
+        finally:
+            self._drop_step_prefetch()
+            self.log_step_timings()
+
+    async def arun_steps(self, runtime, steps: Sequence[Step], start: Optional[str] = None, resume: bool = True) -> bool:
+        """
+        단계 그래프 실행 (run_steps()의 코루틴 버전)
+
+        탐지 대기는 AsyncRuntime.wait_until()로 이벤트 루프에 양보하고, act는 AsyncRuntime.input()으로
+        다른 스토리의 입력과 겹치지 않게 작업 스레드에서 실행합니다.
+
+        Args:
+            runtime: AsyncRuntime
+            steps: 단계 목록 (이름은 고유해야 함)
+            start: 시작 단계 이름 (None이면 resume_step()으로 결정)
+            resume: start가 없을 때 체크포인트/현재 씬으로 시작 단계 결정 (False면 첫 단계)
+
+        Returns:
+            마지막 단계까지 성공하면 True
+        """
+        # 씬 판별(캡처 + 분류)이 들어 있으므로 작업 스레드에서 실행
+        graph, name = await runtime.offload(self._prepare_steps, steps, start, resume)
+        checkpoint = self.checkpoint
+        story_deadline = time.perf_counter() + self.story_config.timeout
+
+        try:
+            while name is not None:
+                step = graph[name]
+                retries = self._step_retries(step)
+                for attempt in range(1, retries + 2):
+                    timing = await self._arun_step(runtime, step, attempt, story_deadline, graph.get(step.next))
+                    if self._attempt_finished(step, timing, attempt, retries):
+                        break
+                ok, name = self._advance(graph, step, timing, retries, checkpoint)
+                if not ok:
+                    return False
+            return True
+        finally:
+            self._drop_step_prefetch()
+            self.log_step_timings()
+
+    def _prepare_steps(self, steps: Sequence[Step], start: Optional[str], resume: bool):
+        """
+        단계 그래프 검사 및 시작 단계 결정
+
+        Returns:
+            (이름 -> Step 딕셔너리, 시작 단계 이름)
+
+        Raises:
+            ValueError: 단계 이름이 중복되거나 없는 단계를 가리킬 때
+        """
+        graph: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in graph:
+                raise ValueError(f"Duplicate step: {step.name}")
+            graph[step.name] = step
+        for step in steps:
+            for target in (step.next, step.fallback):
+                if target is not None and target not in graph:
+                    raise ValueError(f"Step '{step.name}' points to unknown step '{target}'")
+
+        self.step_timings = []
+        if start is None:
+            self.context = {}
+            self.completed_steps = []
+            start = self.resume_step(steps) if resume else steps[0].name
+        if start not in graph:
+            raise ValueError(f"Unknown start step: {start}")
+        return graph, start
+
+    def _step_retries(self, step: Step) -> int:
+        """단계 재시도 횟수 (Step.retries가 없으면 StoryConfig.retry_count)"""
+        return self.story_config.retry_count if step.retries is None else step.retries
+
+    def _attempt_finished(self, step: Step, timing: StepTiming, attempt: int, retries: int) -> bool:
+        """시도 기록 후 재시도를 멈출지 여부 (성공, 취소, 스토리 시간 초과)"""
+        self.step_timings.append(timing)
+        if timing.status in ('ok', 'cancelled', 'story_timeout'):
+            return True
+        self.log(f"⚠ Step '{step.name}' failed ({timing.status}, attempt {attempt}/{retries + 1})")
+        return False
+
+    def _advance(self, graph: Dict[str, Step], step: Step, timing: StepTiming, retries: int,
+                 checkpoint: Optional[StoryCheckpoint]):
+        """
+        단계의 마지막 시도 결과로 다음 단계 결정
+
+        Returns:
+            (계속 진행 여부, 다음 단계 이름 또는 None)
+        """
+        if timing.status == 'ok':
+            self.completed_steps.append(step.name)
+            if checkpoint is not None:
+                self._save_checkpoint(checkpoint, step.next)
+            return True, step.next
+        if timing.status in ('cancelled', 'story_timeout'):
+            self.log(f"❌ Step '{step.name}' stopped: {timing.status}")
+            return False, None
+        if step.fallback is not None:
+            self.log(f"↪ Step '{step.name}' falling back to '{step.fallback}'")
+            return True, step.fallback
+        self.log(f"❌ Step '{step.name}' failed after {retries + 1} attempts")
+        if checkpoint is not None:
+            self._rewind_checkpoint(checkpoint, graph, step)
+        return False, None
+
+    def _rewind_checkpoint(self, checkpoint: StoryCheckpoint, graph: Dict[str, Step], failed: Step) -> None:
+        """
+        최종 실패 시 체크포인트를 마지막 씬 기준 단계로 되돌림 (없으면 삭제)
+
+        실패한 단계에서 다시 시작하면 화면이 이미 바뀌었을 수 있으므로, 재시작 시 씬으로 확인할 수 있는
+        단계부터 다시 실행합니다.
+        """
+        names = self.completed_steps + [failed.name]
+        for index in range(len(names) - 1, -1, -1):
+            step = graph.get(names[index])
+            if step is not None and step.scene is not None:
+                self.log(f"↺ Checkpoint reset to '{step.name}' (scene: {step.scene})")
+                try:
+                    checkpoint.save(self.name, step.name, self.completed_steps[:index], self.context)
+                except (OSError, TypeError, ValueError) as e:
+                    self.log(f"⚠ Checkpoint not saved: {e}")
+                return
+        self._save_checkpoint(checkpoint, None)
+
+    def _save_checkpoint(self, checkpoint: StoryCheckpoint, next_step: Optional[str]) -> None:
+        """다음 단계 저장 (스토리를 끝까지 마쳤으면 삭제, 저장 실패는 실행에 영향 없음)"""
+        try:
+            if next_step is None:
+                checkpoint.clear()
+            else:
+                checkpoint.save(self.name, next_step, self.completed_steps, self.context)
+        except (OSError, TypeError, ValueError) as e:
+            self.log(f"⚠ Checkpoint not saved: {e}")
+
+    @staticmethod
+    def _step_condition(step: Step, predicate) -> Condition:
+        """detect/confirm을 Condition으로 (함수면 Check로 감쌈)"""
+        return predicate if isinstance(predicate, Condition) else Check(predicate, name=step.name)
+
+    def _prefetch_step(self, next_step: Step) -> Prefetch:
+        """다음 단계 detect를 백그라운드에서 시작 (Step.prefetch)"""
+        predicate = self._step_condition(next_step, next_step.detect)
+        predicate.reset()
+        area = getattr(self, 'detection_area', None)
+
+        def detect():
+            value, fired = self._evaluate(predicate, area)
+            return (value, fired) if value else None
+
+        prefetch = self.prefetch(detect, name=f"step '{next_step.name}'")
+        self._step_prefetch = (next_step.name, predicate, prefetch)
+        return prefetch
+
+    def _take_step_prefetch(self, step: Step) -> Optional[WaitResult]:
+        """이 단계 detect를 미리 찾아 두었으면 그 결과 (아니면 미리 탐지를 멈추고 None)"""
+        pending, self._step_prefetch = self._step_prefetch, None
+        if pending is None:
+            return None
+        name, _, prefetch = pending
+        result = self.take_prefetched(prefetch)
+        # 같은 조건으로 다시 대기하기 전에 진행 중인 탐지가 끝나기를 기다림
+        prefetch.join()
+        if name != step.name or not result:
+            return None
+        value, fired = result
+        return WaitResult('fired', fired, value, 0.0, prefetch.attempts)
+
+    def _drop_step_prefetch(self) -> None:
+        """사용하지 않은 다음 단계 미리 탐지 중지"""
+        pending, self._step_prefetch = self._step_prefetch, None
+        if pending is not None:
+            pending[2].cancel()
+
+    def _run_step(self, step: Step, attempt: int, story_deadline: float, next_step: Optional[Step] = None) -> StepTiming:
+        """단계 한 번 시도 (detect -> pre_delay -> act -> delay -> confirm)"""
+        timing = StepTiming(step.name, attempt, 'ok')
+
+        def wait(predicate):
+            remaining = story_deadline - time.perf_counter()
+            if remaining <= 0:
+                return WaitResult('story_timeout')
+            try:
+                return self.wait_until(self._step_condition(step, predicate), timeout=min(step.deadline, remaining))
+            except Exception as e:
+                # 템플릿 누락 등은 이 단계의 실패로 처리 (재시도/대체 단계로 진행)
+                self.log(f"❌ Step '{step.name}' error: {e}")
+                return WaitResult('error')
+
+        value = None
+        prefetched = self._take_step_prefetch(step)
+        if step.detect is not None:
+            result = prefetched or wait(step.detect)
+            timing.detect = result.latency
+            if not result:
+                timing.status = result.status if result.status != 'timeout' else 'detect_timeout'
+                return timing
+            value = result.value
+
+        if step.pre_delay > 0 and self.cancel_event.wait(step.pre_delay):
+            timing.status = 'cancelled'
+            return timing
+
+        if step.act is not None:
+            started = time.perf_counter()
+            try:
+                outcome = step.act(value)
+            except Exception as e:
+                self.log(f"❌ Step '{step.name}' action error: {e}")
+                outcome = False
+            timing.act = time.perf_counter() - started
+            if outcome is False:
+                timing.status = 'act_failed'
+                return timing
+
+        prefetch = None
+        if step.prefetch and next_step is not None and next_step.detect is not None:
+            prefetch = self._prefetch_step(next_step)
+        self.smart_sleep(step.delay, until=prefetch)
+
+        if step.confirm is not None:
+            result = wait(step.confirm)
+            timing.confirm = result.latency
+            if not result:
+                timing.status = result.status if result.status != 'timeout' else 'confirm_timeout'
+
+        return timing
+
+    async def _atake_step_prefetch(self, step: Step) -> Optional[WaitResult]:
+        """_take_step_prefetch()의 코루틴 버전 (미리 탐지는 asyncio 태스크)"""
+        pending, self._step_prefetch = self._step_prefetch, None
+        if pending is None:
+            return None
+        name, _, task = pending
+        if name == step.name and task.done() and not task.cancelled() and task.exception() is None:
+            result = task.result()
+            if result:
+                self.log(f"✓ step '{name}' ready after {result.latency:.2f}s (prefetched, {result.polls} polls)")
+                return WaitResult(result.status, result.condition, result.value, 0.0, result.polls)
+            return None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return None
+
+    async def _arun_step(self, runtime, step: Step, attempt: int, story_deadline: float,
+                         next_step: Optional[Step] = None) -> StepTiming:
+        """단계 한 번 시도 (_run_step()의 코루틴 버전, pre_delay/delay는 asyncio.sleep)"""
+        timing = StepTiming(step.name, attempt, 'ok')
+        area = getattr(self, 'detection_area', None)
+
+        async def wait(predicate, owner=step):
+            remaining = story_deadline - time.perf_counter()
+            if remaining <= 0:
+                return WaitResult('story_timeout')
+            try:
+                return await runtime.wait_until(
+                    self._step_condition(owner, predicate), timeout=min(owner.deadline, remaining),
+                    area=area, cancel_event=self.cancel_event
+                )
+            except Exception as e:
+                self.log(f"❌ Step '{owner.name}' error: {e}")
+                return WaitResult('error')
+
+        value = None
+        prefetched = await self._atake_step_prefetch(step)
+        if step.detect is not None:
+            result = prefetched or await wait(step.detect)
+            timing.detect = result.latency
+            if not result:
+                timing.status = result.status if result.status != 'timeout' else 'detect_timeout'
+                return timing
+            value = result.value
+
+        if step.pre_delay > 0:
+            await asyncio.sleep(step.pre_delay)
+
+        if step.act is not None:
+            started = time.perf_counter()
+            try:
+                outcome = await runtime.input(step.act, value)
+            except Exception as e:
+                self.log(f"❌ Step '{step.name}' action error: {e}")
+                outcome = False
+            timing.act = time.perf_counter() - started
+            if outcome is False:
+                timing.status = 'act_failed'
+                return timing
+
+        task = None
+        if step.prefetch and next_step is not None and next_step.detect is not None:
+            task = asyncio.ensure_future(wait(next_step.detect, owner=next_step))
+            self._step_prefetch = (next_step.name, next_step.detect, task)
+        if step.delay > 0:
+            if task is not None:
+                await asyncio.wait({task}, timeout=step.delay)
+            else:
+                await asyncio.sleep(step.delay)
+
+        if step.confirm is not None:
+            result = await wait(step.confirm)
+            timing.confirm = result.latency
+            if not result:
+                timing.status = result.status if result.status != 'timeout' else 'confirm_timeout'
+
+        return timing
+
+    def log_step_timings(self):
+        """단계별 기록 출력 (run_steps 종료 시 자동 호출)"""
+        if not self.step_timings:
             return
+        self.log("Step timings:")
+        for t in self.step_timings:
+            self.log(f"  {t.step} #{t.attempt}: {t.status} - detect {t.detect:.2f}s, "
+                     f"act {t.act:.2f}s, confirm {t.confirm:.2f}s")
+
+    def smart_sleep(self, seconds: float, until=None) -> bool:
+        """
+        스마트 대기 - 취소 가능한 대기 (미리 탐지 결과가 나오면 일찍 종료)
+
+        Args:
+            seconds: 최대 대기 시간 (초)
+            until: Prefetch 객체 (주어지면 결과가 나오는 즉시 대기 종료)
+
+        Returns:
+            until의 결과가 나와서 일찍 끝났으면 True
+        """
+        if seconds <= 0:
+            return False
+        if until is None:
+            self.cancel_event.wait(seconds)
+            return False
 
-        # 100ms 단위로 나눠서 대기
-        steps = int(seconds * 10)
-        for _ in range(steps):
-            # OpenCV 창 업데이트를 위한 waitKey 호출
-            cv2.waitKey(1)
-            time.sleep(0.1)
-
-        # 남은 시간 대기
-        remaining = seconds - (steps * 0.1)
-        if remaining > 0:
-            cv2.waitKey(1)
-            time.sleep(remaining)
+        result = self.wait_until(
+            Check(until.done, name=until.name), timeout=seconds,
+            poll_policy=PollPolicy(interval=0.02, backoff=1.0)
+        )
+        return bool(result)
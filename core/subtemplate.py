@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Discriminative Sub-Template Module
+전체 버튼 템플릿 대신 참조 프레임에서 유일한 가장 작은 부분 패치로 매칭하는 모듈
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    IMAGE_CONFIDENCE_THRESHOLD,
+    SUBTEMPLATE_MIN_MARGIN,
+    SUBTEMPLATE_MIN_SIZE
+)
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+# 후보 패치 크기 (템플릿 가로/세로 대비 비율)
+PATCH_SCALES = (0.25, 0.35, 0.5, 0.7)
+PATCH_MIN_STD = 12.0  # 단색 패치 제외 기준 (밝기 표준편차)
+
+
+@dataclass
+class SubTemplate:
+    """전체 템플릿 안의 판별 패치"""
+    box: Box  # 전체 템플릿 좌표 (x1, y1, x2, y2)
+    full_size: Tuple[int, int]  # 전체 템플릿 크기 (width, height)
+    margin: float = 0.0  # 참조 프레임에서의 최소 점수 여유
+
+    @property
+    def center_offset(self) -> Tuple[int, int]:
+        """패치 좌상단에서 전체 요소 중심까지의 오프셋 (dx, dy)"""
+        width, height = self.full_size
+        return (width // 2 - self.box[0], height // 2 - self.box[1])
+
+    def crop(self, template: np.ndarray) -> np.ndarray:
+        """전체 템플릿에서 패치 잘라내기"""
+        x1, y1, x2, y2 = self.box
+        return template[y1:y2, x1:x2].copy()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'box': list(self.box), 'full_size': list(self.full_size), 'margin': round(self.margin, 4)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SubTemplate':
+        return cls(tuple(data['box']), tuple(data['full_size']), data.get('margin', 0.0))
+
+
+class SubTemplateIndex:
+    """템플릿 경로 -> 판별 패치 매니페스트 (JSON)"""
+
+    def __init__(self, entries: Optional[Dict[str, SubTemplate]] = None):
+        self.entries: Dict[str, SubTemplate] = {}
+        for path, sub in (entries or {}).items():
+            self.set(path, sub)
+
+    @staticmethod
+    def _key(template_path: str) -> str:
+        """경로 정규화 (구분자/상대 경로 차이 무시)"""
+        return os.path.normpath(template_path).replace('\\', '/')
+
+    def get(self, template_path: str) -> Optional[SubTemplate]:
+        return self.entries.get(self._key(template_path))
+
+    def set(self, template_path: str, sub: SubTemplate) -> None:
+        self.entries[self._key(template_path)] = sub
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: str) -> 'SubTemplateIndex':
+        """매니페스트 파일 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls({p: SubTemplate.from_dict(d) for p, d in data.get('templates', {}).items()})
+
+    def save(self, path: str) -> None:
+        """매니페스트 파일 저장"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        data = {'templates': {p: sub.to_dict() for p, sub in sorted(self.entries.items())}}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _second_peak(result: np.ndarray, loc: Tuple[int, int], width: int, height: int) -> float:
+    """loc 주변(요소 크기)을 제외한 최고 점수"""
+    x, y = loc
+    masked = result.copy()
+    masked[max(0, y - height // 2):y + height // 2 + 1, max(0, x - width // 2):x + width // 2 + 1] = -1.0
+    return float(masked.max())
+
+
+def _margin(result: np.ndarray, expected: Optional[Tuple[int, int]], width: int, height: int, confidence: float) -> float:
+    """
+    한 프레임에서의 점수 여유
+
+    요소가 있는 프레임: 정답 위치 점수 - 그 외 최고 점수 (정답 점수가 confidence 미만이면 음수)
+    요소가 없는 프레임: confidence - 최고 점수
+    """
+    if expected is None:
+        return confidence - float(result.max())
+
+    x, y = expected
+    if y >= result.shape[0] or x >= result.shape[1]:
+        return -1.0
+    true_score = float(result[y, x])
+    if true_score < confidence:
+        return true_score - confidence
+    return true_score - _second_peak(result, expected, width, height)
+
+
+def _match_time(frames: List[np.ndarray], template: np.ndarray, repeat: int = 3) -> float:
+    """참조 프레임 전체 매칭 시간 (반복 중 최솟값, 초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for frame in frames:
+            cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def analyze_template(
+    template: np.ndarray,
+    frames: List[np.ndarray],
+    confidence: float = IMAGE_CONFIDENCE_THRESHOLD,
+    min_margin: float = SUBTEMPLATE_MIN_MARGIN,
+    min_size: int = SUBTEMPLATE_MIN_SIZE
+) -> Tuple[Optional[SubTemplate], Dict[str, Any]]:
+    """
+    참조 프레임에서 유일한 가장 작은 부분 패치 찾기
+
+    작은 패치 크기부터 격자 위치를 시험하고, 모든 프레임에서 여유가 min_margin 이상인
+    첫 크기에서 여유가 가장 큰 패치를 고릅니다.
+
+    Args:
+        template: 전체 템플릿 (BGR)
+        frames: 참조 프레임 리스트 (요소가 있는 화면과 없는 화면 모두 포함 권장)
+        confidence: 런타임 매칭 신뢰도
+        min_margin: 패치 채택에 필요한 최소 점수 여유
+        min_size: 패치 최소 변 길이 (픽셀)
+
+    Returns:
+        (SubTemplate 또는 None, 리포트 딕셔너리)
+    """
+    height, width = template.shape[:2]
+    frames = [f for f in frames if f.shape[0] >= height and f.shape[1] >= width]
+
+    # 전체 템플릿 기준 정답 위치와 여유
+    expected: List[Optional[Tuple[int, int]]] = []
+    full_margin = float('inf')
+    for frame in frames:
+        result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        loc = max_loc if max_val >= confidence else None
+        expected.append(loc)
+        full_margin = min(full_margin, _margin(result, loc, width, height, confidence))
+
+    report: Dict[str, Any] = {
+        'full_size': (width, height),
+        'patch_size': (width, height),
+        'area_ratio': 1.0,
+        'full_margin': full_margin if frames else 0.0,
+        'patch_margin': full_margin if frames else 0.0,
+        'speedup': 1.0,
+        'frames': len(frames),
+        'positives': sum(1 for loc in expected if loc is not None)
+    }
+    if not frames:
+        return None, report
+
+    gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY) if len(template.shape) == 3 else template
+
+    sizes = sorted(
+        {(min(width, max(min_size, int(width * sx))), min(height, max(min_size, int(height * sy))))
+         for sx in PATCH_SCALES for sy in PATCH_SCALES},
+        key=lambda s: s[0] * s[1]
+    )
+
+    best: Optional[SubTemplate] = None
+    for patch_w, patch_h in sizes:
+        if patch_w * patch_h >= width * height:
+            break
+
+        stride_x = max(2, patch_w // 2)
+        stride_y = max(2, patch_h // 2)
+        xs = sorted(set(range(0, width - patch_w + 1, stride_x)) | {width - patch_w})
+        ys = sorted(set(range(0, height - patch_h + 1, stride_y)) | {height - patch_h})
+
+        for py in ys:
+            for px in xs:
+                if gray[py:py+patch_h, px:px+patch_w].std() < PATCH_MIN_STD:
+                    continue
+
+                patch = template[py:py+patch_h, px:px+patch_w]
+                margin = float('inf')
+                for frame, loc in zip(frames, expected):
+                    result = cv2.matchTemplate(frame, patch, cv2.TM_CCOEFF_NORMED)
+                    target = None if loc is None else (loc[0] + px, loc[1] + py)
+                    margin = min(margin, _margin(result, target, patch_w, patch_h, confidence))
+                    if margin < min_margin:
+                        break
+
+                if margin >= min_margin and (best is None or margin > best.margin):
+                    best = SubTemplate((px, py, px + patch_w, py + patch_h), (width, height), margin)
+
+        if best is not None:
+            break
+
+    if best is None:
+        return None, report
+
+    patch = best.crop(template)
+    report.update({
+        'patch_size': (patch.shape[1], patch.shape[0]),
+        'area_ratio': (patch.shape[0] * patch.shape[1]) / float(width * height),
+        'patch_margin': best.margin,
+        'speedup': _match_time(frames, template) / max(_match_time(frames, patch), 1e-9)
+    })
+    return best, report
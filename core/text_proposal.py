@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Text Region Proposal Module
+전체 화면 OCR 전에 글자가 있을 만한 박스만 찾아내는 모듈
+"""
+
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+from .constants import (
+    TEXT_MIN_HEIGHT,
+    TEXT_MAX_HEIGHT_RATIO,
+    TEXT_BOX_PADDING,
+    TEXT_MAX_MSER_BOXES
+)
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+class TextProposer:
+    """MSER + 형태학적 그래디언트 기반 텍스트 영역 제안 클래스"""
+
+    def __init__(
+        self,
+        min_height: int = TEXT_MIN_HEIGHT,
+        max_height_ratio: float = TEXT_MAX_HEIGHT_RATIO,
+        padding: int = TEXT_BOX_PADDING,
+        use_mser: bool = True,
+        max_mser_boxes: int = TEXT_MAX_MSER_BOXES
+    ):
+        """
+        Args:
+            min_height: 글자 박스 최소 높이 (픽셀)
+            max_height_ratio: 이미지 높이 대비 글자 박스 최대 높이 비율
+            padding: OCR 전에 박스 주변에 더할 여백 (픽셀)
+            use_mser: MSER 후보 사용 여부 (False면 그래디언트 후보만 사용)
+            max_mser_boxes: 줄 병합에 넘길 MSER 박스 최대 개수 (큰 박스 우선)
+        """
+        self.min_height = min_height
+        self.max_height_ratio = max_height_ratio
+        self.padding = padding
+        self.use_mser = use_mser
+        self.max_mser_boxes = max_mser_boxes
+        self._mser = cv2.MSER_create() if use_mser else None
+
+    def _gradient_boxes(self, gray: np.ndarray) -> List[Box]:
+        """형태학적 그래디언트 + 윤곽선으로 글자 덩어리 박스 찾기"""
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, kernel)
+        _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+        # 버튼/패널 테두리 같은 긴 직선 제거 (글자를 감싸는 윤곽선 방지)
+        h_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1)))
+        v_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40)))
+        binary = cv2.subtract(binary, cv2.bitwise_or(h_lines, v_lines))
+
+        # 가로 방향으로 닫아 글자들을 단어 단위로 연결
+        connect = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1))
+        connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, connect)
+
+        contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            # 엣지 밀도가 낮은 박스(단색 면, 테두리)는 글자가 아님
+            density = cv2.countNonZero(binary[y:y+h, x:x+w]) / float(w * h)
+            if density >= 0.2:
+                boxes.append((x, y, x + w, y + h))
+        return boxes
+
+    def _mser_boxes(self, gray: np.ndarray) -> List[Box]:
+        """MSER 안정 영역 박스 찾기 (글자 획 후보, 중복 제거)"""
+        _, bboxes = self._mser.detectRegions(gray)
+        return list({(int(x), int(y), int(x + w), int(y + h)) for x, y, w, h in bboxes})
+
+    def _prune_mser(self, mser: List[Box], covered: List[Box]) -> List[Box]:
+        """
+        그래디언트 박스 안에 완전히 들어가는 MSER 박스를 버리고 개수 제한
+
+        MSER은 글자 획마다 겹치는 박스를 수백~수천 개 내므로, 이미 그래디언트 박스가 덮는 획은
+        병합해도 결과가 같아 미리 제거합니다.
+        """
+        if not mser:
+            return []
+        boxes = np.array(mser, dtype=np.int32)
+        if covered:
+            cover = np.array(covered, dtype=np.int32)
+            inside = (
+                (boxes[:, None, 0] >= cover[None, :, 0]) & (boxes[:, None, 1] >= cover[None, :, 1]) &
+                (boxes[:, None, 2] <= cover[None, :, 2]) & (boxes[:, None, 3] <= cover[None, :, 3])
+            ).any(axis=1)
+            boxes = boxes[~inside]
+        if len(boxes) > self.max_mser_boxes:
+            areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+            boxes = boxes[np.argsort(-areas, kind='stable')[:self.max_mser_boxes]]
+        return [tuple(int(v) for v in box) for box in boxes]
+
+    def _filter(self, boxes: List[Box], image_height: int) -> List[Box]:
+        """크기/종횡비로 글자가 아닌 박스 제거"""
+        max_height = max(self.min_height, int(image_height * self.max_height_ratio))
+        filtered = []
+        for x1, y1, x2, y2 in boxes:
+            w, h = x2 - x1, y2 - y1
+            if self.min_height <= h <= max_height and w <= h * 40:
+                filtered.append((x1, y1, x2, y2))
+        return filtered
+
+    @staticmethod
+    def _joins(box: List[int], line: List[int]) -> bool:
+        """세로로 절반 이상 겹치고 가로 간격이 높이 이하인지"""
+        h = min(box[3] - box[1], line[3] - line[1])
+        v_overlap = min(box[3], line[3]) - max(box[1], line[1])
+        gap = max(box[0], line[0]) - min(box[2], line[2])
+        return v_overlap >= h * 0.5 and gap <= max(box[3] - box[1], line[3] - line[1])
+
+    @staticmethod
+    def merge_lines(boxes: List[Box]) -> List[Box]:
+        """
+        세로로 겹치고 가로로 가까운 박스를 한 줄로 병합
+
+        위에서부터 훑어 세로로 겹치는 박스를 행으로 묶은 뒤, 행마다 왼쪽부터 한 번 훑으며
+        병합합니다 (정렬 O(n log n) + 행 안의 열린 줄 수에 비례).
+
+        Args:
+            boxes: [(x1, y1, x2, y2), ...]
+
+        Returns:
+            위에서 아래, 왼쪽에서 오른쪽 순으로 정렬된 줄 박스
+        """
+        # 1단계: y 기준 행 묶기 (행 띠와 세로로 절반 이상 겹치면 같은 행)
+        rows: List[List[List[int]]] = []
+        band = None
+        for box in sorted(boxes, key=lambda b: (b[1], b[3])):
+            box = list(box)
+            h = box[3] - box[1]
+            if band is not None and min(box[3], band[1]) - box[1] >= min(h, band[1] - band[0]) * 0.5:
+                rows[-1].append(box)
+                band[1] = max(band[1], box[3])
+            else:
+                rows.append([box])
+                band = [box[1], box[3]]
+
+        # 2단계: 행마다 x 순으로 한 번 훑으며 열린 줄에 붙이기
+        lines: List[List[int]] = []
+        for row in rows:
+            row.sort()
+            open_lines: List[List[int]] = []
+            for box in row:
+                # 커진 줄이 다른 열린 줄과 이어지면 그 줄도 병합 (행 안에서만 반복)
+                merged = True
+                while merged:
+                    merged = False
+                    for i, line in enumerate(open_lines):
+                        if TextProposer._joins(box, line):
+                            box = [min(box[0], line[0]), min(box[1], line[1]),
+                                   max(box[2], line[2]), max(box[3], line[3])]
+                            del open_lines[i]
+                            merged = True
+                            break
+                open_lines.append(box)
+            lines.extend(open_lines)
+
+        return sorted((tuple(line) for line in lines), key=lambda b: (b[1], b[0]))
+
+    def propose(self, image: np.ndarray) -> List[Box]:
+        """
+        글자가 있을 만한 줄 박스 제안
+
+        Args:
+            image: 입력 이미지 (BGR 또는 그레이스케일)
+
+        Returns:
+            [(x1, y1, x2, y2), ...] 여백이 더해진 줄 박스 (이미지 범위 내)
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        height, width = gray.shape[:2]
+
+        boxes = self._filter(self._gradient_boxes(gray), height)
+        if self._mser is not None:
+            boxes.extend(self._prune_mser(self._filter(self._mser_boxes(gray), height), boxes))
+
+        lines = self.merge_lines(boxes)
+
+        p = self.padding
+        return [
+            (max(0, x1 - p), max(0, y1 - p), min(width, x2 + p), min(height, y2 + p))
+            for x1, y1, x2, y2 in lines
+        ]
@@ -7,9 +7,13 @@ Daily Scenario Runner with Real-time Monitoring
 import sys
 import os
 import json
+import asyncio
+import functools
 import datetime
 import time
 
+import pyautogui
+
 if sys.platform == 'win32':
     import io
     if not isinstance(sys.stdout, io.TextIOWrapper):
@@ -19,6 +23,104 @@ if sys.platform == 'win32':
 from core.monitor import Monitor
 from core.automation import Automation
 from core.realtime_monitor import RealtimeMonitor
+from core.ocr_processor import OCRProcessor
+from core.config import ActionConfig, InstanceConfig, StoryConfig
+from core.rule_engine import RuleEngine
+from core.image_detector import ImageDetector
+from core.instance_manager import InstanceManager, GameInstance, FrameProducer
+from core.detection_process import DetectionProcess
+from core.scene_classifier import SceneClassifier
+from core.story_base import StoryBase
+from core.async_runtime import AsyncRuntime
+from core.constants import (
+    DETECTION_AREA_TOP_RATIO,
+    DETECTION_AREA_BOTTOM_OFFSET,
+    OCR_CACHE_MAX_ENTRIES,
+    OCR_CACHE_FILE,
+    OCR_LANGUAGE,
+    OCR_POOL_TIMEOUT,
+    GLYPH_BANK_FILE,
+    SCENE_SIGNATURES_FILE,
+    SUBTEMPLATE_FILE,
+    ASSET_MANIFEST_FILE,
+    SCALE_PROFILE_FILE,
+    ASSET_BUNDLE_FILE,
+    CHECKPOINT_DIR,
+    CHECKPOINT_MAX_AGE,
+    ASYNC_STATUS_INTERVAL,
+    DETECTION_PROCESS_CAPTURE_INTERVAL
+)
+
+
+def configure_detection(config, auto_calibrate=True, verbose=True, detection_area=None):
+    """
+    템플릿 탐지 설정 (스토리 프로세스와 탐지 워커 프로세스가 같은 설정 사용)
+
+    Args:
+        config: config.json 딕셔너리
+        auto_calibrate: "auto_calibrate_scale"이 켜져 있고 배율 프로필이 없을 때 현재 화면으로 보정
+                        (워커는 스토리 프로세스가 저장한 프로필 사용)
+        verbose: 로드 결과 출력 여부
+        detection_area: 탐지 영역 (x1, y1, x2, y2) - 배율 보정 영역과 타일 벤치마크 크기, None이면 화면 전체
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    # 재화 숫자용 글리프 인식기 (글리프 뱅크가 있을 때만)
+    if OCRProcessor.configure_digit_recognizer(config.get("glyph_bank_file", GLYPH_BANK_FILE)):
+        log("✓ Glyph bank loaded - digit OCR fast path enabled")
+
+    # 판별 부분 템플릿 (매니페스트가 있으면 전체 버튼 대신 작은 패치로 매칭)
+    subtemplates = ImageDetector.configure_subtemplates(config.get("subtemplate_file", SUBTEMPLATE_FILE))
+    if subtemplates:
+        log(f"✓ Compact templates loaded ({len(subtemplates)} templates)")
+
+    # 미리 디코딩된 템플릿 번들 (mmap, 다른 프로세스와 페이지 공유)
+    bundle = ImageDetector.configure_bundle(config.get("asset_bundle_file", ASSET_BUNDLE_FILE))
+    if bundle:
+        log(f"✓ Asset bundle mapped ({len(bundle)} templates)")
+
+    # 해상도별 템플릿 배율 (프로필의 배율 적용, 템플릿은 미리 변환해 캐시)
+    # 시작 시 보정은 선택 사항 (Detection Area만 탐색, 보통은 tools/calibrate_scale.py로 한 번 보정)
+    scale, calibrated = ImageDetector.configure_scale_profile(
+        config.get("scale_profile_file", SCALE_PROFILE_FILE),
+        auto_calibrate=auto_calibrate and config.get("auto_calibrate_scale", False),
+        area=detection_area
+    )
+    if calibrated:
+        log(f"✓ Template scale calibrated: {scale:.3f}")
+    elif scale != 1.0:
+        log(f"✓ Template scale profile: {scale:.3f}")
+
+    # 에셋 매니페스트 (요소별 탐지 방식: template / sparse / color_blob)
+    manifest = ImageDetector.configure_manifest(config.get("asset_manifest_file", ASSET_MANIFEST_FILE))
+    if manifest:
+        log(f"✓ Asset manifest loaded ({len(manifest)} elements)")
+
+    # 색 존재 사전 필터 (템플릿 대표 색이 없는 화면/영역은 매칭 생략)
+    ImageDetector.configure_color_prefilter(config.get("color_prefilter", True))
+
+    # 타일 병렬 매칭 (타일 크기/스레드 수는 짧은 벤치마크로 자동 조정, 더 느리면 사용 안 함)
+    tiled = ImageDetector.configure_tiling(
+        config.get("tiled_match", True),
+        tile_size=config.get("tile_size", 0) or None,
+        workers=config.get("tile_workers", 0) or None,
+        sample_size=(detection_area[2] - detection_area[0], detection_area[3] - detection_area[1]) if detection_area else None
+    )
+    if tiled:
+        log(f"✓ Tiled matching enabled ({tiled.tile_size}px tiles, {tiled.workers} threads)")
+
+
+def configure_detection_worker(config, detection_area=None):
+    """탐지 워커 프로세스 초기화 (spawn으로 전달되므로 모듈 수준 함수)"""
+    configure_detection(config, auto_calibrate=False, verbose=False, detection_area=detection_area)
+    # 워커에서 평가하는 OCR 조건용 (엔진 하나만 유지)
+    if config.get("ocr_pool", True):
+        OCRProcessor.configure_pool(
+            workers=1,
+            timeout=config.get("ocr_timeout", OCR_POOL_TIMEOUT),
+            tesseract_path=config.get("tesseract_path"),
+            preload=[config.get("language", OCR_LANGUAGE)]
+        )
 
 
 class MainRunner:
@@ -32,12 +134,109 @@ class MainRunner:
         self.config = self.load_config(config_path)
         self.monitor = Monitor()
         self.automation = Automation()
+        self.stories = []
+        self.current_story_index = 0
+
+        # 멀티 인스턴스 (config.json "instances"가 있으면 창마다 영역/스토리 대기열 분리)
+        self.instance_configs = [
+            InstanceConfig.from_dict(data) for data in self.config.get("instances", [])
+        ]
+        self.instance_manager = None
+        monitor_area = None
+        if self.instance_configs:
+            self.instance_manager = InstanceManager(
+                automation=self.automation,
+                # 탐지 워커 프로세스가 있으면 워커가 공유 메모리에 게시한 프레임 사용
+                producer=FrameProducer(grab=self.get_worker_frame) if self.config.get("detection_process", False) else None,
+                pause_between_stories=self.config.get("pause_between_stories", 3)
+            )
+            # 모니터와 모든 인스턴스가 같은 캡처를 공유
+            ImageDetector.frame_source = self.instance_manager.producer.get_frame
+            regions = [c.region for c in self.instance_configs]
+            monitor_area = (
+                min(r[0] for r in regions), min(r[1] for r in regions),
+                max(r[2] for r in regions), max(r[3] for r in regions)
+            )
+
         self.realtime_monitor = RealtimeMonitor(
             window_title="Daily Scenario - Detection Area",
-            scale=0.9
+            scale=0.9,
+            detection_area=monitor_area
         )
-        self.stories = []
-        self.current_story_index = 0
+
+        # OCR 결과 캐시 (실행 간 유지)
+        OCRProcessor.configure_cache(
+            self.config.get("ocr_cache_size", OCR_CACHE_MAX_ENTRIES),
+            self.config.get("ocr_cache_file", OCR_CACHE_FILE)
+        )
+
+        # 템플릿 탐지 설정 (글리프 뱅크, 부분 템플릿, 번들, 배율, 매니페스트, 사전 필터, 타일 매칭)
+        detection_area = monitor_area
+        if detection_area is None:
+            # RealtimeMonitor 기본 Detection Area (화면 우측 하단)
+            width, height = pyautogui.size()
+            detection_area = (width // 2, int(height * DETECTION_AREA_TOP_RATIO),
+                              width, height - DETECTION_AREA_BOTTOM_OFFSET)
+        configure_detection(self.config, detection_area=detection_area)
+
+        # 캡처 + 탐지 워커 프로세스 (미리보기, 상태 출력, OCR 후처리와 GIL을 나누지 않음)
+        self.detection_process = None
+        if self.config.get("detection_process", False):
+            self.detection_process = DetectionProcess(
+                interval=self.config.get("detection_capture_interval", DETECTION_PROCESS_CAPTURE_INTERVAL),
+                initializer=functools.partial(configure_detection_worker, self.config, detection_area)
+            )
+            self.detection_process.start()
+            StoryBase.detection_process = self.detection_process
+            if not self.instance_manager:
+                ImageDetector.frame_source = self.detection_process.get_frame
+            print(f"✓ Detection worker process started (shared frame {self.detection_process.buffer.shape[1]}"
+                  f"x{self.detection_process.buffer.shape[0]})")
+
+        # 씬 분류기 (시그니처 파일이 있을 때만, 모든 스토리 공유)
+        scene_file = self.config.get("scene_signatures_file", SCENE_SIGNATURES_FILE)
+        if scene_file and os.path.exists(scene_file):
+            StoryBase.scene_classifier = SceneClassifier.load(scene_file)
+            print(f"✓ Scene signatures loaded ({len(StoryBase.scene_classifier.scene_ids)} scenes)")
+
+        # 스토리 체크포인트 (크래시/자동 재시작 후 완료한 단계는 건너뛰고 이어서 실행)
+        StoryBase.checkpoint_dir = self.config.get("checkpoint_dir", CHECKPOINT_DIR)
+        StoryBase.checkpoint_max_age = self.config.get("checkpoint_max_age", CHECKPOINT_MAX_AGE)
+
+        # OCR 워커 풀 (traineddata를 워커마다 한 번만 로드)
+        if self.config.get("ocr_pool", True):
+            OCRProcessor.configure_pool(
+                workers=self.config.get("ocr_workers", 0),
+                timeout=self.config.get("ocr_timeout", OCR_POOL_TIMEOUT),
+                tesseract_path=self.config.get("tesseract_path"),
+                preload=[self.config.get("language", OCR_LANGUAGE)]
+            )
+
+        # 텍스트 트리거 액션 규칙 엔진 (run_actions가 켜져 있을 때만)
+        self.rule_engine = None
+        if self.config.get("run_actions", False):
+            actions = [ActionConfig.from_dict(a) for a in self.config.get("actions", [])]
+            self.rule_engine = RuleEngine(
+                actions,
+                automation=self.automation,
+                language=self.config.get("language", OCR_LANGUAGE)
+            )
+
+    def get_worker_frame(self):
+        """탐지 워커 프로세스의 최신 전체 프레임 (인스턴스 공유 캡처용)"""
+        return self.detection_process.get_frame()
+
+    def stop_detection_process(self):
+        """탐지 워커 프로세스 종료 (통계 출력)"""
+        if self.detection_process is None:
+            return
+        stats = self.detection_process.get_stats()
+        self.log(f"Detection worker: {stats['requests']} requests ({stats['local']} local), "
+                 f"avg round trip {stats['avg_round_trip_ms']:.1f} ms, "
+                 f"worker {stats['avg_worker_ms']:.1f} ms, {stats['frames']} frames")
+        self.detection_process.stop()
+        StoryBase.detection_process = None
+        self.detection_process = None
 
     def load_config(self, config_path):
         """설정 파일 로드"""
@@ -68,6 +267,54 @@ class MainRunner:
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         print(f"\n[{timestamp}] [MAIN] {message}")
 
+    def create_story(self, name):
+        """스토리 이름으로 스토리 객체 생성"""
+        from stories.daily_scenario import DailyScenarioStory
+
+        story_classes = {
+            "daily_scenario": DailyScenarioStory
+        }
+        if name not in story_classes:
+            raise ValueError(f"Unknown story: {name}")
+        story = story_classes[name]()
+        story.story_config = self.get_story_config(name)
+        return story
+
+    def get_story_config(self, name):
+        """스토리별 설정 (config.json "stories" 항목, 없으면 기본값)"""
+        story_data = (self.config.get("stories") or {}).get(name)
+        return StoryConfig(**story_data) if isinstance(story_data, dict) else StoryConfig()
+
+    def initialize_instances(self):
+        """인스턴스별 스토리 대기열 초기화"""
+        self.log(f"Initializing {len(self.instance_configs)} instances...")
+
+        for instance_config in self.instance_configs:
+            names = instance_config.stories or ["daily_scenario"]
+            stories = [self.create_story(name) for name in names]
+            self.instance_manager.add_instance(
+                GameInstance(instance_config.name, instance_config.region, stories)
+            )
+            self.log(f"  {instance_config.name}: region {instance_config.region}, stories {names}")
+
+    def run_all_instances(self):
+        """모든 인스턴스 병렬 실행 (입력은 직렬화)"""
+        self.log("=" * 70)
+        self.log("Starting All Instances")
+        self.log("=" * 70)
+
+        self.instance_manager.start()
+        while self.instance_manager.is_running():
+            self.instance_manager.print_status()
+            time.sleep(0.1)
+        self.instance_manager.join()
+
+        results = []
+        for instance in self.instance_manager.instances:
+            for result in instance.results:
+                results.append(dict(result, name=f"{instance.name}/{result['name']}"))
+        return results
+
     def initialize_stories(self):
         """스토리 목록 초기화"""
         self.log("Initializing stories...")
@@ -83,6 +330,7 @@ class MainRunner:
             time.sleep(0.1)
 
         daily_story = DailyScenarioStory()
+        daily_story.story_config = self.get_story_config("daily_scenario")
         detection_area = self.realtime_monitor.get_detection_area()
         if detection_area:
             daily_story.set_detection_area(detection_area)
@@ -120,6 +368,29 @@ class MainRunner:
         self.log("✓ Monitoring complete")
         return True
 
+    def keep_monitoring(self):
+        """모니터가 종료될 때까지 대기 (규칙 엔진이 있으면 check_interval마다 평가)"""
+        interval = self.config.get("check_interval", 2)
+        next_check = time.time()
+
+        while self.realtime_monitor.running:
+            self.realtime_monitor.print_status()
+
+            if self.rule_engine and time.time() >= next_check:
+                self.rule_engine.run_once()
+                next_check = time.time() + interval
+
+            time.sleep(0.1)
+
+        self.log_rule_stats()
+
+    def log_rule_stats(self):
+        """규칙 엔진 통계 출력"""
+        if self.rule_engine:
+            for stats in self.rule_engine.get_stats():
+                self.log(f"Rule '{stats['name']}': {stats['fires']} fires, "
+                         f"{stats['evaluations']} evals, avg {stats['avg_ms']:.1f} ms")
+
     def run_story(self, story):
         """단일 스토리 실행"""
         self.log(f"Starting story: {story.name}")
@@ -163,6 +434,34 @@ class MainRunner:
 
         return results
 
+    async def arun_all_stories(self, runtime):
+        """모든 스토리 순차 실행 (run_all_stories()의 코루틴 버전)"""
+        self.log("=" * 70)
+        self.log("Starting All Stories")
+        self.log("=" * 70)
+
+        results = []
+        pause = self.config.get("pause_between_stories", 3)
+
+        for i, story in enumerate(self.stories):
+            self.current_story_index = i
+
+            self.log(f"\n[{i+1}/{len(self.stories)}] Running: {story.name}")
+
+            result = await story.arun(runtime)
+            self.log(f"✓ Story completed: {story.name}" if result else f"❌ Story failed: {story.name}")
+            results.append({
+                "name": story.name,
+                "status": story.status,
+                "success": result
+            })
+
+            if i < len(self.stories) - 1:
+                self.log(f"Waiting {pause} seconds before next story...")
+                await asyncio.sleep(pause)
+
+        return results
+
     def print_summary(self, results):
         """결과 요약 출력"""
         self.log("\n" + "=" * 70)
@@ -182,6 +481,10 @@ class MainRunner:
 
     def run(self):
         """메인 실행"""
+        if self.config.get("async_runtime", False):
+            self.run_async_runtime()
+            return
+
         try:
             # 실시간 모니터 시작
             if self.config.get("realtime_monitor", True):
@@ -193,6 +496,14 @@ class MainRunner:
             self.log("Mabinogi Mobile Auto - Daily Scenario Runner")
             self.log("=" * 70)
 
+            # 멀티 인스턴스 모드
+            if self.instance_manager:
+                self.initialize_instances()
+                self.monitor_before_start()
+                self.print_summary(self.run_all_instances())
+                self.keep_monitoring()
+                return
+
             # 스토리 초기화
             self.initialize_stories()
 
@@ -201,9 +512,7 @@ class MainRunner:
                 self.log("화면 모니터링만 실행합니다. (Q 키 또는 Ctrl+C로 종료)")
 
                 # 스토리가 없으면 모니터링만 계속
-                while self.realtime_monitor.running:
-                    self.realtime_monitor.print_status()
-                    time.sleep(0.1)
+                self.keep_monitoring()
                 return
 
             # 시작 전 모니터링
@@ -234,9 +543,7 @@ class MainRunner:
                     self.run()  # 재귀 실행
             else:
                 # 모니터가 종료될 때까지 대기
-                while self.realtime_monitor.running:
-                    self.realtime_monitor.print_status()
-                    time.sleep(0.1)
+                self.keep_monitoring()
 
         except KeyboardInterrupt:
             self.log("\n⚠ Interrupted by user")
@@ -260,10 +567,103 @@ class MainRunner:
                     break
         finally:
             # 최종 정리
+            OCRProcessor.save_cache()
+            OCRProcessor.shutdown_pool()
+            self.stop_detection_process()
             if self.realtime_monitor.running:
                 self.realtime_monitor.stop()
             self.log("\n프로그램 종료")
 
+    def run_async_runtime(self):
+        """
+        메인 실행 (asyncio 런타임)
+
+        모니터 창, 상태 출력, 규칙 엔진, 스토리(멀티 인스턴스면 모든 인스턴스)가 하나의 이벤트 루프를
+        공유합니다. 대기는 모두 await이므로 상태 출력용 바쁜 루프가 없습니다.
+        """
+        runtime = AsyncRuntime(
+            workers=self.config.get("async_workers", 0) or None,
+            detection_process=self.detection_process
+        )
+        try:
+            asyncio.run(self._run_async(runtime))
+        except KeyboardInterrupt:
+            self.log("\n⚠ Interrupted by user")
+        except Exception as e:
+            self.log(f"\n❌ Fatal error: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            runtime.shutdown()
+            stats = runtime.get_stats()
+            self.log(f"\nRuntime: {stats['offloads']} offloads ({stats['offload_seconds']:.1f}s), "
+                     f"{stats['inputs']} inputs, {stats['polls']} polls")
+            OCRProcessor.save_cache()
+            OCRProcessor.shutdown_pool()
+            self.stop_detection_process()
+            self.log("\n프로그램 종료")
+
+    async def _run_async(self, runtime):
+        """이벤트 루프 본체 (모니터가 종료되면 [Q] 모든 태스크 정리)"""
+        monitor_closed = asyncio.Event()
+        stop = asyncio.Event()
+        tasks = []
+
+        if self.config.get("realtime_monitor", True):
+            monitor_task = asyncio.create_task(self.realtime_monitor.run_async(runtime))
+            monitor_task.add_done_callback(lambda _: monitor_closed.set())
+            tasks.append(monitor_task)
+            self.log("✓ Realtime monitor started (async)")
+        else:
+            monitor_closed.set()
+
+        print_status = self.instance_manager.print_status if self.instance_manager else self.realtime_monitor.print_status
+        tasks.append(asyncio.create_task(runtime.every(ASYNC_STATUS_INTERVAL, print_status, stop)))
+        if self.rule_engine:
+            tasks.append(asyncio.create_task(runtime.every(
+                self.config.get("check_interval", 2), self.rule_engine.run_once, stop, offload=True
+            )))
+
+        try:
+            self.log("=" * 70)
+            self.log("Mabinogi Mobile Auto - Daily Scenario Runner (asyncio)")
+            self.log("=" * 70)
+
+            if self.instance_manager:
+                self.initialize_instances()
+                await runtime.offload(self.monitor_before_start)
+                await self.instance_manager.run_async(runtime)
+                results = []
+                for instance in self.instance_manager.instances:
+                    for result in instance.results:
+                        results.append(dict(result, name=f"{instance.name}/{result['name']}"))
+                self.print_summary(results)
+            else:
+                # Detection Area 대기(최대 5초)는 작업 스레드에서
+                await runtime.offload(self.initialize_stories)
+                if self.stories:
+                    await runtime.offload(self.monitor_before_start)
+                    while True:
+                        self.print_summary(await self.arun_all_stories(runtime))
+                        if not self.config.get("auto_restart", False):
+                            break
+                        self.log("\n⚠ Auto-restart is enabled")
+                        self.log("Restarting in 10 seconds...")
+                        try:
+                            await asyncio.wait_for(monitor_closed.wait(), timeout=10)
+                            break
+                        except asyncio.TimeoutError:
+                            pass
+
+            if not monitor_closed.is_set():
+                self.log("화면 모니터는 계속 실행 중입니다. (Q 키 또는 Ctrl+C로 종료)")
+                await monitor_closed.wait()
+        finally:
+            stop.set()
+            self.realtime_monitor.running = False
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.log_rule_stats()
+
 
 def main():
     """진입점"""
@@ -6,10 +6,20 @@ Daily Scenario Story
 
 from typing import Optional, List, Tuple
 
-from core.story_base import StoryBase
+from core.story_base import StoryBase, Step
 from core.image_detector import ImageDetector
 from core.ocr_processor import OCRProcessor
-from core.constants import IMAGE_CONFIDENCE_THRESHOLD
+from core.search_plan import SearchElement, SearchPlan
+from core.conditions import Check, TemplatePresent
+
+
+# 계층 검색 계획: 은동전 배지는 캐릭터 목록 패널 안에서만 검색
+# (패널 템플릿이 없으면 Detection Area 전체에서 검색)
+SEARCH_ELEMENTS = (
+    SearchElement("character_panel", "assets/images/system/character_list_panel.png", confidence=0.7),
+    SearchElement("currency_badge", "assets/images/system/character_choice_coins.png",
+                  parent="character_panel", confidence=0.7),
+)
 
 
 class DailyScenarioStory(StoryBase):
@@ -26,6 +36,9 @@ class DailyScenarioStory(StoryBase):
         self.template_game_start_yellow = "assets/images/UI/game_start_yellow.png"
         self.template_currency_example = "assets/images/system/character_choice_coins.png"
 
+        # 시작 시 한 번 컴파일 (템플릿 로드, 부모 관계 검증)
+        self.search_plan = SearchPlan.compile(SEARCH_ELEMENTS)
+
     def set_detection_area(self, area: Tuple[int, int, int, int]) -> None:
         """감지 영역 설정 (x1, y1, x2, y2)"""
         self.detection_area = area
@@ -34,14 +47,14 @@ class DailyScenarioStory(StoryBase):
     def find_image_in_area(
         self,
         template_path: str,
-        confidence: float = IMAGE_CONFIDENCE_THRESHOLD
+        confidence: Optional[float] = None
     ) -> Optional[Tuple[int, int]]:
         """
         감지 영역 내에서 이미지 찾기
 
         Args:
             template_path: 템플릿 이미지 경로
-            confidence: 최소 신뢰도
+            confidence: 최소 신뢰도 (None이면 번들 메타데이터/기본 신뢰도)
 
         Returns:
             (x, y) 중심 좌표 또는 None
@@ -65,30 +78,50 @@ class DailyScenarioStory(StoryBase):
             self.log(f"❌ Error finding image: {e}")
             return None
 
-    def find_all_currency_positions(self) -> List[Tuple[int, int, int]]:
+    def detect_currency_positions(self) -> Optional[List[Tuple[int, int, int]]]:
         """
-        모든 캐릭터의 은동전(왼쪽 숫자) 위치와 값을 찾기
+        은동전 위치와 값 탐지 (로그 없음, 단계 대기 중 반복 호출용)
 
         Returns:
-            [(value, x, y), ...] 리스트
+            [(value, x, y), ...] 절대 좌표 리스트, 캐릭터 목록 패널이 없으면 None
         """
-        try:
-            # 화면 캡처
-            screen = self.image_detector.capture_screen(area=self.detection_area)
+        # 화면 캡처
+        screen = self.image_detector.capture_screen(area=self.detection_area)
 
-            # 템플릿 로드
+        # 템플릿 (컴파일 시 로드됨)
+        template = self.search_plan.template("currency_badge")
+        if template is None:
             template = self.image_detector.load_template(self.template_currency_example)
 
-            # OCR 프로세서로 재화 찾기
-            currency_list = self.ocr_processor.find_currency_values(screen, template)
+        # 부모 패널 박스 안에서만 배지 검색
+        search_box = self.search_plan.search_box(screen, "currency_badge")
+        if search_box is None:
+            return None
+
+        # OCR 프로세서로 재화 찾기
+        currency_list = self.ocr_processor.find_currency_values(screen, template, search_box=search_box)
 
-            # 절대 좌표로 변환
-            if self.detection_area:
-                offset_x, offset_y = self.detection_area[0], self.detection_area[1]
-                currency_list = [
-                    (value, x + offset_x, y + offset_y)
-                    for value, x, y in currency_list
-                ]
+        # 절대 좌표로 변환
+        if self.detection_area:
+            offset_x, offset_y = self.detection_area[0], self.detection_area[1]
+            currency_list = [
+                (value, x + offset_x, y + offset_y)
+                for value, x, y in currency_list
+            ]
+        return currency_list
+
+    def find_all_currency_positions(self) -> List[Tuple[int, int, int]]:
+        """
+        모든 캐릭터의 은동전(왼쪽 숫자) 위치와 값을 찾기
+
+        Returns:
+            [(value, x, y), ...] 리스트
+        """
+        try:
+            currency_list = self.detect_currency_positions()
+            if currency_list is None:
+                self.log("✗ Character panel not found")
+                return []
 
             # 로그 출력
             for value, x, y in currency_list:
@@ -120,75 +153,115 @@ class DailyScenarioStory(StoryBase):
             self.log(f"❌ Click error: {e}")
             return False
 
-    def start(self) -> bool:
-        """스토리 실행"""
-        try:
-            self.log("=" * 60)
-            self.log("Starting Daily Scenario Story")
-            self.log("=" * 60)
-
-            # Step 1: game_start 버튼 찾기 및 클릭
-            self.log("\n[Step 1] Finding 'game_start' button...")
-            game_start_pos = self.find_image_in_area(self.template_game_start, confidence=0.8)
-
-            if not game_start_pos:
-                self.log("❌ 'game_start' button not found")
-                return False
-
-            self.log("Waiting 3 seconds before click...")
-            self.smart_sleep(3)
-
-            if not self.click_at(game_start_pos[0], game_start_pos[1]):
-                return False
-
-            self.log("✓ 'game_start' button clicked")
-
-            # Step 2: 캐릭터 선택 (은동전이 가장 많은 캐릭터)
-            self.log("\n[Step 2] Finding character with highest currency...")
-            self.smart_sleep(2)  # 화면 로딩 대기
-
-            currency_list = self.find_all_currency_positions()
-
-            if not currency_list:
-                self.log("⚠ No currency found, trying alternative method...")
-                # 대체 방법: 화면 중앙의 첫 번째 캐릭터 선택
-                if self.detection_area:
-                    x1, y1, x2, y2 = self.detection_area
-                    center_x = (x1 + x2) // 2
-                    center_y = (y1 + y2) // 2
-                    self.click_at(center_x, center_y)
-            else:
-                # 은동전이 가장 많은 캐릭터 선택
-                currency_list.sort(reverse=True)  # 내림차순 정렬
-                max_currency, click_x, click_y = currency_list[0]
-
-                self.log(f"✓ Highest currency: {max_currency}")
-                self.click_at(click_x, click_y)
+    def build_steps(self) -> List[Step]:
+        """
+        스토리 단계 그래프
 
-            self.log("Waiting 2 seconds after character selection...")
-            self.smart_sleep(2)
+        game_start -> select_character -> game_start_yellow
+        (은동전을 찾지 못하면 select_character -> select_center -> game_start_yellow)
 
+        동작은 클릭만 하고 클릭 전후 대기는 Step.pre_delay/delay로 둡니다
+        (asyncio 런타임에서 입력 잠금을 대기 시간 동안 잡지 않도록).
+        """
+        return [
+            # Step 1: game_start 버튼 찾기 및 클릭 (버튼이 보인 뒤 3초 대기 후)
+            Step(
+                "game_start",
+                detect=TemplatePresent(self.template_game_start, confidence=0.8),
+                act=self.click_game_start,
+                next="select_character",
+                deadline=10,
+                pre_delay=3,
+                delay=0.5,
+                prefetch=True
+            ),
+            # Step 2: 캐릭터 선택 (은동전이 가장 많은 캐릭터, 화면 로딩 중이면 배지가 보일 때까지 대기)
+            Step(
+                "select_character",
+                detect=Check(self.detect_currency_positions, name="currency badges"),
+                act=self.select_richest_character,
+                next="game_start_yellow",
+                fallback="select_center",
+                deadline=4,
+                retries=1,
+                scene="character_select",
+                delay=0.5,
+                prefetch=True
+            ),
+            # 대체 방법: 화면 중앙의 첫 번째 캐릭터 선택
+            Step(
+                "select_center",
+                act=self.select_center_character,
+                next="game_start_yellow",
+                retries=0,
+                delay=0.5,
+                prefetch=True
+            ),
             # Step 3: game_start_yellow 버튼 찾기 및 클릭
-            self.log("\n[Step 3] Finding 'game_start_yellow' button...")
-            game_start_yellow_pos = self.find_image_in_area(self.template_game_start_yellow, confidence=0.8)
-
-            if not game_start_yellow_pos:
-                self.log("❌ 'game_start_yellow' button not found")
-                return False
-
-            if not self.click_at(game_start_yellow_pos[0], game_start_yellow_pos[1]):
-                return False
+            Step(
+                "game_start_yellow",
+                detect=TemplatePresent(self.template_game_start_yellow, confidence=0.8),
+                act=lambda pos: self.click_at(pos[0], pos[1], delay=0),
+                deadline=5,
+                delay=0.5
+            ),
+        ]
+
+    def click_game_start(self, pos: Tuple[int, int]) -> bool:
+        """game_start 버튼 클릭 (클릭 전 대기는 Step.pre_delay)"""
+        self.log(f"✓ 'game_start' button found at {pos}")
+        self.remember("game_start", list(pos))
+        return self.click_at(pos[0], pos[1], delay=0)
+
+    def select_richest_character(self, currency_list: List[Tuple[int, int, int]]) -> bool:
+        """은동전이 가장 많은 캐릭터 클릭"""
+        for value, x, y in currency_list:
+            self.log(f"  Found currency: {value} at ({x}, {y})")
+
+        max_currency, click_x, click_y = max(currency_list)
+        self.log(f"✓ Highest currency: {max_currency}")
+        self.remember("currency", [list(c) for c in currency_list])
+        self.remember("character", {"currency": max_currency, "position": [click_x, click_y]})
+        return self.click_at(click_x, click_y, delay=0)
+
+    def select_center_character(self, _=None) -> bool:
+        """Detection Area 중앙 클릭 (은동전을 찾지 못했을 때)"""
+        self.log("⚠ No currency found, trying alternative method...")
+        if not self.detection_area:
+            return False
+        x1, y1, x2, y2 = self.detection_area
+        center = ((x1 + x2) // 2, (y1 + y2) // 2)
+        self.remember("character", {"currency": None, "position": list(center)})
+        return self.click_at(center[0], center[1], delay=0)
 
-            self.log("✓ 'game_start_yellow' button clicked")
+    def start(self) -> bool:
+        """스토리 실행"""
+        self.log("=" * 60)
+        self.log("Starting Daily Scenario Story")
+        self.log("=" * 60)
 
-            self.log("\n" + "=" * 60)
-            self.log("✓ Daily Scenario Story Completed")
-            self.log("=" * 60)
+        # 체크포인트가 있으면 이어서 실행, 이미 캐릭터 선택 화면이면 'game_start' 생략 (Step.scene)
+        if not self.run_steps(self.build_steps()):
+            return False
+        return self.report_result()
 
-            return True
+    async def astart(self, runtime) -> bool:
+        """스토리 실행 (AsyncRuntime, 단계 대기 중 이벤트 루프 양보)"""
+        self.log("=" * 60)
+        self.log("Starting Daily Scenario Story (async)")
+        self.log("=" * 60)
 
-        except Exception as e:
-            self.log(f"❌ Story execution failed: {e}")
-            import traceback
-            traceback.print_exc()
+        if not await self.arun_steps(runtime, self.build_steps()):
             return False
+        return self.report_result()
+
+    def report_result(self) -> bool:
+        """선택한 캐릭터와 완료 로그 출력"""
+        character = self.context.get("character")
+        if character:
+            self.log(f"Selected character at {tuple(character['position'])} (currency: {character['currency']})")
+
+        self.log("\n" + "=" * 60)
+        self.log("✓ Daily Scenario Story Completed")
+        self.log("=" * 60)
+        return True
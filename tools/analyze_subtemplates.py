@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Discriminative Sub-Template Analyzer
+템플릿마다 참조 프레임에서 유일한 가장 작은 부분 패치를 찾아 매니페스트 생성
+
+Usage:
+    python tools/analyze_subtemplates.py <frames_dir> [templates_dir] [output.json]
+
+frames_dir: 참조 스크린샷 폴더 (tools/capture_screenshot.py의 screenshots/ 등,
+            요소가 있는 화면과 없는 화면을 함께 넣을수록 정확함)
+templates_dir: 템플릿 폴더 (기본 assets/images, 하위 폴더 포함)
+"""
+
+import os
+import sys
+
+import cv2
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.constants import IMAGES_DIR, SCENES_DIR, SUBTEMPLATE_FILE
+from core.subtemplate import SubTemplateIndex, analyze_template
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def list_images(directory, exclude=None):
+    """폴더 안의 이미지 경로 (하위 폴더 포함)"""
+    paths = []
+    exclude = os.path.abspath(exclude) if exclude else None
+    for root, dirs, files in os.walk(directory):
+        if exclude and os.path.abspath(root).startswith(exclude):
+            continue
+        for filename in sorted(files):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.join(root, filename))
+    return sorted(paths)
+
+
+def manifest_key(path):
+    """
+    매니페스트 키 (프로젝트 루트 기준 상대 경로, '/' 구분)
+
+    스토리가 넘기는 'assets/images/...' 경로와 같은 키가 되도록, 작업 폴더나
+    templates_dir을 어떻게 지정했는지와 관계없이 정규화합니다.
+    """
+    return os.path.relpath(os.path.abspath(path), project_root).replace('\\', '/')
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    frames_dir = sys.argv[1]
+    templates_dir = sys.argv[2] if len(sys.argv) > 2 else IMAGES_DIR
+    output_path = sys.argv[3] if len(sys.argv) > 3 else SUBTEMPLATE_FILE
+
+    print("=" * 60)
+    print("Discriminative Sub-Template Analyzer")
+    print("=" * 60)
+
+    frames = [cv2.imread(p) for p in list_images(frames_dir)]
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        print(f"[ERROR] No reference frames in {frames_dir}")
+        sys.exit(1)
+    print(f"Reference frames: {len(frames)}\n")
+
+    index = SubTemplateIndex()
+    header = f"{'template':<40} {'full':>9} {'patch':>9} {'area':>6} {'speedup':>8} {'margin':>15}"
+    print(header)
+    print("-" * len(header))
+
+    # 씬 기준 캡처는 템플릿이 아님
+    for path in list_images(templates_dir, exclude=SCENES_DIR):
+        template = cv2.imread(path)
+        if template is None:
+            continue
+
+        sub, report = analyze_template(template, frames)
+        name = os.path.relpath(path, templates_dir)
+        full = "{}x{}".format(*report['full_size'])
+        margin = f"{report['full_margin']:.2f} -> {report['patch_margin']:.2f}"
+
+        if sub is None:
+            print(f"{name:<40} {full:>9} {'-':>9} {'-':>6} {'-':>8} {margin:>15}  (full template kept, "
+                  f"{report['positives']}/{report['frames']} frames contain it)")
+            continue
+
+        index.set(manifest_key(path), sub)
+        patch = "{}x{}".format(*report['patch_size'])
+        print(f"{name:<40} {full:>9} {patch:>9} {report['area_ratio']:>6.0%} "
+              f"{report['speedup']:>7.1f}x {margin:>15}")
+
+    index.save(output_path)
+    print(f"\n[OK] {len(index)} compact templates saved: {os.path.abspath(output_path)}")
+
+
+if __name__ == "__main__":
+    main()
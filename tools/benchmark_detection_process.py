@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Detection Process Benchmark
+같은 부하(미리보기 창 갱신, 상태 문자열, OCR 후처리 같은 파이썬 작업)에서
+탐지를 스토리 프로세스 안에서 실행할 때와 워커 프로세스에서 실행할 때를 비교
+
+Usage:
+    python tools/benchmark_detection_process.py [screenshot.png] [template.png] [seconds]
+
+스크린샷을 주면 그 이미지를 화면 대신 사용합니다 (없으면 현재 화면 캡처).
+템플릿을 주지 않으면 화면 중앙 120x40 영역을 템플릿으로 사용합니다.
+
+측정 항목:
+    detections/s   - 탐지 스레드의 TemplatePresent 평가 횟수
+    detect p95     - 탐지 한 번의 지연 (ms)
+    tick late p95  - 10ms 주기 스토리 루프가 늦게 깨어난 정도 (ms, 작을수록 반응이 빠름)
+    preview fps    - 미리보기 갱신 횟수
+"""
+
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.conditions import Frame, TemplatePresent
+from core.detection_process import DetectionProcess
+from core.image_detector import ImageDetector
+
+TICK_INTERVAL = 0.01
+_screenshots = {}
+
+
+def load_screenshot(path):
+    """스크린샷을 화면 대신 반환 (워커 프로세스에도 전달되므로 모듈 수준 함수)"""
+    if path not in _screenshots:
+        _screenshots[path] = cv2.imread(path)
+    return _screenshots[path].copy()
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) * 1000 if values else 0.0
+
+
+def run_load(grab, detect, seconds):
+    """
+    부하를 걸고 탐지/스토리 루프/미리보기 측정
+
+    Args:
+        grab: 미리보기용 프레임 함수
+        detect: 탐지 한 번 실행 함수
+        seconds: 측정 시간 (초)
+
+    Returns:
+        결과 딕셔너리
+    """
+    stop = threading.Event()
+    detect_times = []
+    preview_count = [0]
+
+    def detection_loop():
+        while not stop.is_set():
+            started = time.perf_counter()
+            detect()
+            detect_times.append(time.perf_counter() - started)
+
+    def preview_loop():
+        # RealtimeMonitor.update_once()와 비슷한 작업 (imshow 제외)
+        while not stop.is_set():
+            frame = cv2.resize(grab(), None, fx=0.9, fy=0.9)
+            overlay = frame.copy()
+            cv2.rectangle(overlay, (0, 0), (500, 120), (0, 0, 0), -1)
+            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            cv2.putText(frame, "Mouse: (0, 0)", (10, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            preview_count[0] += 1
+            time.sleep(0.001)
+
+    def python_loop():
+        # 상태 문자열/OCR 후처리처럼 GIL을 잡고 있는 파이썬 작업
+        while not stop.is_set():
+            words = [f"{i:05d}" for i in range(2000)]
+            ''.join(sorted(words, reverse=True))
+            time.sleep(0.005)
+
+    threads = [threading.Thread(target=t, daemon=True) for t in (detection_loop, preview_loop, python_loop)]
+    for thread in threads:
+        thread.start()
+
+    # 스토리 루프: 10ms마다 깨어나 얼마나 늦었는지 기록
+    lateness = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        expected = time.perf_counter() + TICK_INTERVAL
+        time.sleep(TICK_INTERVAL)
+        lateness.append(max(0.0, time.perf_counter() - expected))
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'detections/s': len(detect_times) / seconds,
+        'detect p50 (ms)': percentile(detect_times, 50),
+        'detect p95 (ms)': percentile(detect_times, 95),
+        'tick late p95 (ms)': percentile(lateness, 95),
+        'tick late max (ms)': max(lateness) * 1000 if lateness else 0.0,
+        'preview fps': preview_count[0] / seconds
+    }
+
+
+def main():
+    screenshot = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] else None
+    template_path = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] else None
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    grab = functools.partial(load_screenshot, screenshot) if screenshot else ImageDetector.grab_screen
+    screen = grab()
+    if screen is None:
+        print(f"[ERROR] Cannot read screenshot: {screenshot}")
+        sys.exit(1)
+
+    if template_path is None:
+        h, w = screen.shape[:2]
+        template_path = os.path.join(tempfile.mkdtemp(), "benchmark_template.png")
+        cv2.imwrite(template_path, screen[h // 2 - 20:h // 2 + 20, w // 2 - 60:w // 2 + 60])
+    condition = TemplatePresent(template_path, confidence=0.8)
+
+    print("=" * 60)
+    print("Detection Process Benchmark")
+    print("=" * 60)
+    print(f"Screen: {screen.shape[1]}x{screen.shape[0]}, template: {template_path}, {seconds:.0f}s per mode")
+
+    # 1) 스토리 프로세스 안에서 캡처 + 탐지
+    ImageDetector.frame_source = lambda area=None: grab() if area is None else grab()[area[1]:area[3], area[0]:area[2]]
+    in_process = run_load(grab, lambda: condition.evaluate(Frame()), seconds)
+    ImageDetector.frame_source = None
+
+    # 2) 워커 프로세스에서 캡처 + 탐지 (프레임은 공유 메모리, 결과는 큐)
+    process = DetectionProcess(grab=grab if screenshot else None)
+    process.start()
+    ImageDetector.frame_source = process.get_frame
+    try:
+        worker = run_load(process.get_frame, lambda: process.evaluate(condition), seconds)
+        stats = process.get_stats()
+    finally:
+        process.stop()
+
+    print()
+    print(f"{'':22s}{'in-process':>14s}{'worker':>14s}")
+    for key in in_process:
+        print(f"{key:22s}{in_process[key]:14.1f}{worker[key]:14.1f}")
+    print()
+    print(f"Worker: avg round trip {stats['avg_round_trip_ms']:.1f} ms "
+          f"(matching {stats['avg_worker_ms']:.1f} ms), {stats['frames']} frames published")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Asset Bundle Builder
+assets/images 템플릿을 디코딩해 하나의 mmap 번들 파일로 묶기
+
+Usage:
+    python tools/build_asset_bundle.py [images_dir] [output.bundle]
+
+템플릿 PNG를 바꾼 뒤 다시 실행하세요. (바뀐 PNG는 번들 대신 원본을 읽음)
+"""
+
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import cv2
+
+from core.asset_bundle import AssetBundle, build_bundle
+from core.asset_manifest import AssetManifest
+from core.constants import ASSET_BUNDLE_FILE, ASSET_MANIFEST_FILE, IMAGES_DIR
+from core.image_detector import ImageDetector
+
+
+def main():
+    images_dir = sys.argv[1] if len(sys.argv) > 1 else IMAGES_DIR
+    output_path = sys.argv[2] if len(sys.argv) > 2 else ASSET_BUNDLE_FILE
+
+    print("=" * 60)
+    print("Asset Bundle Builder")
+    print("=" * 60)
+
+    paths = ImageDetector.list_templates(images_dir)
+    if not paths:
+        print(f"[ERROR] No templates in {images_dir}")
+        sys.exit(1)
+
+    manifest = AssetManifest.load(ASSET_MANIFEST_FILE) if os.path.exists(ASSET_MANIFEST_FILE) else None
+    included = build_bundle(paths, output_path, manifest)
+
+    # PNG 디코딩과 번들 로드 시간 비교
+    start = time.perf_counter()
+    for path in paths:
+        cv2.imread(path)
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    bundle = AssetBundle(output_path)
+    for path in included:
+        bundle.get(path)
+        bundle.get(path, gray=True)
+    mapped_ms = (time.perf_counter() - start) * 1000
+
+    for path in included:
+        meta = bundle.metadata(path)
+        hue = meta['dominant_hue'] or '-'
+        print(f"  {path}  {meta['size'][0]}x{meta['size'][1]}  hue={hue}  conf={meta['confidence']}")
+    bundle.close()
+
+    print(f"\n[OK] {len(included)} templates, {os.path.getsize(output_path) / 1024:.1f} KB: "
+          f"{os.path.abspath(output_path)}")
+    print(f"PNG decode {decode_ms:.2f} ms -> bundle map {mapped_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Glyph Bank Builder
+라벨이 붙은 숫자 크롭 이미지로 글리프 뱅크(.npz) 생성
+
+Usage:
+    python tools/build_glyph_bank.py <crops_dir> [output.npz]
+
+크롭 파일 이름의 첫 '_' 앞부분이 라벨입니다.
+    예) 1520.png, 1520_2.png, 7_a.png -> 라벨 '1520', '1520', '7'
+"""
+
+import os
+import sys
+
+import cv2
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.constants import GLYPH_BANK_FILE
+from core.digit_recognizer import DigitRecognizer
+from core.ocr_processor import OCRProcessor
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def load_samples(crops_dir):
+    """크롭 디렉토리에서 (이진화 이미지, 라벨, 파일명) 리스트 로드"""
+    samples = []
+    for filename in sorted(os.listdir(crops_dir)):
+        if not filename.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+
+        label = os.path.splitext(filename)[0].split('_')[0]
+        if not label.isdigit():
+            print(f"[SKIP] {filename}: label is not a number")
+            continue
+
+        image = cv2.imread(os.path.join(crops_dir, filename))
+        if image is None:
+            print(f"[SKIP] {filename}: cannot read image")
+            continue
+
+        samples.append((OCRProcessor.preprocess_for_digits(image), label, filename))
+
+    return samples
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    crops_dir = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else GLYPH_BANK_FILE
+
+    print("=" * 60)
+    print("Glyph Bank Builder")
+    print("=" * 60)
+
+    samples = load_samples(crops_dir)
+    recognizer, skipped = DigitRecognizer.build([(binary, label) for binary, label, _ in samples])
+
+    for index in skipped:
+        _, label, filename = samples[index]
+        print(f"[SKIP] {filename}: glyph count does not match label '{label}'")
+
+    if len(recognizer.labels) == 0:
+        print("[ERROR] No glyphs extracted")
+        sys.exit(1)
+
+    recognizer.save(output_path)
+
+    # 학습 데이터 재인식으로 간단 검증
+    correct = 0
+    for binary, label, _ in samples:
+        value, _ = recognizer.recognize_binary(binary)
+        if value is not None and value == int(label):
+            correct += 1
+
+    print()
+    print(f"[OK] Glyphs: {len(recognizer.labels)} from {len(samples) - len(skipped)} crops")
+    for digit in '0123456789':
+        count = int((recognizer.labels == digit).sum())
+        print(f"     '{digit}': {count}")
+    print(f"[OK] Self-check: {correct}/{len(samples)} crops read correctly")
+    print(f"[OK] Saved: {os.path.abspath(output_path)}")
+
+
+if __name__ == "__main__":
+    main()
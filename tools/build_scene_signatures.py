@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Scene Signature Builder
+씬별 기준 캡처로 씬 분류기 시그니처(.npz) 생성
+
+Usage:
+    python tools/build_scene_signatures.py [scenes_dir] [output.npz]
+
+scenes_dir 안의 <씬 이름>.png 파일이 각 씬의 기준 캡처(Detection Area)입니다.
+같은 폴더에 anchors.json이 있으면 씬별 앵커 영역(비율 좌표)을 사용합니다.
+    예) {"character_select": [[0.0, 0.0, 0.3, 0.1]]}
+"""
+
+import json
+import os
+import sys
+import time
+
+import cv2
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.constants import SCENES_DIR, SCENE_SIGNATURES_FILE
+from core.scene_classifier import SceneClassifier
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def main():
+    scenes_dir = sys.argv[1] if len(sys.argv) > 1 else SCENES_DIR
+    output_path = sys.argv[2] if len(sys.argv) > 2 else SCENE_SIGNATURES_FILE
+
+    print("=" * 60)
+    print("Scene Signature Builder")
+    print("=" * 60)
+
+    anchors = {}
+    anchors_path = os.path.join(scenes_dir, 'anchors.json')
+    if os.path.exists(anchors_path):
+        with open(anchors_path, 'r', encoding='utf-8') as f:
+            anchors = json.load(f)
+
+    classifier = SceneClassifier()
+    frames = {}
+    for filename in sorted(os.listdir(scenes_dir)):
+        if not filename.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        scene_id = os.path.splitext(filename)[0]
+        frame = cv2.imread(os.path.join(scenes_dir, filename))
+        if frame is None:
+            print(f"[SKIP] {filename}: cannot read image")
+            continue
+        classifier.add_scene(scene_id, frame, anchors.get(scene_id))
+        frames[scene_id] = frame
+        print(f"[OK] {scene_id} ({len(anchors.get(scene_id) or [])} anchors)")
+
+    if not frames:
+        print("[ERROR] No scene images found")
+        sys.exit(1)
+
+    classifier.save(output_path)
+
+    # 기준 캡처 재분류로 씬 간 구분 여유(margin) 확인
+    print()
+    for scene_id, frame in frames.items():
+        start = time.perf_counter()
+        scores = classifier.scores(frame)
+        elapsed = (time.perf_counter() - start) * 1000
+        ranked = sorted(zip(classifier.scene_ids, scores), key=lambda s: s[1], reverse=True)
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        status = "OK" if ranked[0][0] == scene_id else "WARN"
+        print(f"[{status}] {scene_id}: best={ranked[0][0]} ({ranked[0][1]:.3f}), "
+              f"margin={ranked[0][1] - runner_up:.3f}, {elapsed:.2f} ms")
+
+    print(f"\n[OK] Saved: {os.path.abspath(output_path)}")
+
+
+if __name__ == "__main__":
+    main()
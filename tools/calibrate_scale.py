@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Template Scale Calibration
+현재 해상도/DPI에 맞는 템플릿 배율을 다시 보정해 프로필에 저장
+
+Usage:
+    python tools/calibrate_scale.py [screenshot.png]
+
+게임 화면(템플릿 일부가 보이는 상태)을 띄운 뒤 실행합니다.
+스크린샷 경로를 주면 현재 화면 대신 그 이미지로 보정합니다.
+"""
+
+import os
+import sys
+
+import cv2
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.constants import SCALE_PROFILE_FILE
+from core.image_detector import ImageDetector
+
+
+def main():
+    os.chdir(project_root)
+
+    screen = None
+    if len(sys.argv) > 1:
+        screen = cv2.imread(sys.argv[1])
+        if screen is None:
+            print(f"[ERROR] Cannot read screenshot: {sys.argv[1]}")
+            sys.exit(1)
+
+    print("=" * 60)
+    print("Template Scale Calibration")
+    print("=" * 60)
+
+    templates = ImageDetector.list_templates()
+    print(f"Templates: {len(templates)}")
+
+    scale, calibrated = ImageDetector.configure_scale_profile(
+        SCALE_PROFILE_FILE, auto_calibrate=True, template_paths=templates, screen=screen, force=True
+    )
+
+    if calibrated:
+        print(f"[OK] Scale {scale:.3f} saved to {os.path.abspath(SCALE_PROFILE_FILE)}")
+    else:
+        print("[WARN] No template found on screen, or no scale clearly better than the others - "
+              "scale profile unchanged")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
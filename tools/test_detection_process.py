@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Detection Process Test Script (No Screen Required)
+탐지 워커 프로세스 동작 확인 (합성 화면 사용)
+
+Usage:
+    python tools/test_detection_process.py
+
+확인 항목:
+    1. 워커에서 평가한 AnyOf가 만족한 하위 조건 이름을 돌려줌 (WaitResult.condition)
+    2. 여러 스레드에서 동시에 평가해도 요청 수 지표가 맞음
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.conditions import TemplatePresent
+from core.detection_process import DetectionProcess
+from core.story_base import StoryBase
+
+
+def synthetic_screen():
+    """고정 시드 잡음 화면 (워커 프로세스에도 전달되므로 모듈 수준 함수)"""
+    return np.random.default_rng(0).integers(0, 256, (360, 640, 3), dtype=np.uint8)
+
+
+def check(ok, message):
+    print(f"[{'OK' if ok else 'FAIL'}] {message}")
+    return ok
+
+
+def main():
+    print("=" * 60)
+    print("Detection Process Test")
+    print("=" * 60)
+
+    directory = tempfile.mkdtemp()
+    present = os.path.join(directory, "present.png")
+    absent = os.path.join(directory, "absent.png")
+    cv2.imwrite(present, synthetic_screen()[100:140, 200:280])
+    cv2.imwrite(absent, np.random.default_rng(1).integers(0, 256, (40, 80, 3), dtype=np.uint8))
+
+    process = DetectionProcess(grab=synthetic_screen)
+    process.start()
+    ok = True
+    try:
+        # 1. 워커에서 평가한 AnyOf의 만족한 하위 조건
+        condition = TemplatePresent(absent) | TemplatePresent(present)
+        value, fired = process.evaluate_fired(condition)
+        ok &= check(value == (240, 120) and fired == "present.png",
+                    f"Remote AnyOf fired: {fired} at {value}")
+
+        story = StoryBase("detection process test")
+        story.log_enabled = False
+        story.detection_process = process
+        result = story.wait_until(condition, timeout=2)
+        ok &= check(result.condition == "present.png", f"wait_until condition: {result.condition}")
+
+        # 2. 동시 평가 지표
+        before = process.get_stats()['requests']
+        threads, calls = 4, 25
+        workers = [
+            threading.Thread(target=lambda: [process.evaluate(TemplatePresent(present)) for _ in range(calls)])
+            for _ in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        stats = process.get_stats()
+        ok &= check(stats['requests'] - before == threads * calls,
+                    f"Concurrent requests counted: {stats['requests'] - before} / {threads * calls} "
+                    f"(avg round trip {stats['avg_round_trip_ms']:.1f} ms)")
+    finally:
+        process.stop()
+
+    print("=" * 60)
+    print("All detection process tests passed!" if ok else "Some detection process tests failed")
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
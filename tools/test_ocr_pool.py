@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+OCR Worker Pool Test Script (No Tesseract Required)
+가짜 엔진으로 OCR 워커 풀의 타임아웃/취소/종료 동작 확인
+
+Usage:
+    python tools/test_ocr_pool.py
+
+확인 항목:
+    1. 시간을 넘긴 요청은 TimeoutError, 멈춘 워커는 교체되어 다음 요청은 바로 처리
+    2. 대기 중에 취소한 요청은 엔진에 전달되지 않음
+    3. close()가 멈춘 (은퇴한) 워커를 기다리지 않음
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from core.ocr_pool import OCREngine, OCRWorkerPool
+
+
+class FakeEngine(OCREngine):
+    """
+    가짜 OCR 엔진 - config가 'sleep=<초>'면 그만큼 멈춘 뒤 응답 (timeout을 지키지 않는 엔진 흉내)
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.closed = threading.Event()
+
+    def image_to_string(self, image, language, config, timeout=None):
+        self.calls.append(config)
+        if config.startswith('sleep='):
+            time.sleep(float(config.split('=', 1)[1]))
+        return config
+
+    def close(self):
+        self.closed.set()
+
+
+def check(ok, message):
+    print(f"[{'OK' if ok else 'FAIL'}] {message}")
+    return ok
+
+
+def main():
+    print("=" * 60)
+    print("OCR Worker Pool Test")
+    print("=" * 60)
+
+    engines = []
+
+    def factory():
+        engine = FakeEngine()
+        engines.append(engine)
+        return engine
+
+    image = np.zeros((8, 8), dtype=np.uint8)
+    pool = OCRWorkerPool(factory, workers=1, timeout=0.3)
+    ok = True
+
+    # 1. 타임아웃 후 다음 요청
+    started = time.perf_counter()
+    try:
+        pool.image_to_string(image, config='sleep=2')
+        ok &= check(False, "Hung request should time out")
+    except FutureTimeoutError:
+        ok &= check(time.perf_counter() - started < 0.5, f"Hung request timed out after {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    try:
+        result = pool.image_to_string(image, config='next')
+        ok &= check(result == 'next', f"Next request answered in {time.perf_counter() - started:.2f}s "
+                                      f"(retired workers: {pool.retired_count})")
+    except FutureTimeoutError:
+        ok &= check(False, "Next request waited behind the hung call")
+
+    # 2. 대기 중 취소
+    busy = pool.submit('image_to_string', image, 'eng', 'sleep=0.2')
+    cancelled = pool.submit('image_to_string', image, 'eng', 'cancelled')
+    ok &= check(cancelled.cancel(), "Queued request cancelled")
+    busy.result(timeout=1)
+    pool.image_to_string(image, config='after')
+    ok &= check(all('cancelled' not in engine.calls for engine in engines), "Cancelled request never reached an engine")
+
+    # 3. 종료
+    started = time.perf_counter()
+    pool.close()
+    elapsed = time.perf_counter() - started
+    ok &= check(elapsed < 0.2, f"close() returned in {elapsed:.2f}s")
+    ok &= check(engines[-1].closed.is_set(), "Active engine closed")
+    time.sleep(2)
+    ok &= check(engines[0].closed.is_set(), "Retired engine closed after its call returned")
+
+    print("=" * 60)
+    print("All OCR pool tests passed!" if ok else "Some OCR pool tests failed")
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())